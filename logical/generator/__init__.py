@@ -0,0 +1,6 @@
+from .topology import Topology, load_address_map, check_address_map
+from .interconnect import gen_module, module_lines
+from .wrapper import generate_wrapper, wrapper_lines
+from .testbench import generate_tb, tb_lines
+from .wrapper_testbench import generate_tb as generate_wrapper_tb, tb_lines as wrapper_tb_lines
+from .include import include_lines, wrapper_include_lines
@@ -0,0 +1,68 @@
+import re
+import sys
+import time
+import argparse
+import tracemalloc
+
+from .cli import TARGETS, build_parser, outputs, write_lines
+from .topology import Topology
+
+
+class Sink:
+    # stands in for the output file, counting what would be written
+    def __init__(self):
+        self.size = 0
+
+    def write(self, text):
+        self.size += len(text)
+
+
+def measure(emit, repeat):
+    # best wall time over repeat runs of emitting and writing, then one traced
+    # run for the peak memory, tracing slows the emitter down so it is kept
+    # out of the timed runs
+    best = None
+    for _ in range(repeat):
+        sink = Sink()
+        start = time.perf_counter()
+        write_lines(sink.write, emit())
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    write_lines(Sink().write, emit())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, sink.size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.generator.bench",
+        usage="%(prog)s [mXsY ...] [--repeat N] [generator options]",
+        description="time the emitters and trace their peak memory while streaming, nothing is written",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per target (default: 3)")
+    args, rest = parser.parse_known_args(argv)
+
+    # sizes may sit anywhere between the generator options
+    configs = [arg for arg in rest if re.fullmatch(r"m\d+s\d+", arg)] or ["m64s64", "m128s128"]
+    options = [arg for arg in rest if not re.fullmatch(r"m\d+s\d+", arg)]
+
+    print(f"{'config':<10}{'target':<16}{'size MB':>10}{'time s':>10}{'peak MB':>10}")
+    for config in configs:
+        gen_args = build_parser().parse_args([config] + options)
+        topology = Topology.parse(config, gen_args.address_map)
+        emitters = outputs(topology, gen_args)
+        targets = [target for target in gen_args.targets.split(",") if target in TARGETS]
+        if gen_args.packed:
+            targets = [target for target in targets if not target.startswith("wrapper")]
+        for target in targets:
+            _, emitter, target_options = emitters[target]
+            best, peak, size = measure(lambda: emitter(topology, **target_options), args.repeat)
+            print(f"{config:<10}{target:<16}{size / 1e6:>10.2f}{best:>10.3f}{peak / 1e6:>10.1f}")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
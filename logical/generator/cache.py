@@ -0,0 +1,96 @@
+import os
+import json
+import hashlib
+
+
+MANIFEST = "logical/rtl/axi4_lite_interconnect/manifest.json"
+
+
+def source_hash():
+    # the generator version: every module of this package, so any change to
+    # an emitter invalidates the outputs it produced
+    digest = hashlib.sha256()
+    package = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(package)):
+        if name.endswith(".py"):
+            digest.update(name.encode())
+            with open(os.path.join(package, name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class Manifest:
+    # key, content hash, size and mtime of every output written, so an output
+    # whose key and file are both unchanged is not regenerated, and one whose
+    # content comes out the same is not touched
+
+    def __init__(self, path=MANIFEST):
+        self.path = path
+        self.source = source_hash()
+        self.entries = self.load()
+        self.updated = {}
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def key(self, topology, emitter, options):
+        # everything the emitter's output depends on
+        content = [
+            self.source,
+            f"{emitter.__module__}.{emitter.__name__}",
+            topology.m,
+            topology.s,
+            topology.address_map,
+            options,
+        ]
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+    def entry(self, filename):
+        # the record of a file still as it was written, an edited or deleted
+        # output has none
+        entry = self.entries.get(filename)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+        return entry
+
+    def fresh(self, filename, key):
+        entry = self.entry(filename)
+        return entry is not None and entry["key"] == key
+
+    def digest(self, filename):
+        entry = self.entry(filename)
+        return entry.get("sha256") if entry else None
+
+    def record(self, filename, key, digest):
+        stat = os.stat(filename)
+        self.updated[filename] = {
+            "key": key,
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def save(self):
+        # merged into the manifest as it is now and replaced in one step, so
+        # parallel generators never leave a torn file, at worst one loses an
+        # entry and regenerates that output next time
+        if not self.updated:
+            return
+        entries = self.load()
+        entries.update(self.updated)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        partial = f"{self.path}.{os.getpid()}.tmp"
+        with open(partial, "w") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(partial, self.path)
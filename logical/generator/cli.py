@@ -0,0 +1,361 @@
+import sys
+import os
+import hashlib
+import argparse
+
+from .cache import Manifest
+from .topology import ARBITERS, MUXES, REG_SLICES, SLICE_PORTS, Topology
+from .interconnect import module_lines, shared_fsm
+from .wrapper import wrapper_lines
+from .testbench import tb_lines
+from .wrapper_testbench import tb_lines as wrapper_tb_lines
+from .include import include_lines, wrapper_include_lines
+
+
+TARGETS = ["rtl", "wrapper", "tb", "wrapper-tb", "include", "wrapper-include"]
+DUMPS = ["all", "ports", "none"]
+DUMP_FORMATS = ["vcd", "fst"]
+
+
+def parse_weights(arg, m):
+    weights = [int(w) for w in arg.split(",")]
+    if len(weights) != m or min(weights) < 1:
+        raise ValueError(f"Weights must be {m} positive integers, example: 4,2,1,1")
+    return weights
+
+
+def parse_dump_ports(arg, m, s):
+    ports = arg.split(",")
+    for port in ports:
+        kind, index = port[:1], port[1:]
+        if kind not in ("m", "s") or not index.isdigit() or int(index) >= (m if kind == "m" else s):
+            raise ValueError(f"Dump ports must be masters below m{m} and slaves below s{s}, example: m0,s1")
+    return list(dict.fromkeys(ports))
+
+
+def outputs(topology, args):
+    # output file, emitter and its options per target, all built from the same
+    # topology: emitter(topology, **options) yields the file as newline
+    # separated blocks, and the options are what the generation cache hashes
+    name = topology.name
+    weights = parse_weights(args.weights, topology.m) if args.weights else None
+    dump_ports = parse_dump_ports(args.dump_ports, topology.m, topology.s) if args.dump_ports else None
+    # choosing ports narrows the dump to port signals
+    dump = "ports" if dump_ports and args.dump == "all" else args.dump
+    if dump == "none" and (dump_ports or args.dump_window or args.dump_format != "vcd"):
+        raise ValueError("--dump-ports, --dump-window and --dump-format need a dump, not --dump none")
+    rtl_file = f"logical/rtl/axi4_lite_interconnect/axi4_lite_interconnect_{name}.v"
+    rtl = dict(
+        crossbar=args.crossbar,
+        split_rw=args.split_rw,
+        arbiter=args.arbiter,
+        weights=weights,
+        outstanding=args.outstanding,
+        mux=args.mux,
+        reg_slice=args.reg_slice,
+        slice_ports=args.slice_ports,
+        packed=args.packed,
+        default_slave=args.default_slave,
+        back_to_back=args.back_to_back,
+    )
+    concurrent = [flag for flag, given in (("--arbiter-stats", args.arbiter_stats), ("--traffic", args.traffic)) if given]
+    if topology.m > 1 and concurrent and shared_fsm(address_map=topology.address_map, **rtl):
+        raise ValueError(
+            f"{' and '.join(concurrent)} need{'s' if len(concurrent) == 1 else ''} a fabric option such as --crossbar, "
+            "the default state machine cannot serve masters requesting at once "
+            "(--crossbar --arbiter fixed measures fixed priority)"
+        )
+    tb = dict(
+        arbiter_stats=args.arbiter_stats,
+        reg_slice=args.reg_slice,
+        slice_ports=args.slice_ports,
+        packed=args.packed,
+        decerr_test=args.decerr_test,
+        throughput=args.throughput,
+        plusargs=args.plusargs,
+        traffic=args.traffic,
+        monitors=args.monitors,
+        txlog=args.txlog,
+        dump=dump,
+        dump_ports=dump_ports,
+        dump_window=args.dump_window,
+        dump_format=args.dump_format,
+    )
+    return {
+        "rtl": (rtl_file, module_lines, rtl),
+        "wrapper": (
+            f"logical/rtl/wrapper/interconnect/wrapper_axi4_lite_interconnect_{name}.v",
+            wrapper_lines,
+            {},
+        ),
+        "tb": (
+            f"logical/tb/tb_axi4_lite_interconnect/tb_axi4_lite_interconnect_{name}.v",
+            tb_lines,
+            tb,
+        ),
+        "wrapper-tb": (
+            f"logical/tb/tb_wrapper/interconnect/tb_wrapper_axi4_lite_interconnect_{name}.v",
+            wrapper_tb_lines,
+            {},
+        ),
+        # only the modules each testbench reaches with these options
+        "include": (
+            f"logical/rtl/axi4_lite_interconnect/include_{name}.vh",
+            include_lines,
+            dict(rtl_file=rtl_file, rtl=rtl),
+        ),
+        "wrapper-include": (
+            f"logical/rtl/wrapper/interconnect/include_wrapper_{name}.vh",
+            wrapper_include_lines,
+            dict(rtl_file=rtl_file, rtl=rtl),
+        ),
+    }
+
+
+def write_lines(write, blocks, batch=1 << 16):
+    # the same text as write("\n".join(blocks)), joined and written about
+    # 64 KiB at a time so memory stays flat however large the file is
+    pending, size, sep = [], 0, ""
+    for block in blocks:
+        pending.append(block)
+        size += len(block)
+        if size >= batch:
+            write(sep + "\n".join(pending))
+            pending, size, sep = [], 0, "\n"
+    if pending:
+        write(sep + "\n".join(pending))
+
+
+def write_file(filename, blocks, digest=None):
+    # streamed into a temporary file of this process and renamed once
+    # complete, an emitter error part way leaves any previous output in place
+    # and generators running in parallel never share a partial file. The
+    # content hash is returned, with whether the file was replaced: content
+    # equal to digest, the hash of the current file, leaves that file and its
+    # mtime alone
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    partial = f"{filename}.{os.getpid()}.tmp"
+    content = hashlib.sha256()
+    try:
+        with open(partial, "w") as f:
+
+            def write(text):
+                content.update(text.encode())
+                f.write(text)
+
+            write_lines(write, blocks)
+        if content.hexdigest() == digest and os.path.exists(filename):
+            return digest, False
+        os.replace(partial, filename)
+        return content.hexdigest(), True
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.generator",
+        usage="%(prog)s mXsY [options] (e.g., m2s2 --crossbar --arbiter-stats)",
+    )
+    parser.add_argument("config", help="interconnect size, 'm{n}s{n}'")
+    parser.add_argument(
+        "--targets",
+        default=",".join(TARGETS),
+        help=f"comma-separated outputs to generate (default: {','.join(TARGETS)})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate every target, even outputs the manifest records as current",
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="write the targets to standard output, in --targets order, instead of their files",
+    )
+
+    # interconnect
+    parser.add_argument(
+        "--crossbar",
+        action="store_true",
+        help="per-slave arbiters so disjoint master/slave pairs transfer concurrently",
+    )
+    parser.add_argument(
+        "--split-rw",
+        action="store_true",
+        help="independent read and write arbitration so one of each can be in flight",
+    )
+    parser.add_argument(
+        "--arbiter",
+        choices=ARBITERS,
+        default="fixed",
+        help="master arbitration policy (default: fixed priority)",
+    )
+    parser.add_argument(
+        "--weights",
+        help="per-master weights for --arbiter weighted, master 0 first (e.g., 4,2,1,1)",
+    )
+    parser.add_argument(
+        "--outstanding",
+        type=int,
+        default=1,
+        help="outstanding transactions per master and slave, more than 1 implies --split-rw",
+    )
+    parser.add_argument(
+        "--mux",
+        choices=MUXES,
+        default="priority",
+        help="output muxes: priority ternary chains or one-hot and-or (default: priority)",
+    )
+    parser.add_argument(
+        "--packed",
+        action="store_true",
+        help="packed-array ports (m_AWVALID[M-1:0], ...) built with generate loops",
+    )
+    parser.add_argument(
+        "--address-map",
+        help="JSON or YAML slave address map, checked for overlaps and gaps",
+    )
+    parser.add_argument(
+        "--back-to-back",
+        action="store_true",
+        help="arbitrate in the cycle a transaction completes, without an idle cycle between grants",
+    )
+    parser.add_argument(
+        "--default-slave",
+        action="store_true",
+        help="answer unmapped addresses with DECERR instead of stalling the bus",
+    )
+    parser.add_argument(
+        "--reg-slice",
+        choices=REG_SLICES,
+        default="none",
+        help="register slice on every channel around the fabric: forward (valid/data), backward (ready) or full",
+    )
+    parser.add_argument(
+        "--slice-ports",
+        choices=SLICE_PORTS,
+        default="both",
+        help="boundaries that get register slices (default: both)",
+    )
+
+    # testbench
+    parser.add_argument(
+        "--arbiter-stats",
+        action="store_true",
+        help="drive every master and report per-master grants and wait cycles",
+    )
+    parser.add_argument(
+        "--throughput",
+        action="store_true",
+        help="report sustained transactions per cycle over all masters (with --arbiter-stats to load the bus)",
+    )
+    parser.add_argument(
+        "--decerr-test",
+        action="store_true",
+        help="access an unmapped address, check for DECERR and that the bus recovers (needs --default-slave)",
+    )
+    parser.add_argument(
+        "--plusargs",
+        action="store_true",
+        help="read op count, seed, write ratio, address window and dumping from vvp plusargs "
+        "(+OPS=, +SEED=, +WRITE_PCT=, +ADDRS=, +ADDR_WORDS=, +DUMPFILE=, +NODUMP), one compile runs any scenario",
+    )
+    parser.add_argument(
+        "--traffic",
+        action="store_true",
+        help="drive every master from its own process, each with a request rate and hot slave share "
+        "(+RATE=, +HOT_PCT=, +M<n>_OPS=, +M<n>_RATE=, +M<n>_HOT=, +M<n>_HOT_PCT=), implies --plusargs, "
+        "needs a fabric option such as --crossbar with more than one master",
+    )
+    parser.add_argument(
+        "--monitors",
+        action="store_true",
+        help="time the handshakes on every master and slave port and report p50/p99/max latency, "
+        "transactions per cycle and utilization per port",
+    )
+    parser.add_argument(
+        "--txlog",
+        action="store_true",
+        help="log every completed transaction to a binary .txlog (+TXLOG= with --plusargs) "
+        "for python -m logical.simulation.scoreboard",
+    )
+    parser.add_argument(
+        "--dump",
+        choices=DUMPS,
+        default="all",
+        help="what the testbench dumps: every net (all), the clock, reset and port signals of the testbench (ports) "
+        "or nothing, for throughput runs (default: all)",
+    )
+    parser.add_argument(
+        "--dump-ports",
+        help="dump only these masters and slaves, e.g. m0,s1, implies --dump ports",
+    )
+    parser.add_argument(
+        "--dump-window",
+        action="store_true",
+        help="dump only from cycle +DUMP_START=, from transaction +DUMP_FROM_OP= or once a request waits "
+        "+DUMP_ON_STALL= cycles for READY, for +DUMP_CYCLES= cycles, implies --plusargs",
+    )
+    parser.add_argument(
+        "--dump-format",
+        choices=DUMP_FORMATS,
+        default="vcd",
+        help="dump file format, fst needs vvp -fst, which make sim and the regression runner add (default: vcd)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # keep standard output for the verilog when it is piped
+    log = sys.stderr if args.stdout else sys.stdout
+
+    try:
+        targets = args.targets.split(",")
+        for target in targets:
+            if target not in TARGETS:
+                raise ValueError(f"Unknown target '{target}', choose from {', '.join(TARGETS)}")
+        if args.outstanding < 1:
+            raise ValueError("Outstanding depth must be at least 1")
+        topology = Topology.parse(args.config, args.address_map)
+        for name_a, name_b, low, high in topology.gaps():
+            print(f"Warning: 0x{low:08x}-0x{high:08x} between '{name_a}' and '{name_b}' is unmapped", file=log)
+
+        # the wrappers instantiate the scalar ports
+        if args.packed:
+            targets = [target for target in targets if not target.startswith("wrapper")]
+
+        emitters = outputs(topology, args)
+        if args.stdout:
+            for target in targets:
+                _, emitter, options = emitters[target]
+                write_lines(sys.stdout.write, emitter(topology, **options))
+                sys.stdout.write("\n")
+            return
+
+        # outputs are only generated when their key changed and only rewritten
+        # when their content did, an untouched file keeps its mtime and is
+        # not recompiled
+        manifest = Manifest()
+        try:
+            for target in targets:
+                filename, emitter, options = emitters[target]
+                key = manifest.key(topology, emitter, options)
+                if not args.force and manifest.fresh(filename, key):
+                    print(f"Unchanged: {filename}")
+                    continue
+                digest, replaced = write_file(filename, emitter(topology, **options), manifest.digest(filename))
+                manifest.record(filename, key, digest)
+                print(f"{'Generated' if replaced else 'Unchanged'}: {filename}")
+        finally:
+            manifest.save()
+    except BrokenPipeError:
+        # the reader of --stdout went away early, e.g. piped into head
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}", file=log)
+        sys.exit(1)
+
@@ -0,0 +1,52 @@
+MASTER = "logical/rtl/axi4_lite_master.v"
+SLAVE = "logical/rtl/axi4_lite_slave.v"
+ARBITER = "logical/rtl/axi4_lite_arbiter.v"
+FIFO = "logical/rtl/axi4_lite_fifo.v"
+REG_SLICE = "logical/rtl/axi4_lite_reg_slice.v"
+ONEHOT_MUX = "logical/rtl/axi4_lite_onehot_mux.v"
+DEFAULT_SLAVE = "logical/rtl/axi4_lite_default_slave.v"
+
+# the wrapper testbench's dummy handlers and the wrappers around them
+WRAPPER = [
+    "logical/tb/tb_wrapper/dummy/handler/master.v",
+    "logical/tb/tb_wrapper/dummy/handler/slave.v",
+    "logical/tb/tb_wrapper/dummy/wrapper/dut_axi4_lite_master_wrapper.v",
+    "logical/tb/tb_wrapper/dummy/wrapper/dut_axi4_lite_slave_wrapper.v",
+]
+
+
+def library(arbiter="fixed", outstanding=1, reg_slice="none", mux="priority", packed=False, default_slave=False, **_):
+    # the hand-written modules the interconnect and its testbench instantiate
+    # with these options, in compile order. Read off the options rather than
+    # the generated text, so the include files cost nothing to generate. The
+    # packed module always arbitrates and muxes with the library modules
+    files = [MASTER, SLAVE]
+    if arbiter != "fixed" or packed:
+        files.append(ARBITER)
+    if outstanding > 1:
+        files.append(FIFO)
+    if reg_slice != "none":
+        files.append(REG_SLICE)
+    if mux == "onehot" or packed:
+        files.append(ONEHOT_MUX)
+    if default_slave:
+        files.append(DEFAULT_SLAVE)
+    return files
+
+
+def includes(files):
+    for filename in files:
+        yield f'`include "{filename}"'
+    # ends the last line
+    yield ""
+
+
+def include_lines(topology, rtl_file, rtl):
+    # the include file of the interconnect testbench: only the modules the
+    # options instantiate, then the interconnect
+    yield from includes(library(**rtl) + [rtl_file])
+
+
+def wrapper_include_lines(topology, rtl_file, rtl):
+    # the include file of the wrapper testbench
+    yield from includes(library(**rtl) + WRAPPER + [rtl_file])
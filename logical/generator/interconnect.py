@@ -0,0 +1,1279 @@
+from .topology import ARBITERS, CHANNELS, REG_SLICES, hex32, region_mask
+
+
+# legacy fsm outputs: master side signals and defaults, then the slave side
+# blocks emitted once per slave and master, each ending in a blank line
+LEGACY_MASTER_SIGNALS = (
+    ("write", (("AWREADY", "1'b0"), ("WREADY", "1'b0"), ("BRESP", "2'b00"), ("BVALID", "1'b0"))),
+    ("read", (("ARREADY", "1'b0"), ("RVALID", "1'b0"), ("RDATA", "32'h0"), ("RRESP", "2'b00"))),
+)
+
+LEGACY_SLAVE_WRITE = """\
+        assign s{slave}_AWADDR   = ((sel_s_reg == {slave}) && m{master}_AWVALID && (sel_m_reg == {master})) ? m{master}_AWADDR - LOW_ADDR{slave}   : 32'h0;
+        assign s{slave}_AWVALID  = ((sel_s_reg == {slave}) && m{master}_AWVALID && (sel_m_reg == {master})) ? m{master}_AWVALID              : 1'b0;
+        assign s{slave}_WVALID   = ((sel_s_reg == {slave}) && m{master}_WVALID  && (sel_m_reg == {master})) ? m{master}_WVALID               : 1'b0;
+        assign s{slave}_WDATA    = ((sel_s_reg == {slave}) && m{master}_WDATA   && (sel_m_reg == {master})) ? m{master}_WDATA                : 32'h0;
+        assign s{slave}_WSTRB    = ((sel_s_reg == {slave}) && m{master}_WSTRB   && (sel_m_reg == {master})) ? m{master}_WSTRB                : 4'h0;
+        assign s{slave}_BREADY   = ((sel_s_reg == {slave}) && m{master}_BREADY  && (sel_m_reg == {master})) ? m{master}_BREADY               : 1'b0;
+"""
+
+LEGACY_SLAVE_READ = """\
+        assign s{slave}_ARADDR   = ((sel_s_reg == {slave}) && m{master}_ARVALID && (sel_m_reg == {master})) ? m{master}_ARADDR - LOW_ADDR{slave}   : 32'h0;
+        assign s{slave}_ARVALID  = ((sel_s_reg == {slave}) && m{master}_ARVALID && (sel_m_reg == {master})) ? m{master}_ARVALID              : 1'b0;
+        assign s{slave}_RREADY   = ((sel_s_reg == {slave}) && m{master}_RREADY  && (sel_m_reg == {master})) ? m{master}_RREADY               : 1'b0;
+"""
+
+
+def bind(template, inner, **fields):
+    # split a block template on its inner field once, with the other fields
+    # filled in, so each inner value costs a single join: value.join(parts)
+    parts = template.split("{" + inner + "}")
+    for field, value in fields.items():
+        parts = [part.replace("{" + field + "}", str(value)) for part in parts]
+    return parts
+
+
+def gen_ports(m, s, suffix="", address_map=None):
+    code = []
+
+    # module header
+    code.append(f"module axi4_lite_interconnect_m{m}s{s}{suffix} #(")
+
+    # parameters
+    code.append(f"    /* parameters */")
+    code.append("    parameter ADDR_WIDTH    = 32,")
+    code.append("    parameter DATA_WIDTH    = 32,")
+    code.append("")
+
+    # generate address parameters for each slave
+    code.append(f"    /* address parameters */")
+    for i in range(s):
+        if address_map:
+            _, low, high = address_map[i]
+            code.append(f"    parameter LOW_ADDR{i}     = {hex32(low)},")
+            code.append(f"    parameter HIGH_ADDR{i}    = {hex32(high)}{',' if i != s-1 else ''}")
+            continue
+        code.append(f"    parameter LOW_ADDR{i}     = 32'h{i:04x}_0000,")
+        code.append(
+            f"    parameter HIGH_ADDR{i}    = 32'h{i:04x}_FFFF{',' if i != s-1 else ''}"
+        )
+
+    code.append(") (")
+    code.append("    input                               iCLK, iRST,")
+    code.append("")
+
+    # master interfaces
+    for master in range(m):
+        code.append(f"    /* master interface {master} */")
+        code.append("        /* write address channel */    ")
+        code.append(f"        input                           m{master}_AWVALID,")
+        code.append(f"        input   [ADDR_WIDTH-1:0]        m{master}_AWADDR,")
+        code.append(f"        output                          m{master}_AWREADY,")
+        code.append("")
+        code.append("        /* write data channel */    ")
+        code.append(f"        input                           m{master}_WVALID,")
+        code.append(f"        input   [(DATA_WIDTH/8)-1:0]    m{master}_WSTRB,")
+        code.append(f"        input   [DATA_WIDTH-1:0]        m{master}_WDATA,")
+        code.append(f"        output                          m{master}_WREADY,")
+        code.append("")
+        code.append("        /* write response channel */    ")
+        code.append(f"        input                           m{master}_BREADY,")
+        code.append(f"        output                          m{master}_BVALID,")
+        code.append(f"        output  [1:0]                   m{master}_BRESP,")
+        code.append("")
+        code.append("        /* read address channel */    ")
+        code.append(f"        input                           m{master}_ARVALID,")
+        code.append(f"        input   [DATA_WIDTH-1:0]        m{master}_ARADDR,")
+        code.append(f"        output                          m{master}_ARREADY,")
+        code.append("")
+        code.append("        /* read data channel */    ")
+        code.append(f"        input                           m{master}_RREADY,")
+        code.append(f"        output                          m{master}_RVALID,")
+        code.append(f"        output  [1:0]                   m{master}_RRESP,")
+        code.append(
+            f"        output  [DATA_WIDTH-1:0]        m{master}_RDATA{',' if master != m-1 or s > 0 else ''}"
+        )
+        code.append("")
+
+    # slave interfaces
+    for slave in range(s):
+        code.append(f"    /* slave interface {slave} */")
+        code.append("        /* write address channel */")
+        code.append(f"        input                           s{slave}_AWREADY,")
+        code.append(f"        output                          s{slave}_AWVALID,")
+        code.append(f"        output  [ADDR_WIDTH-1:0]        s{slave}_AWADDR,")
+        code.append("")
+        code.append("        /* write data channel */")
+        code.append(f"        input                           s{slave}_WREADY,")
+        code.append(f"        output                          s{slave}_WVALID,")
+        code.append(f"        output  [(DATA_WIDTH/8)-1:0]    s{slave}_WSTRB,")
+        code.append(f"        output  [DATA_WIDTH-1:0]        s{slave}_WDATA,")
+        code.append("")
+        code.append("        /* write response channel */")
+        code.append(f"        input                           s{slave}_BVALID,")
+        code.append(f"        input   [1:0]                   s{slave}_BRESP,")
+        code.append(f"        output                          s{slave}_BREADY,")
+        code.append("")
+        code.append("        /* read address channel */")
+        code.append(f"        input                           s{slave}_ARREADY,")
+        code.append(f"        output                          s{slave}_ARVALID,")
+        code.append(f"        output  [ADDR_WIDTH-1:0]        s{slave}_ARADDR,")
+        code.append("")
+        code.append("        /* read data channel */")
+        code.append(f"        input                           s{slave}_RVALID,")
+        code.append(f"        input   [1:0]                   s{slave}_RRESP,")
+        code.append(f"        input   [DATA_WIDTH-1:0]        s{slave}_RDATA,")
+        code.append(
+            f"        output                          s{slave}_RREADY{',' if slave != s - 1 else ''}"
+            + ("" if slave == s - 1 else "\n")
+        )
+
+    code.append(");")
+    code.append("")
+
+    return code
+
+
+def shared_fsm(
+    crossbar=False,
+    split_rw=False,
+    arbiter="fixed",
+    outstanding=1,
+    mux="priority",
+    reg_slice="none",
+    packed=False,
+    address_map=None,
+    default_slave=False,
+    back_to_back=False,
+    **_,
+):
+    # whether these options build the original state machine. It drives the
+    # slave ports once per master, so it only completes the transactions of
+    # masters that never request at the same time
+    return not (
+        crossbar
+        or split_rw
+        or arbiter != "fixed"
+        or outstanding > 1
+        or mux != "priority"
+        or reg_slice != "none"
+        or packed
+        or address_map
+        or default_slave
+        or back_to_back
+    )
+
+
+def module_lines(
+    topology,
+    crossbar=False,
+    split_rw=False,
+    arbiter="fixed",
+    weights=None,
+    outstanding=1,
+    mux="priority",
+    reg_slice="none",
+    slice_ports="both",
+    packed=False,
+    default_slave=False,
+    back_to_back=False,
+    suffix="",
+    fabric=False,
+):
+    # yields the module as blocks of one or more lines, to be joined with
+    # newlines by gen_module or written out as they come, so the quadratic
+    # fabric never has to be held in memory. The port list, slices and packed
+    # module grow linearly and are built as lists. fabric builds the fabric
+    # even for options the original state machine covers
+    m, s, address_map = topology.m, topology.s, topology.address_map
+
+    if packed:
+        if outstanding > 1 or reg_slice != "none" or default_slave:
+            raise ValueError("Packed ports do not support --outstanding, --reg-slice or --default-slave")
+        yield from gen_packed(
+            m,
+            s,
+            crossbar=crossbar,
+            arbiter=arbiter,
+            weights=weights,
+            address_map=address_map,
+            back_to_back=back_to_back,
+        )
+        return
+
+    # register slices wrap the fabric, generated as a separate core module.
+    # Always the fabric: the original state machine drives the slave ports
+    # once per master and with two or more never completes a transaction
+    # behind the slices
+    if reg_slice != "none":
+        yield from gen_ports(m, s, address_map=address_map)
+        yield from gen_slices(m, s, reg_slice, slice_ports)
+        yield "endmodule"
+        yield ""
+        yield from module_lines(
+            topology,
+            crossbar=crossbar,
+            split_rw=split_rw,
+            arbiter=arbiter,
+            weights=weights,
+            outstanding=outstanding,
+            mux=mux,
+            default_slave=default_slave,
+            back_to_back=back_to_back,
+            suffix="_core",
+            fabric=True,
+        )
+        return
+
+    yield from gen_ports(m, s, suffix, address_map)
+
+    if fabric or not shared_fsm(
+        crossbar=crossbar,
+        split_rw=split_rw,
+        arbiter=arbiter,
+        outstanding=outstanding,
+        mux=mux,
+        address_map=address_map,
+        default_slave=default_slave,
+        back_to_back=back_to_back,
+    ):
+        yield from gen_fabric(
+            m,
+            s,
+            crossbar=crossbar,
+            split_rw=split_rw or outstanding > 1,
+            arbiter=arbiter,
+            weights=weights,
+            outstanding=outstanding,
+            mux=mux,
+            address_map=address_map,
+            default_slave=default_slave,
+            back_to_back=back_to_back,
+        )
+        yield "endmodule"
+        return
+
+    # finite state machine
+    yield "    /* finite state machine */"
+    yield "    localparam IDLE     = 3'b000;"
+    yield "    localparam WRITE    = 3'b001;"
+    yield "    localparam READ     = 3'b010;"
+    yield ""
+    yield "    reg         read_start, write_start;"
+    yield f"    reg [{max(1, (m-1).bit_length())}:0]   sel_m;"
+    yield f"    reg [{max(1, (s-1).bit_length())}:0]   sel_s;"
+    yield f"    reg [{max(1, (s-1).bit_length())}:0]   sel_s_reg;"
+    yield f"    reg [{max(1, (m-1).bit_length())}:0]   sel_m_reg;"
+    yield "    reg [2:0]   state, next_state;"
+    yield ""
+    yield "    initial begin"
+    yield f"        sel_s       = {s};"
+    yield f"        sel_m       = {m};"
+    yield "    end"
+    yield ""
+    yield "    always @(posedge iCLK or negedge iRST) begin"
+    yield "        if (!iRST) begin"
+    yield "            state           <= IDLE;"
+    yield f"            sel_s_reg       <= {s};"
+    yield f"            sel_m_reg       <= {m};"
+    yield "        end else begin"
+    yield "            state           <= next_state;"
+    yield "            if (state == IDLE) begin"
+    yield "                sel_s_reg   <= sel_s;"
+    yield "                sel_m_reg   <= sel_m;"
+    yield "            end"
+    yield "        end"
+    yield "    end"
+    yield ""
+    yield "    always @(*) begin"
+    yield "        case (state)"
+    yield (
+        "            IDLE: next_state = (write_start) ? WRITE : ((read_start) ? READ : IDLE);"
+    )
+    yield "            WRITE: begin"
+    yield "                case(sel_s)"
+    for slave in range(s):
+        yield (
+            "\n".join(
+                f"                    {slave}: next_state = (s{slave}_BVALID && m{master}_BREADY) ? IDLE : WRITE;"
+                for master in range(m)
+            )
+        )
+    yield "                    default: next_state = WRITE;"
+    yield "                endcase"
+    yield "            end"
+    yield "            READ : begin"
+    yield "                case(sel_s)"
+    for slave in range(s):
+        yield (
+            "\n".join(
+                f"                    {slave}: next_state = (s{slave}_RVALID && m{master}_RREADY) ? IDLE : READ;"
+                for master in range(m)
+            )
+        )
+    yield "                    default: next_state = READ;"
+    yield "                endcase"
+    yield "            end"
+    yield "            default: next_state = IDLE;"
+    yield "        endcase"
+    yield "    end"
+    yield ""
+    yield "    always @(*) begin"
+    yield "        read_start  = 0;"
+    yield "        write_start = 0;"
+    yield "        if (state == IDLE) begin"
+    for master in range(m):
+        yield f"            if (m{master}_ARVALID) begin "
+        yield (
+            f"                sel_m = {master}; write_start = 0; read_start = 1;"
+        )
+        yield f"            end else if (m{master}_AWVALID) begin"
+        yield (
+            f"                sel_m = {master}; write_start = 1; read_start = 0;"
+        )
+        yield "            end"
+    yield f"            else sel_m = {m};"
+    yield "        end else sel_m = sel_m_reg;"
+    yield "    end"
+    yield ""
+    yield "    always @(*) begin"
+    yield "        if (state == IDLE) begin"
+    yield "            if (write_start) begin"
+    yield "                case (sel_m)"
+    for master in range(m):
+        yield f"                    {master}: begin"
+        yield (
+            "\n".join(
+                f"                        {'else if' if slave else 'if     '} (m{master}_AWADDR >= LOW_ADDR{slave} && m{master}_AWADDR <= HIGH_ADDR{slave}) sel_s = {slave};"
+                for slave in range(s)
+            )
+        )
+        yield f"                        else    sel_s = {s};"
+        yield "                    end"
+    yield f"                    default: sel_s = {s};"
+    yield "                endcase"
+    yield "            end"
+    yield "            else if (read_start) begin"
+    yield "                case (sel_m)"
+    for master in range(m):
+        yield f"                    {master}: begin"
+        yield (
+            "\n".join(
+                f"                        {'else if' if slave else 'if     '} (m{master}_ARADDR >= LOW_ADDR{slave} && m{master}_ARADDR <= HIGH_ADDR{slave}) sel_s = {slave};"
+                for slave in range(s)
+            )
+        )
+        yield f"                        else    sel_s = {s};"
+        yield "                    end"
+    yield f"                    default: sel_s = {s};"
+    yield "                endcase"
+    yield f"            end else sel_s = {s};"
+    yield "        end else  sel_s = sel_s_reg;"
+    yield "    end"
+    yield ""
+
+    # master connections, the select chains are the same for every master
+    chains = {}
+    for _, signals in LEGACY_MASTER_SIGNALS:
+        for sig, default in signals:
+            sep = " " * (8 - len(sig)) + ": "
+            chain = sep.join(f"(sel_s_reg == {slave}) ? s{slave}_{sig}" for slave in range(s))
+            chains[sig] = f"= {chain}{sep}{default};"
+    for master in range(m):
+        yield f"    /* master {master} */"
+        for label, signals in LEGACY_MASTER_SIGNALS:
+            lines = [f"        /* {label} */"]
+            lines.extend(f"        assign m{master}_{sig:<10}{chains[sig]}" for sig, _ in signals)
+            lines.append("")
+            yield "\n".join(lines)
+
+    # slave connections, one block per slave and master
+    for slave in range(s):
+        yield f"    /* slave {slave} */"
+        yield "        /* write */"
+        write = bind(LEGACY_SLAVE_WRITE, "master", slave=slave)
+        yield from (str(master).join(write) for master in range(m))
+        yield "        /* read */"
+        read = bind(LEGACY_SLAVE_READ, "master", slave=slave)
+        yield from (str(master).join(read) for master in range(m))
+
+    yield "endmodule"
+
+
+def gen_module(topology, **options):
+    return "\n".join(module_lines(topology, **options))
+
+
+def gen_slices(m, s, reg_slice, slice_ports):
+    code = []
+    ports = [f"m{master}" for master in range(m)] + [f"s{slave}" for slave in range(s)]
+    sliced = [
+        port
+        for port in ports
+        if slice_ports == "both" or (port[0] == "m") == (slice_ports == "master")
+    ]
+
+    def bits(width):
+        return f"[{int(width) - 1}:0]" if width.isdigit() else f"[{width}-1:0]"
+
+    def payload(prefix, signals):
+        names = [f"{prefix}{sig}" for sig, _ in signals]
+        return names[0] if len(names) == 1 else "{" + ", ".join(names) + "}"
+
+    # core side of every sliced boundary
+    for port in sliced:
+        code.append(f"    /* {'master' if port[0] == 'm' else 'slave'} {port[1:]} core side */")
+        for ch, _, signals in CHANNELS:
+            code.append(f"    wire                            core_{port}_{ch}VALID, core_{port}_{ch}READY;")
+            for sig, width in signals:
+                code.append(f"    wire    {bits(width):<24}core_{port}_{sig};")
+        code.append("")
+
+    # one slice per channel, upstream is the master side of the channel
+    for port in sliced:
+        code.append(f"    /* {'master' if port[0] == 'm' else 'slave'} {port[1:]} register slices */")
+        for ch, downstream, signals in CHANNELS:
+            outer, inner = f"{port}_", f"core_{port}_"
+            src, dst = (outer, inner) if downstream == (port[0] == "m") else (inner, outer)
+            code.append("    axi4_lite_reg_slice #(")
+            code.append(
+                f"        .WIDTH({' + '.join(width for _, width in signals)}), .MODE({REG_SLICES.index(reg_slice)})"
+            )
+            code.append(f"    ) {port}_{ch.lower()}_slice (")
+            code.append("        .iCLK(iCLK), .iRST(iRST),")
+            code.append(
+                f"        .in_valid({src}{ch}VALID), .in_data({payload(src, signals)}), .in_ready({src}{ch}READY),"
+            )
+            code.append(
+                f"        .out_valid({dst}{ch}VALID), .out_data({payload(dst, signals)}), .out_ready({dst}{ch}READY)"
+            )
+            code.append("    );")
+            code.append("")
+
+    # fabric core
+    code.append(f"    axi4_lite_interconnect_m{m}s{s}_core #(")
+    code.append("        .ADDR_WIDTH(ADDR_WIDTH), .DATA_WIDTH(DATA_WIDTH),")
+    for slave in range(s):
+        code.append(
+            f"        .LOW_ADDR{slave}(LOW_ADDR{slave}), .HIGH_ADDR{slave}(HIGH_ADDR{slave}){',' if slave != s - 1 else ''}"
+        )
+    code.append("    ) u_core (")
+    code.append("        .iCLK(iCLK), .iRST(iRST),")
+    for port in ports:
+        prefix = f"core_{port}_" if port in sliced else f"{port}_"
+        code.append(f"        /* {'master' if port[0] == 'm' else 'slave'} {port[1:]} */")
+        for ch, _, signals in CHANNELS:
+            conns = [f".{port}_{ch}VALID({prefix}{ch}VALID)", f".{port}_{ch}READY({prefix}{ch}READY)"]
+            conns += [f".{port}_{sig}({prefix}{sig})" for sig, _ in signals]
+            last = port == ports[-1] and ch == CHANNELS[-1][0]
+            code.append(f"        {', '.join(conns)}{'' if last else ','}")
+    code.append("    );")
+    code.append("")
+
+    return code
+
+
+def gen_packed(
+    m, s, crossbar=False, arbiter="fixed", weights=None, address_map=None, back_to_back=False
+):
+    code = []
+
+    # arbiter weights, packed with master 0 in the low bits
+    weights = weights or [1] * m
+    weight_width = max(1, max(weights).bit_length())
+    weight_param = (
+        "{" + ", ".join(f"{weight_width}'d{w}" for w in reversed(weights)) + "}"
+    )
+
+    # module header
+    code.append(f"module axi4_lite_interconnect_m{m}s{s} #(")
+    code.append("    /* parameters */")
+    code.append("    parameter ADDR_WIDTH    = 32,")
+    code.append("    parameter DATA_WIDTH    = 32,")
+    code.append(f"    parameter M             = {m},")
+    code.append(f"    parameter S             = {s},")
+    code.append("")
+    code.append("    /* address parameters, slave 0 in the low bits */")
+    for name, suffix in (("LOW_ADDR ", "0000"), ("HIGH_ADDR", "FFFF")):
+        values = ", ".join(f"32'h{i:04x}_{suffix}" for i in reversed(range(s)))
+        if address_map:
+            bound = 1 if name[0] == "L" else 2
+            values = ", ".join(hex32(region[bound]) for region in reversed(address_map))
+        code.append(
+            f"    parameter [S*ADDR_WIDTH-1:0]    {name} = {{{values}}}{',' if name[0] == 'L' else ''}"
+        )
+    code.append(") (")
+    code.append("    input                               iCLK, iRST,")
+    code.append("")
+
+    # packed interfaces, port 0 in the low bits
+    for port, count, last in (("m", "M", False), ("s", "S", True)):
+        into = "input " if port == "m" else "output"
+        back = "output" if port == "m" else "input "
+        code.append(f"    /* {'master' if port == 'm' else 'slave'} interfaces */")
+        code.append("        /* write address channel */")
+        code.append(f"        {into}  [{count}-1:0]                 {port}_AWVALID,")
+        code.append(f"        {into}  [{count}*ADDR_WIDTH-1:0]      {port}_AWADDR,")
+        code.append(f"        {back}  [{count}-1:0]                 {port}_AWREADY,")
+        code.append("")
+        code.append("        /* write data channel */")
+        code.append(f"        {into}  [{count}-1:0]                 {port}_WVALID,")
+        code.append(f"        {into}  [{count}*(DATA_WIDTH/8)-1:0]  {port}_WSTRB,")
+        code.append(f"        {into}  [{count}*DATA_WIDTH-1:0]      {port}_WDATA,")
+        code.append(f"        {back}  [{count}-1:0]                 {port}_WREADY,")
+        code.append("")
+        code.append("        /* write response channel */")
+        code.append(f"        {into}  [{count}-1:0]                 {port}_BREADY,")
+        code.append(f"        {back}  [{count}-1:0]                 {port}_BVALID,")
+        code.append(f"        {back}  [{count}*2-1:0]               {port}_BRESP,")
+        code.append("")
+        code.append("        /* read address channel */")
+        code.append(f"        {into}  [{count}-1:0]                 {port}_ARVALID,")
+        code.append(f"        {into}  [{count}*ADDR_WIDTH-1:0]      {port}_ARADDR,")
+        code.append(f"        {back}  [{count}-1:0]                 {port}_ARREADY,")
+        code.append("")
+        code.append("        /* read data channel */")
+        code.append(f"        {into}  [{count}-1:0]                 {port}_RREADY,")
+        code.append(f"        {back}  [{count}-1:0]                 {port}_RVALID,")
+        code.append(f"        {back}  [{count}*2-1:0]               {port}_RRESP,")
+        code.append(f"        {back}  [{count}*DATA_WIDTH-1:0]      {port}_RDATA{'' if last else ','}")
+        if not last:
+            code.append("")
+    code.append(");")
+    code.append("")
+
+    # arbitration domains: one per slave for the crossbar, one for the shared bus
+    code.append("    /* arbitration domains */")
+    code.append(f"    localparam D        = {'S' if crossbar else '1'};")
+    code.append("")
+    # base/mask decode per region from a checked map, a zero mask compares the range
+    if address_map:
+        masks = [region_mask(low, high) or 0 for _, low, high in address_map]
+        code.append("    /* address masks, slave 0 in the low bits */")
+        code.append(
+            f"    localparam [S*ADDR_WIDTH-1:0] ADDR_MASK = {{{', '.join(hex32(mask) for mask in reversed(masks))}}};"
+        )
+        code.append("")
+    code.append("    genvar      n, k, d;")
+    code.append("    integer     i;")
+    code.append("")
+
+    # read and write are routed independently, sel[n*S+k]: master n owns slave k
+    groups = (("w", "AW", "B"), ("r", "AR", "R"))
+    for g, addr, resp in groups:
+        code.append(f"    /* {'write' if g == 'w' else 'read'} routing */")
+        code.append(f"    wire    [M*S-1:0]       {g}hit, {g}sel;")
+        code.append(f"    wire    [M-1:0]         {g}req, {g}done;")
+        code.append(f"    wire    [D*M-1:0]       {g}dom_req, {g}dom_grant;")
+        code.append(f"    reg     [M-1:0]         {g}grant;")
+        code.append("")
+
+    # per-master decode, requests and routing state
+    code.append("    generate")
+    code.append("        for (n = 0; n < M; n = n + 1) begin : g_master")
+    code.append("            wire    [S-1:0]     aw_match, ar_match;")
+    code.append("            reg     [S-1:0]     wsel_reg, rsel_reg;")
+    code.append("")
+    code.append("            /* address decode */")
+    code.append("            for (k = 0; k < S; k = k + 1) begin : g_decode")
+    for addr in ("AW", "AR"):
+        if address_map:
+            code.append(
+                f"                assign {addr.lower()}_match[k] = (ADDR_MASK[k*ADDR_WIDTH +: ADDR_WIDTH] != 0) ?"
+            )
+            code.append(
+                f"                                     ((m_{addr}ADDR[n*ADDR_WIDTH +: ADDR_WIDTH] & ADDR_MASK[k*ADDR_WIDTH +: ADDR_WIDTH]) == LOW_ADDR[k*ADDR_WIDTH +: ADDR_WIDTH]) :"
+            )
+            code.append(
+                f"                                     ((m_{addr}ADDR[n*ADDR_WIDTH +: ADDR_WIDTH] >= LOW_ADDR[k*ADDR_WIDTH +: ADDR_WIDTH]) &&"
+            )
+            code.append(
+                f"                                      (m_{addr}ADDR[n*ADDR_WIDTH +: ADDR_WIDTH] <= HIGH_ADDR[k*ADDR_WIDTH +: ADDR_WIDTH]));"
+            )
+            continue
+        code.append(
+            f"                assign {addr.lower()}_match[k] = (m_{addr}ADDR[n*ADDR_WIDTH +: ADDR_WIDTH] >= LOW_ADDR[k*ADDR_WIDTH +: ADDR_WIDTH]) &&"
+        )
+        code.append(
+            f"                                     (m_{addr}ADDR[n*ADDR_WIDTH +: ADDR_WIDTH] <= HIGH_ADDR[k*ADDR_WIDTH +: ADDR_WIDTH]);"
+        )
+    code.append("            end")
+    code.append("")
+    code.append("            /* lowest matching slave wins, as in the if/else decode */")
+    for g, addr, resp in groups:
+        code.append(
+            f"            assign {g}hit[n*S +: S]    = {addr.lower()}_match & (~{addr.lower()}_match + 1'b1);"
+        )
+    code.append("")
+    code.append("            /* request while not routed, release on the response */")
+    for g, addr, resp in groups:
+        code.append(f"            assign {g}req[n]          = m_{addr}VALID[n] && ({g}sel_reg == 0);")
+        code.append(f"            assign {g}done[n]         = m_{resp}VALID[n] && m_{resp}READY[n];")
+    for g, addr, resp in groups:
+        code.append(f"            assign {g}sel[n*S +: S]    = {g}sel_reg;")
+    code.append("")
+    code.append("            for (d = 0; d < D; d = d + 1) begin : g_domain_req")
+    for g, addr, resp in groups:
+        code.append(
+            f"                assign {g}dom_req[d*M+n]  = {g}req[n] && ((D == 1) ? |{g}hit[n*S +: S] : {g}hit[n*S+d]);"
+        )
+    code.append("            end")
+    code.append("")
+    code.append("            always @(posedge iCLK or negedge iRST) begin")
+    code.append("                if (!iRST) begin")
+    code.append("                    wsel_reg        <= 0;")
+    code.append("                    rsel_reg        <= 0;")
+    code.append("                end else begin")
+    for g, addr, resp in groups:
+        code.append(f"                    if ({g}grant[n])")
+        code.append(f"                        {g}sel_reg    <= {g}hit[n*S +: S];")
+        code.append(f"                    else if ({g}done[n])")
+        code.append(f"                        {g}sel_reg    <= 0;")
+    code.append("                end")
+    code.append("            end")
+    code.append("")
+    code.append("            /* slave to master muxes */")
+    for g, signals in (
+        ("w", (("AWREADY", "1"), ("WREADY", "1"), ("BVALID", "1"), ("BRESP", "2"))),
+        ("r", (("ARREADY", "1"), ("RVALID", "1"), ("RRESP", "2"), ("RDATA", "DATA_WIDTH"))),
+    ):
+        for sig, width in signals:
+            out = f"m_{sig}[n]" if width == "1" else f"m_{sig}[n*{width} +: {width}]"
+            code.append(
+                f"            axi4_lite_onehot_mux #(.N(S), .WIDTH({width})) {sig.lower()}_mux (.sel({g}sel_reg), .in(s_{sig}), .out({out}));"
+            )
+    code.append("        end")
+    code.append("    endgenerate")
+    code.append("")
+
+    # masters granted by any domain
+    code.append("    always @(*) begin")
+    code.append("        wgrant = 0;")
+    code.append("        rgrant = 0;")
+    code.append("        for (i = 0; i < D; i = i + 1) begin")
+    code.append("            wgrant = wgrant | wdom_grant[i*M +: M];")
+    code.append("            rgrant = rgrant | rdom_grant[i*M +: M];")
+    code.append("        end")
+    code.append("    end")
+    code.append("")
+
+    # per-domain arbiters, a domain is busy until its owner's response, back
+    # to back it is free again in the cycle of that response
+    code.append("    generate")
+    code.append("        for (d = 0; d < D; d = d + 1) begin : g_domain")
+    for g, addr, resp in groups:
+        code.append(f"            reg                 {g}busy;")
+        code.append(f"            reg     [M-1:0]     {g}owner;")
+        code.append(f"            wire    [M-1:0]     {g}arb_grant;")
+        if back_to_back:
+            code.append(f"            wire                {g}free;")
+        code.append("")
+    if back_to_back:
+        for g, addr, resp in groups:
+            code.append(f"            assign {g}free = !{g}busy || |({g}owner & {g}done);")
+        code.append("")
+    for g, addr, resp in groups:
+        free = f"{g}free" if back_to_back else f"!{g}busy"
+        code.append("            axi4_lite_arbiter #(")
+        code.append(
+            f"                .N(M), .POLICY({ARBITERS.index(arbiter)}), .WEIGHT_WIDTH({weight_width}), .WEIGHTS({weight_param})"
+        )
+        code.append(f"            ) {g}arbiter (")
+        code.append("                .iCLK(iCLK), .iRST(iRST),")
+        code.append(
+            f"                .req({g}dom_req[d*M +: M]), .update({free}), .grant({g}arb_grant), .grant_idx()"
+        )
+        code.append("            );")
+        code.append("")
+        if back_to_back:
+            code.append(f"            assign {g}dom_grant[d*M +: M] = ({g}free) ? {g}arb_grant : {{M{{1'b0}}}};")
+        else:
+            code.append(f"            assign {g}dom_grant[d*M +: M] = ({g}busy) ? {{M{{1'b0}}}} : {g}arb_grant;")
+        code.append("")
+    code.append("            always @(posedge iCLK or negedge iRST) begin")
+    code.append("                if (!iRST) begin")
+    for g, addr, resp in groups:
+        code.append(f"                    {g}busy           <= 1'b0;")
+        code.append(f"                    {g}owner          <= 0;")
+    code.append("                end else begin")
+    for g, addr, resp in groups:
+        if back_to_back:
+            code.append(f"                    if ({g}free) begin")
+            code.append(f"                        {g}busy       <= |{g}arb_grant;")
+            code.append(f"                        {g}owner      <= {g}arb_grant;")
+            code.append("                    end")
+            continue
+        code.append(f"                    if (!{g}busy && |{g}arb_grant) begin")
+        code.append(f"                        {g}busy       <= 1'b1;")
+        code.append(f"                        {g}owner      <= {g}arb_grant;")
+        code.append(f"                    end else if ({g}busy && |({g}owner & {g}done)) begin")
+        code.append(f"                        {g}busy       <= 1'b0;")
+        code.append(f"                        {g}owner      <= 0;")
+        code.append("                    end")
+    code.append("                end")
+    code.append("            end")
+    code.append("        end")
+    code.append("    endgenerate")
+    code.append("")
+
+    # per-slave master muxes, selected by the slave's column of the routing
+    code.append("    generate")
+    code.append("        for (k = 0; k < S; k = k + 1) begin : g_slave")
+    code.append("            wire    [M-1:0]             wroute, rroute;")
+    code.append("            wire    [ADDR_WIDTH-1:0]    awaddr, araddr;")
+    code.append("")
+    code.append("            for (n = 0; n < M; n = n + 1) begin : g_route")
+    code.append("                assign wroute[n] = wsel[n*S+k];")
+    code.append("                assign rroute[n] = rsel[n*S+k];")
+    code.append("            end")
+    code.append("")
+    code.append("            /* master to slave muxes */")
+    for g, signals in (
+        (
+            "w",
+            (
+                ("AWADDR", "ADDR_WIDTH"),
+                ("AWVALID", "1"),
+                ("WVALID", "1"),
+                ("WDATA", "DATA_WIDTH"),
+                ("WSTRB", "DATA_WIDTH/8"),
+                ("BREADY", "1"),
+            ),
+        ),
+        ("r", (("ARADDR", "ADDR_WIDTH"), ("ARVALID", "1"), ("RREADY", "1"))),
+    ):
+        for sig, width in signals:
+            if sig.endswith("ADDR"):
+                out = sig.lower()
+            elif width == "1":
+                out = f"s_{sig}[k]"
+            else:
+                part = f"({width})" if "/" in width else width
+                out = f"s_{sig}[k*{part} +: {part}]"
+            code.append(
+                f"            axi4_lite_onehot_mux #(.N(M), .WIDTH({width})) {sig.lower()}_mux (.sel({g}route), .in(m_{sig}), .out({out}));"
+            )
+    code.append("")
+    code.append("            /* slave addresses relative to the region base */")
+    for g, addr in (("w", "AW"), ("r", "AR")):
+        code.append(
+            f"            assign s_{addr}ADDR[k*ADDR_WIDTH +: ADDR_WIDTH] = (|{g}route) ? {addr.lower()}addr - LOW_ADDR[k*ADDR_WIDTH +: ADDR_WIDTH] : {{ADDR_WIDTH{{1'b0}}}};"
+        )
+    code.append("        end")
+    code.append("    endgenerate")
+    code.append("")
+    code.append("endmodule")
+
+    return code
+
+
+def gen_fabric(
+    m,
+    s,
+    crossbar=False,
+    split_rw=False,
+    arbiter="fixed",
+    weights=None,
+    outstanding=1,
+    mux="priority",
+    address_map=None,
+    default_slave=False,
+    back_to_back=False,
+):
+    mw = max(1, (m - 1).bit_length())
+    sw = max(1, (s - 1).bit_length())
+
+    # unmapped addresses decode to s: routed to the default slave when there
+    # is one, so not routed is s + 1; without one they never get a grant
+    slaves = list(range(s + 1 if default_slave else s))
+    none = len(slaves)
+
+    # arbiter weights, packed with master 0 in the low bits
+    weights = weights or [1] * m
+    weight_width = max(1, max(weights).bit_length())
+    weight_param = (
+        "{" + ", ".join(f"{weight_width}'d{w}" for w in reversed(weights)) + "}"
+    )
+
+    # arbitration domains: one per slave for the crossbar, one for the shared bus
+    if crossbar:
+        domains = [(f"s{slave}_", [slave]) for slave in slaves]
+    else:
+        domains = [("", slaves)]
+
+    # channel groups: one read/write state machine, or independent ones
+    groups = ["w", "r"] if split_rw else [""]
+
+    def req(master, group):
+        if group == "w":
+            return f"m{master}_AWVALID", f"m{master}_aw_sel"
+        if group == "r":
+            return f"m{master}_ARVALID", f"m{master}_ar_sel"
+        return (
+            f"(m{master}_ARVALID || m{master}_AWVALID)",
+            f"(m{master}_ARVALID) ? m{master}_ar_sel : m{master}_aw_sel",
+        )
+
+    # handshake that ends a grant: the response, or only the address phase
+    # once responses are routed by the ordering fifos
+    def done(port, group):
+        if outstanding > 1:
+            write = f"({port}_AWVALID && {port}_AWREADY)"
+            read = f"({port}_ARVALID && {port}_ARREADY)"
+        else:
+            write = f"({port}_BVALID && {port}_BREADY)"
+            read = f"({port}_RVALID && {port}_RREADY)"
+        return {"w": write, "r": read}.get(group, f"{write} || {read}")
+
+    # routing of the data and response channels, as a template over the
+    # {index} of the port at the other end
+    def route(port, other, phase, cond):
+        if outstanding > 1 and phase:
+            return f"({port}_{phase}_head == {{index}}) && ({other}{{index}}_{phase}_head == {port[1:]})"
+        return cond
+
+    def target(master, group, dom_slaves):
+        if len(dom_slaves) == 1:
+            return f"m{master}_{group}sel_s == {dom_slaves[0]}"
+        return f"m{master}_{group}sel_s != {none}"
+
+    # finite state machine, one per arbitration domain and channel group
+    yield "    /* finite state machine */"
+    yield "    localparam IDLE     = 3'b000;"
+    yield "    localparam WRITE    = 3'b001;"
+    yield "    localparam READ     = 3'b010;"
+    yield ""
+
+    # per-master routing state
+    for master in range(m):
+        yield f"    /* master {master} routing */"
+        yield f"    reg [{sw}:0]   m{master}_aw_sel, m{master}_ar_sel;"
+        for group in groups:
+            read = "" if split_rw else f" m{master}_read,"
+            yield f"    reg [{sw}:0]   m{master}_{group}sel_s_reg;"
+            yield f"    wire [{sw}:0]  m{master}_{group}sel_s;"
+            yield f"    wire        m{master}_{group}req,{read} m{master}_{group}grant;"
+        if outstanding > 1:
+            yield f"    wire [{sw}:0]  m{master}_w_head, m{master}_b_head, m{master}_r_head;"
+            yield f"    wire        m{master}_w_full, m{master}_b_full, m{master}_r_full;"
+        yield ""
+
+    # per-domain arbiter state
+    for dom, dom_slaves in domains:
+        yield f"    /* {'slave ' + str(dom_slaves[0]) if crossbar else 'bus'} arbiter */"
+        yield f"    reg         {dom}read_start, {dom}write_start;"
+        for group in groups:
+            yield f"    reg [{mw}:0]   {dom}{group}sel_m, {dom}{group}sel_m_reg;"
+            yield f"    reg [2:0]   {dom}{group}state, {dom}{group}next_state;"
+            if back_to_back:
+                yield f"    wire        {dom}{group}free;"
+            if arbiter != "fixed":
+                yield f"    wire [{m-1}:0]  {dom}{group}req;"
+                yield (
+                    f"    wire [{(m).bit_length()-1}:0]  {dom}{group}grant_idx;"
+                )
+        yield ""
+
+    if arbiter != "fixed" and not split_rw:
+        yield f"    wire [{m-1}:0]  m_read;"
+        yield ""
+
+    # per-slave ordering state
+    if outstanding > 1:
+        for slave in slaves:
+            yield f"    /* slave {slave} ordering */"
+            yield f"    wire [{mw}:0]  s{slave}_w_head, s{slave}_b_head, s{slave}_r_head;"
+            yield f"    wire        s{slave}_w_full, s{slave}_b_full, s{slave}_r_full;"
+            yield ""
+
+    # default slave, answers every unmapped access with a decode error
+    if default_slave:
+        yield f"    /* slave {s}: default slave */"
+        for ch, _, signals in CHANNELS:
+            yield f"    wire                            s{s}_{ch}VALID, s{s}_{ch}READY;"
+            for sig, width in signals:
+                bits = f"[{int(width) - 1}:0]" if width.isdigit() else f"[{width}-1:0]"
+                yield f"    wire    {bits:<24}s{s}_{sig};"
+        yield ""
+        yield "    axi4_lite_default_slave #("
+        yield "        .DATA_WIDTH(DATA_WIDTH)"
+        yield "    ) default_slave ("
+        yield "        .iCLK(iCLK), .iRST(iRST),"
+        conns = [
+            f".s_{ch}VALID(s{s}_{ch}VALID), .s_{ch}READY(s{s}_{ch}READY)"
+            + "".join(f", .s_{sig}(s{s}_{sig})" for sig, _ in signals if not downstream)
+            for ch, downstream, signals in CHANNELS
+        ]
+        yield ",\n".join(f"        {conn}" for conn in conns)
+        yield "    );"
+        yield ""
+
+    # address decode from a checked map: one shared function of parallel
+    # compares, the regions cannot overlap so the hits are or-encoded
+    if address_map:
+        yield "    /* address decode */"
+        for slave, (_, low, high) in enumerate(address_map):
+            mask = region_mask(low, high)
+            if mask is not None:
+                yield f"    localparam ADDR_MASK{slave}  = {hex32(mask)};"
+        yield ""
+        yield f"    function [{sw}:0] decode;"
+        yield "        input   [ADDR_WIDTH-1:0]    addr;"
+        yield f"        reg     {f'[{s - 1}:0]':<20}hit;"
+        yield "        begin"
+        for slave, (name, low, high) in enumerate(address_map):
+            if region_mask(low, high) is not None:
+                match = f"((addr & ADDR_MASK{slave}) == LOW_ADDR{slave})"
+            else:
+                match = f"(addr >= LOW_ADDR{slave} && addr <= HIGH_ADDR{slave})"
+            yield f"            hit[{slave}]  = {match + ';':<52}// {name}"
+        parts = [f"((hit == 0) ? {sw + 1}'d{s} : {sw + 1}'d0)"]
+        parts += [f"((hit[{slave}]) ? {sw + 1}'d{slave} : {sw + 1}'d0)" for slave in range(1, s)]
+        lines = [f"            decode  = {parts[0]}"]
+        lines.extend(f"                    | {part}" for part in parts[1:])
+        yield "\n".join(lines) + ";"
+        yield "        end"
+        yield "    endfunction"
+        yield ""
+        for master in range(m):
+            yield "    always @(*) begin"
+            yield f"        m{master}_aw_sel = decode(m{master}_AWADDR);"
+            yield f"        m{master}_ar_sel = decode(m{master}_ARADDR);"
+            yield "    end"
+            yield ""
+    else:
+        # address decode, once per master and channel
+        for master in range(m):
+            for ch in ("aw", "ar"):
+                addr = f"m{master}_{ch.upper()}ADDR"
+                yield "    always @(*) begin"
+                yield (
+                    "\n".join(
+                        f"        {'else if' if slave else 'if     '} ({addr} >= LOW_ADDR{slave} && {addr} <= HIGH_ADDR{slave}) m{master}_{ch}_sel = {slave};"
+                        for slave in range(s)
+                    )
+                )
+                yield f"        else    m{master}_{ch}_sel = {s};"
+                yield "    end"
+                yield ""
+
+    # master requests, a read wins over a write from the same master
+    if arbiter != "fixed" and not split_rw:
+        read_parts = [f"m{master}_read" for master in reversed(range(m))]
+        yield f"    assign m_read = {{{', '.join(read_parts)}}};"
+        yield ""
+    for master in range(m):
+        yield f"    /* master {master} request */"
+        if not split_rw:
+            yield f"    assign m{master}_read     = m{master}_ARVALID;"
+        for group in groups:
+            valid, sel = req(master, group)
+            grant_parts = [f"({dom}{group}sel_m == {master})" for dom, _ in domains]
+            yield f"    assign m{master}_{group}sel_s    = {sel};"
+            credit = ""
+            if outstanding > 1:
+                fifo = "b" if group == "w" else "r"
+                slave_parts = [f"({sel} == {slave}) ? !s{slave}_{fifo}_full" for slave in slaves]
+                credit = f" && !m{master}_{fifo}_full && ({' : '.join(slave_parts)} : 1'b0)"
+            yield (
+                f"    assign m{master}_{group}req      = {valid} && (m{master}_{group}sel_s_reg == {none}){credit};"
+            )
+            yield (
+                f"    assign m{master}_{group}grant    = {' || '.join(grant_parts)};"
+            )
+            yield ""
+            yield "    always @(posedge iCLK or negedge iRST) begin"
+            yield "        if (!iRST)"
+            yield f"            m{master}_{group}sel_s_reg <= {none};"
+            yield f"        else if (m{master}_{group}grant)"
+            yield f"            m{master}_{group}sel_s_reg <= m{master}_{group}sel_s;"
+            yield f"        else if ({done(f'm{master}', group)})"
+            yield f"            m{master}_{group}sel_s_reg <= {none};"
+            yield "    end"
+            yield ""
+
+    # domain arbiters, inline fixed priority with master 0 first or an arbiter instance
+    for dom, dom_slaves in domains:
+        for group in groups:
+            state = f"{dom}{group}state"
+            next_state = f"{dom}{group}next_state"
+            sel_m = f"{dom}{group}sel_m"
+            write_done = " || ".join(done(f"s{slave}", "w") for slave in dom_slaves)
+            read_done = " || ".join(done(f"s{slave}", "r") for slave in dom_slaves)
+            if len(dom_slaves) > 1:
+                write_done, read_done = f"({write_done})", f"({read_done})"
+
+            if group == "w":
+                start_state = f"({dom}write_start) ? WRITE : IDLE"
+            elif group == "r":
+                start_state = f"({dom}read_start) ? READ : IDLE"
+            else:
+                start_state = f"({dom}write_start) ? WRITE : (({dom}read_start) ? READ : IDLE)"
+
+            # grants are decided while idle, or back to back also in the cycle
+            # the current transaction completes, skipping the idle cycle
+            arb = f"{state} == IDLE"
+            after = "IDLE"
+            label = f"slave {dom_slaves[0]}" if crossbar else "bus"
+            label += {"w": " write", "r": " read"}.get(group, "")
+            yield f"    /* {label} arbitration */"
+            if back_to_back:
+                arb, after = f"{dom}{group}free", f"({start_state})"
+                finish = [f"({state} == IDLE)"]
+                if group != "r":
+                    finish.append(f"({state} == WRITE && {write_done})")
+                if group != "w":
+                    finish.append(f"({state} == READ && {read_done})")
+                yield f"    assign {arb} = {' || '.join(finish)};"
+                yield ""
+            yield "    always @(posedge iCLK or negedge iRST) begin"
+            yield "        if (!iRST) begin"
+            yield f"            {state:<18}<= IDLE;"
+            yield f"            {sel_m + '_reg':<18}<= {m};"
+            yield "        end else begin"
+            yield f"            {state:<18}<= {next_state};"
+            yield f"            if ({arb})"
+            yield f"                {sel_m}_reg  <= {sel_m};"
+            yield "        end"
+            yield "    end"
+            yield ""
+            yield "    always @(*) begin"
+            yield f"        case ({state})"
+            yield f"            IDLE:    {next_state} = {start_state};"
+            if group != "r":
+                yield (
+                    f"            WRITE:   {next_state} = {write_done} ? {after} : WRITE;"
+                )
+            if group != "w":
+                yield (
+                    f"            READ:    {next_state} = {read_done} ? {after} : READ;"
+                )
+            yield f"            default: {next_state} = IDLE;"
+            yield "        endcase"
+            yield "    end"
+            yield ""
+            if arbiter != "fixed":
+                reqs = [
+                    f"m{master}_{group}req && ({target(master, group, dom_slaves)})"
+                    for master in reversed(range(m))
+                ]
+                yield f"    assign {dom}{group}req = {{{', '.join(reqs)}}};"
+                yield ""
+                yield "    axi4_lite_arbiter #("
+                yield (
+                    f"        .N({m}), .POLICY({ARBITERS.index(arbiter)}), .WEIGHT_WIDTH({weight_width}), .WEIGHTS({weight_param})"
+                )
+                yield f"    ) {dom}{group}arbiter ("
+                yield "        .iCLK(iCLK), .iRST(iRST),"
+                yield (
+                    f"        .req({dom}{group}req), .update({arb}), .grant(), .grant_idx({dom}{group}grant_idx)"
+                )
+                yield "    );"
+                yield ""
+
+            yield "    always @(*) begin"
+            if group != "w":
+                yield f"        {dom}read_start     = 0;"
+            if group != "r":
+                yield f"        {dom}write_start    = 0;"
+            yield f"        {sel_m:<18}= {m};"
+            if arbiter != "fixed":
+                grant_idx = f"{dom}{group}grant_idx"
+                if group == "w":
+                    start = f"{dom}write_start = 1;"
+                elif group == "r":
+                    start = f"{dom}read_start = 1;"
+                else:
+                    start = f"{dom}write_start = !m_read[{grant_idx}]; {dom}read_start = m_read[{grant_idx}];"
+                yield f"        if ({arb} && {grant_idx} != {m}) begin"
+                yield f"            {sel_m} = {grant_idx}; {start}"
+                yield "        end"
+                yield "    end"
+                yield ""
+                continue
+            yield f"        if ({arb}) begin"
+            for master in range(m):
+                cond = "if     " if master == 0 else "else if"
+                yield (
+                    f"            {cond} (m{master}_{group}req && {target(master, group, dom_slaves)}) begin"
+                )
+                if group == "w":
+                    start = f"{dom}write_start = 1;"
+                elif group == "r":
+                    start = f"{dom}read_start = 1;"
+                else:
+                    start = f"{dom}write_start = !m{master}_read; {dom}read_start = m{master}_read;"
+                yield f"                {sel_m} = {master}; {start}"
+                yield "            end"
+            yield "        end"
+            yield "    end"
+            yield ""
+
+    wgroup, rgroup = groups[0], groups[-1]
+
+    # ordering fifos: pushed on the address handshake with the slave (master
+    # side) or master (slave side) it went to, popped on the w, b and r handshakes
+    if outstanding > 1:
+        ports = [(f"m{master}", sw, none, f"m{master}_{{}}sel_s_reg") for master in range(m)]
+        for dom, dom_slaves in domains:
+            ports += [(f"s{slave}", mw, m, f"{dom}{{}}sel_m_reg") for slave in dom_slaves]
+        for port, width, empty, sel in ports:
+            yield f"    /* {'master' if port[0] == 'm' else 'slave'} {port[1:]} ordering */"
+            for fifo, push, pop, group in (
+                ("w", "AW", "W", "w"),
+                ("b", "AW", "B", "w"),
+                ("r", "AR", "R", "r"),
+            ):
+                yield "    axi4_lite_fifo #("
+                yield (
+                    f"        .WIDTH({width + 1}), .DEPTH({outstanding}), .EMPTY_VALUE({empty})"
+                )
+                yield f"    ) {port}_{fifo}_order ("
+                yield "        .iCLK(iCLK), .iRST(iRST),"
+                yield (
+                    f"        .push({port}_{push}VALID && {port}_{push}READY), .push_data({sel.format(group)}), .full({port}_{fifo}_full),"
+                )
+                yield (
+                    f"        .pop({port}_{pop}VALID && {port}_{pop}READY), .head({port}_{fifo}_head), .empty()"
+                )
+                yield "    );"
+                yield ""
+
+    # payload widths for the one-hot muxes, handshake signals are 1 bit
+    widths = {sig: width.strip("()") for _, _, signals in CHANNELS for sig, width in signals}
+
+    # one output signal selected from several ports: a priority ternary chain,
+    # or an and-or mux over a one-hot select decoded once per port. Every input
+    # is a port's sig plus suffix, so a chain is one join over its heads
+    def select(out, sig, width, sel, ports, suffix, default):
+        value = f"{sig}{suffix}"
+        if mux == "onehot":
+            vector = "{" + f"_{value}, ".join(reversed(ports)) + f"_{value}}}"
+            return f"        axi4_lite_onehot_mux #(.N({len(ports)}), .WIDTH({width})) {out.lower()}_mux (.sel({sel}), .in({vector}), .out({out}));"
+        return f"        assign {out[:out.index('_') + 1]}{sig:<9}= {f'{value} : '.join(sel)}{value} : {default};"
+
+    # per phase key: the one-hot vector names, or the "(cond) ? port_" heads
+    # of the priority chains, filled in from the phase's route template
+    def selects(port, other, indices, phases):
+        def fill(template):
+            parts = bind(template, "index")
+            return [str(index).join(parts) for index in indices]
+
+        if mux == "onehot":
+            vectors = yield from onehot(port, [(key, fill(cond)) for key, cond in phases.items()])
+            yield ""
+            return vectors
+        return {key: fill(f"({cond}) ? {other}{{index}}_") for key, cond in phases.items()}
+
+    # one-hot select vectors, named after the channels they route
+    def onehot(port, selects):
+        names = []
+        for key, conds in selects:
+            names.append(f"{port}_{key}_oh")
+            yield f"    wire [{len(conds) - 1}:0]   {port}_{key}_oh;"
+        for name, (_, conds) in zip(names, selects):
+            yield (
+                f"    assign {name:<12}= {{{', '.join(f'({cond})' for cond in reversed(conds))}}};"
+            )
+        return dict(zip((key for key, _ in selects), names))
+
+    def phase_key(label, phase):
+        if outstanding > 1:
+            return phase or {"write": "aw", "read": "ar"}[label]
+        return label
+
+    # master connections, routed by the per-master slave select
+    master_signals = (
+        (
+            "write",
+            wgroup,
+            (
+                ("AWREADY", None, "1'b0"),
+                ("WREADY", "w", "1'b0"),
+                ("BRESP", "b", "2'b00"),
+                ("BVALID", "b", "1'b0"),
+            ),
+        ),
+        (
+            "read",
+            rgroup,
+            (
+                ("ARREADY", None, "1'b0"),
+                ("RVALID", "r", "1'b0"),
+                ("RDATA", "r", "32'h0"),
+                ("RRESP", "r", "2'b00"),
+            ),
+        ),
+    )
+    ports = [f"s{slave}" for slave in slaves]
+    for master in range(m):
+        yield f"    /* master {master} */"
+
+        # one route template per phase, shared by the signals routed in it
+        phases = {}
+        for label, group, signals in master_signals:
+            for _, phase, _ in signals:
+                key = phase_key(label, phase)
+                if key not in phases:
+                    phases[key] = route(f"m{master}", "s", phase, f"m{master}_{group}sel_s_reg == {{index}}")
+        sels = yield from selects(f"m{master}", "s", slaves, phases)
+
+        for label, group, signals in master_signals:
+            yield f"        /* {label} */"
+            for sig, phase, default in signals:
+                yield select(f"m{master}_{sig}", sig, widths.get(sig, 1), sels[phase_key(label, phase)], ports, "", default)
+            yield ""
+
+    # slave connections, routed by the owning domain's master select
+    slave_signals = (
+        (
+            "WRITE",
+            wgroup,
+            (
+                ("AWADDR", None, True, "32'h0"),
+                ("AWVALID", None, False, "1'b0"),
+                ("WVALID", "w", False, "1'b0"),
+                ("WDATA", "w", False, "32'h0"),
+                ("WSTRB", "w", False, "4'h0"),
+                ("BREADY", "b", False, "1'b0"),
+            ),
+        ),
+        (
+            "READ",
+            rgroup,
+            (
+                ("ARADDR", None, True, "32'h0"),
+                ("ARVALID", None, False, "1'b0"),
+                ("RREADY", "r", False, "1'b0"),
+            ),
+        ),
+    )
+    ports = [f"m{master}" for master in range(m)]
+    for dom, dom_slaves in domains:
+        for slave in dom_slaves:
+            yield f"    /* slave {slave} */"
+
+            phases = {}
+            for state, group, signals in slave_signals:
+                for _, phase, _, _ in signals:
+                    key = phase_key(state.lower(), phase)
+                    if key not in phases:
+                        cond = f"({dom}{group}state == {state}) && ({dom}{group}sel_m_reg == {{index}})"
+                        if not crossbar:
+                            cond += f" && (m{{index}}_{group}sel_s_reg == {slave})"
+                        phases[key] = route(f"s{slave}", "m", phase, cond)
+            sels = yield from selects(f"s{slave}", "m", range(m), phases)
+
+            for state, group, signals in slave_signals:
+                yield f"        /* {state.lower()} */"
+                for sig, phase, offset, default in signals:
+                    yield select(
+                        f"s{slave}_{sig}",
+                        sig,
+                        widths.get(sig, 1),
+                        sels[phase_key(state.lower(), phase)],
+                        ports,
+                        f" - LOW_ADDR{slave}" if offset and slave < s else "",
+                        default,
+                    )
+                yield ""
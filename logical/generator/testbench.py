@@ -0,0 +1,1298 @@
+# the signals of every master and slave port, as the testbench names them
+PORT_SIGNALS = (
+    "AWVALID", "AWREADY", "AWADDR",
+    "WVALID", "WREADY", "WSTRB", "WDATA",
+    "BREADY", "BVALID", "BRESP",
+    "ARVALID", "ARREADY", "ARADDR",
+    "RREADY", "RVALID", "RRESP", "RDATA",
+)
+
+
+def slice_latency(reg_slice, slice_ports):
+    # forward and full slices register valid/data, one cycle per boundary on
+    # each of the aw, w and b hops of a write round trip
+    if reg_slice not in ("forward", "full"):
+        return 0
+    return 3 * (2 if slice_ports == "both" else 1)
+
+
+def unmapped_address(regions):
+    # lowest word address outside every region, the target of the decode error test
+    addr = 0
+    for low, high in sorted(regions):
+        if addr < low:
+            return addr
+        addr = max(addr, (high + 4) & ~3)
+    if addr > 0xFFFFFFFF:
+        raise ValueError("Address map covers the whole address space, nothing is unmapped")
+    return addr
+
+
+def instantiate_packed(m, s):
+    tb = []
+
+    # packed vectors, port 0 in the low bits
+    def vector(names):
+        return "{" + ", ".join(reversed(names)) + "}"
+
+    tb.append(f"    axi4_lite_interconnect_m{m}s{s} #(")
+    tb.append(f"        .LOW_ADDR({vector([f'LOW_ADDR{i}' for i in range(s)])}),")
+    tb.append(f"        .HIGH_ADDR({vector([f'HIGH_ADDR{i}' for i in range(s)])})")
+    tb.append(f"    ) u_interconnect (")
+    tb.append(f"        .iCLK(iCLK), .iRST(iRST),")
+    for port, count, label in (("m", m, "master"), ("s", s, "slave")):
+        tb.append(f"        ")
+        tb.append(f"        /* {label} signals */")
+        for channel in (
+            ("AWVALID", "AWADDR", "AWREADY"),
+            ("WVALID", "WSTRB", "WDATA", "WREADY"),
+            ("BREADY", "BVALID", "BRESP"),
+            ("ARVALID", "ARADDR", "ARREADY"),
+            ("RREADY", "RVALID", "RRESP", "RDATA"),
+        ):
+            for sig in channel:
+                last = port == "s" and sig == "RDATA"
+                tb.append(
+                    f"        .{port}_{sig}({vector([f'{port}{i}_{sig}' for i in range(count)])}){'' if last else ','}"
+                )
+    tb.append(f"    );")
+    tb.append(f"    ")
+
+    return tb
+
+
+def tb_lines(
+    topology,
+    arbiter_stats=False,
+    reg_slice="none",
+    slice_ports="both",
+    packed=False,
+    decerr_test=False,
+    throughput=False,
+    plusargs=False,
+    traffic=False,
+    monitors=False,
+    txlog=False,
+    dump="all",
+    dump_ports=None,
+    dump_window=False,
+    dump_format="vcd",
+):
+    m, s, address_map = topology.m, topology.s, topology.address_map
+
+    # per-master traffic and the dump window are configured at run time
+    plusargs = plusargs or traffic or dump_window
+
+    # stimulus: with plusargs the op count, write ratio and address window are
+    # read at run time and every draw comes from a stream seeded by +SEED, one
+    # per concurrent master process (+SEED plus the master), so a single
+    # compile covers any scenario and a seed reproduces a run, whatever order
+    # the simulator runs the processes in
+    entries = 256 if plusargs else 25
+    ops = "ops" if plusargs else "50"
+
+    def rand(stream="seed"):
+        return f"{{$random({stream})}}" if plusargs else "$urandom"
+
+    # an index into the first addrs entries of the address list
+    def pick(stream="seed"):
+        return f"({rand(stream)} % addrs)" if plusargs else f"$urandom_range(0, {entries - 1})"
+
+    def write_op(stream="seed"):
+        return f"({rand(stream)} % 100 < write_pct)" if plusargs else "$urandom_range(0, 1)"
+
+    # header
+    yield f"`timescale 1ns / 1ns\n"
+    yield f"module tb_axi4_lite_interconnect_m{m}s{s}();"
+
+    # address parameters
+    yield f"    /* address parameters */"
+    for i, (start_addr, end_addr) in enumerate(topology.regions(0x100)):
+        yield f"    parameter LOW_ADDR{i}     = 32'h{start_addr:08x};"
+        yield f"    parameter HIGH_ADDR{i}    = 32'h{end_addr:08x};"
+    yield ""
+
+    # clock and reset
+    yield "    parameter           CLK_PERIOD = 10;"
+    yield "    reg                 iCLK, iRST;"
+    yield ""
+
+    # register slice latency budget
+    if reg_slice != "none":
+        yield f"    /* register slices: {reg_slice} at {slice_ports} */"
+        yield (
+            f"    parameter           SLICE_LATENCY = {slice_latency(reg_slice, slice_ports)};    // added cycles per round trip"
+        )
+        yield f"    parameter           OP_TIMEOUT    = {m} * (32 + 2 * SLICE_LATENCY);"
+        yield ""
+
+    # decode error test, an address no slave claims
+    if decerr_test:
+        regions = topology.regions(0x100)
+        yield "    /* decode error test */"
+        yield f"    parameter           UNMAPPED_ADDR  = 32'h{unmapped_address(regions):08x};"
+        yield (
+            f"    parameter           DECERR_TIMEOUT = {m * (32 + 2 * slice_latency(reg_slice, slice_ports))};    // cycles before the bus counts as stalled"
+        )
+        yield ""
+
+    # master interfaces
+    for master in range(m):
+        yield f"    /* master {master} interfaces */"
+        yield f"    reg                 m{master}_write_req;"
+        yield f"    reg     [3:0]       m{master}_write_strb;"
+        yield (
+            f"    reg     [31:0]      m{master}_write_addr, m{master}_write_data;"
+        )
+        yield f"    wire    [1:0]       m{master}_write_resp;"
+        yield f"    "
+        yield f"    reg                 m{master}_read_req;"
+        yield f"    reg     [31:0]      m{master}_read_addr;"
+        yield f"    wire    [1:0]       m{master}_read_resp;"
+        yield f"    wire    [31:0]      m{master}_read_data;"
+        yield f"    "
+        yield f"    "
+
+    # master signals
+    for master in range(m):
+        yield f"    /* master {master} signals */"
+        yield f"    wire                m{master}_AWVALID, m{master}_AWREADY;"
+        yield f"    wire    [31:0]      m{master}_AWADDR;"
+        yield f"    "
+        yield f"    wire                m{master}_WVALID, m{master}_WREADY;"
+        yield f"    wire    [3:0]       m{master}_WSTRB;"
+        yield f"    wire    [31:0]      m{master}_WDATA;"
+        yield f"    "
+        yield f"    wire                m{master}_BREADY, m{master}_BVALID;"
+        yield f"    wire    [1:0]       m{master}_BRESP;"
+        yield f"    "
+        yield f"    wire                m{master}_ARVALID, m{master}_ARREADY;"
+        yield f"    wire    [31:0]      m{master}_ARADDR;"
+        yield f"    "
+        yield f"    wire                m{master}_RREADY, m{master}_RVALID;"
+        yield f"    wire    [1:0]       m{master}_RRESP;"
+        yield f"    wire    [31:0]      m{master}_RDATA;"
+        yield f"    "
+        yield f"    "
+
+    # slave signals
+    for slave in range(s):
+        yield f"    /* slave {slave} signals */"
+        yield f"    wire                s{slave}_AWVALID, s{slave}_AWREADY;"
+        yield f"    wire    [31:0]      s{slave}_AWADDR;"
+        yield f"    "
+        yield f"    wire                s{slave}_WVALID, s{slave}_WREADY;"
+        yield f"    wire    [3:0]       s{slave}_WSTRB;"
+        yield f"    wire    [31:0]      s{slave}_WDATA;"
+        yield f"    "
+        yield f"    wire                s{slave}_BREADY, s{slave}_BVALID;"
+        yield f"    wire    [1:0]       s{slave}_BRESP;"
+        yield f"    "
+        yield f"    wire                s{slave}_ARVALID, s{slave}_ARREADY;"
+        yield f"    wire    [31:0]      s{slave}_ARADDR;"
+        yield f"    "
+        yield f"    wire                s{slave}_RREADY, s{slave}_RVALID;"
+        yield f"    wire    [1:0]       s{slave}_RRESP;"
+        yield f"    wire    [31:0]      s{slave}_RDATA;"
+        yield f"    "
+        yield f"    "
+
+    # slave memories
+    for slave in range(s):
+        yield f"    /* slave {slave} memory */"
+        yield (
+            f"    wire    [1:0]       slave{slave}_write_resp, slave{slave}_read_resp;"
+        )
+        yield f"    reg     [31:0]      write{slave}_addr, read{slave}_addr;"
+        yield f"    reg     [31:0]      slave{slave}_mem [0:255];"
+        yield f"    wire                slave{slave}_write_data_done;"
+        yield (
+            f"    wire    [31:0]      slave{slave}_read_data, slave{slave}_write_addr, slave{slave}_write_data, slave{slave}_read_addr;"
+        )
+        yield (
+            f"    wire                slave{slave}_write_addr_done, slave{slave}_read_addr_done;"
+        )
+        yield f"    "
+        yield f"    "
+
+    # test control variables
+    yield f"    integer         i;"
+    yield f"    integer         idx, valid_idx, try_idx, found;"
+    yield f"    integer         total_ops = 0;"
+    if address_map or plusargs:
+        yield f"    integer         region;"
+    yield f"    "
+    yield f"    reg             has_written[0:{entries - 1}];"
+    yield f"    reg     [31:0]  addr_list [0:{entries - 1}];"
+    yield f"    reg     [31:0]  data_list [0:{entries - 1}];"
+    yield f"    "
+
+    # runtime knobs
+    if plusargs:
+        yield f"    /* runtime knobs: +OPS=, +SEED=, +WRITE_PCT=, +ADDRS=, +ADDR_WORDS=, +DUMPFILE=, +NODUMP */"
+        yield f"    integer         ops = 50, seed = 0, write_pct = 50, addrs = 25, addr_words = 64;"
+        yield f"    reg     [8*256-1:0] dumpfile;"
+        yield f"    integer         {', '.join(f'm{master}_seed' for master in range(m))};"
+        yield f"    "
+
+    # arbitration statistics
+    if arbiter_stats or traffic:
+        yield f"    integer         masters_done = 0;"
+    if arbiter_stats:
+        for master in range(m):
+            yield (
+                f"    integer         m{master}_ops, m{master}_grants, m{master}_wait, m{master}_max_wait, m{master}_total_wait;"
+            )
+        yield f"    "
+
+    # independent traffic per master
+    if traffic:
+        yield f"    /* traffic knobs: +RATE=, +HOT_PCT= for every master, +M<n>_OPS=, +M<n>_RATE=, +M<n>_HOT=, +M<n>_HOT_PCT= for one */"
+        yield f"    integer         rate = 100, hot_pct = 0;"
+        yield f"    integer         tr_cycles = 0, tr_ops, tr_first, tr_last;"
+        for master in range(m):
+            yield (
+                f"    integer         m{master}_issued, m{master}_op_count, m{master}_rate, m{master}_hot = {master % s}, m{master}_hot_pct, m{master}_region;"
+            )
+            yield f"    integer         m{master}_writes = 0, m{master}_reads = 0, m{master}_first = -1, m{master}_last = 0;"
+        yield f"    "
+
+    # transaction log, written by the loggers after the test sequence
+    if txlog:
+        yield f"    integer         txlog, tx_cycles = 0;"
+        if plusargs:
+            yield f"    reg     [8*256-1:0] txlog_file;"
+        for master in range(m):
+            yield f"    reg     [31:0]  m{master}_tx_awaddr, m{master}_tx_wdata, m{master}_tx_araddr;"
+            yield f"    reg     [3:0]   m{master}_tx_wstrb;"
+            yield f"    integer         m{master}_tx_wstart = -1, m{master}_tx_rstart = -1;"
+        yield f"    "
+
+    # dump window, opened and closed by the window process
+    if dump_window:
+        yield f"    /* dump window: +DUMP_START=, +DUMP_CYCLES=, +DUMP_FROM_OP=, +DUMP_ON_STALL= */"
+        yield f"    integer         dump_start = 0, dump_cycles = 0, dump_from_op = 0, dump_on_stall = 0;"
+        yield f"    integer         dump_state = 0, dump_cycle = 0, dump_until = 0;"
+        yield f"    integer         {', '.join(f'm{master}_dump_wait = 0' for master in range(m))};"
+        yield f"    "
+
+    # bus monitor results, the monitors themselves follow the test sequence
+    if monitors:
+        yield f"    integer         mon_n, mon_sum, mon_span, mon_p50, mon_p99, mon_worst;"
+        yield f"    "
+
+    # operation latency
+    if reg_slice != "none":
+        yield f"    integer         op_cycles = 0, op_count = 0, op_total = 0, op_max = 0;"
+        yield f"    "
+
+    # sustained throughput over all masters
+    if throughput:
+        yield f"    integer         tp_cycles = 0, tp_last = 0, tp_ops = 0;"
+        yield f"    reg             tp_started = 1'b0;"
+        yield f"    "
+
+    # decode error test state
+    if decerr_test:
+        yield f"    integer         cycles = 0, decerr_start, decerr_errors = 0;"
+        yield f"    integer         decerr_write, decerr_read, recovery;"
+        yield f"    reg             decerr_busy = 1'b0;"
+        yield f"    reg     [1:0]   decerr_resp;"
+        yield f"    "
+
+    # instantiate masters
+    for master in range(m):
+        yield f"    axi4_lite_master #("
+        yield f"        .ADDR_WIDTH(32), .DATA_WIDTH(32)"
+        yield f"    ) u_master{master} ("
+        yield f"        .iCLK(iCLK), .iRST(iRST),"
+        yield f"        "
+        yield "        /* write */"
+        yield (
+            f"        .m_AWREADY(m{master}_AWREADY), .m_AWVALID(m{master}_AWVALID), .m_AWPROT(), .m_AWADDR(m{master}_AWADDR),"
+        )
+        yield (
+            f"        .m_WREADY(m{master}_WREADY), .m_WVALID(m{master}_WVALID), .m_WDATA(m{master}_WDATA), .m_WSTRB(m{master}_WSTRB),"
+        )
+        yield (
+            f"        .m_BVALID(m{master}_BVALID), .m_BRESP(m{master}_BRESP), .m_BREADY(m{master}_BREADY),"
+        )
+        yield f"        "
+        yield "        /* read */"
+        yield (
+            f"        .m_ARREADY(m{master}_ARREADY), .m_ARVALID(m{master}_ARVALID), .m_ARPROT(), .m_ARADDR(m{master}_ARADDR),"
+        )
+        yield (
+            f"        .m_RVALID(m{master}_RVALID), .m_RRESP(m{master}_RRESP), .m_RDATA(m{master}_RDATA), .m_RREADY(m{master}_RREADY),"
+        )
+        yield f"        "
+        yield "        /* interfaces */"
+        yield (
+            f"        .write_req(m{master}_write_req), .write_addr(m{master}_write_addr), .write_data(m{master}_write_data), .write_strb(m{master}_write_strb), .write_resp(m{master}_write_resp),"
+        )
+        yield (
+            f"        .read_req(m{master}_read_req), .read_addr(m{master}_read_addr), .read_data(m{master}_read_data), .read_resp(m{master}_read_resp)"
+        )
+        yield f"    );"
+        yield f"    "
+
+    # instantiate slaves
+    for slave in range(s):
+        yield f"    axi4_lite_slave #("
+        yield f"        .ADDR_WIDTH(32), .DATA_WIDTH(32)"
+        yield f"    ) u_slave{slave} ("
+        yield f"        .iCLK(iCLK), .iRST(iRST),"
+        yield f"        "
+        yield "        /* write */"
+        yield (
+            f"        .s_AWVALID(s{slave}_AWVALID), .s_AWPROT(3'b0), .s_AWADDR(s{slave}_AWADDR), .s_AWREADY(s{slave}_AWREADY),"
+        )
+        yield (
+            f"        .s_WVALID(s{slave}_WVALID), .s_WDATA(s{slave}_WDATA), .s_WSTRB(s{slave}_WSTRB), .s_WREADY(s{slave}_WREADY),"
+        )
+        yield (
+            f"        .s_BREADY(s{slave}_BREADY), .s_BVALID(s{slave}_BVALID), .s_BRESP(s{slave}_BRESP),"
+        )
+        yield f"        "
+        yield "        /* read */"
+        yield (
+            f"        .s_ARVALID(s{slave}_ARVALID), .s_ARPROT(3'b0), .s_ARADDR(s{slave}_ARADDR), .s_ARREADY(s{slave}_ARREADY),"
+        )
+        yield (
+            f"        .s_RREADY(s{slave}_RREADY), .s_RVALID(s{slave}_RVALID), .s_RRESP(s{slave}_RRESP), .s_RDATA(s{slave}_RDATA),"
+        )
+        yield f"        "
+        yield "        /* interfaces */"
+        yield (
+            f"        .write_addr(slave{slave}_write_addr), .write_data(slave{slave}_write_data),.write_strb(slave{slave}_write_strb), .write_resp(slave{slave}_write_resp),"
+        )
+        yield (
+            f"        .read_data(slave{slave}_read_data), .read_addr(slave{slave}_read_addr), .read_resp(slave{slave}_read_resp)"
+        )
+        yield f"    );"
+        yield f"    "
+
+    # instantiate interconnect
+    if packed:
+        yield from instantiate_packed(m, s)
+    else:
+        yield f"    axi4_lite_interconnect_m{m}s{s} #("
+        for slave in range(s):
+            yield (
+                f"        .LOW_ADDR{slave}(LOW_ADDR{slave}), .HIGH_ADDR{slave}(HIGH_ADDR{slave}){',' if slave != s-1 else ''}"
+            )
+        yield f"    ) u_interconnect ("
+        yield f"        .iCLK(iCLK), .iRST(iRST),"
+        yield f"        "
+
+        # port connections
+        yield from topology.instance_ports()
+
+        yield f"    );"
+        yield f"    "
+
+    # slave memory models, indexed by the byte address, or for a checked log
+    # by the word. The fabric already hands each slave the offset within its
+    # region
+    def word(addr, slave):
+        return f"{addr} >> 2" if txlog else addr
+
+    for slave in range(s):
+        yield f"    /* slave {slave} memory model */"
+        yield f"    always @(posedge iCLK) begin"
+        yield (
+            f"        if (slave{slave}_write_addr_done) write{slave}_addr <= slave{slave}_write_addr;"
+        )
+        yield (
+            f"        if (slave{slave}_write_data_done) slave{slave}_mem[{word(f'write{slave}_addr', slave)}] <= slave{slave}_write_data;"
+        )
+        yield (
+            f"        if (slave{slave}_read_addr_done) read{slave}_addr <= slave{slave}_read_addr;"
+        )
+        yield f"    end"
+        yield f"    "
+        yield (
+            f"    assign slave{slave}_read_data         = slave{slave}_mem[{word(f'read{slave}_addr', slave)}];"
+        )
+        yield (
+            f"    assign slave{slave}_write_addr_done   = s{slave}_AWVALID && s{slave}_AWREADY;"
+        )
+        yield (
+            f"    assign slave{slave}_write_data_done   = s{slave}_WVALID  && s{slave}_WREADY;"
+        )
+        yield (
+            f"    assign slave{slave}_read_addr_done    = s{slave}_ARVALID && s{slave}_ARREADY;"
+        )
+        yield f"    assign slave{slave}_write_resp        = 2'b00;"
+        yield f"    assign slave{slave}_read_resp         = 2'b00;"
+        yield f"    "
+
+    # clock generation
+    yield f"    initial begin"
+    yield f"        iCLK = 1'b1;"
+    yield f"        forever #(CLK_PERIOD/2) iCLK = ~iCLK;"
+    yield f"    end"
+    yield f"    "
+
+    # initial reset and control signals
+    yield f"    initial begin"
+    yield f"        iRST             = 1'b0;"
+    for master in range(m):
+        yield f"        m{master}_write_req     = 1'b0;"
+        yield f"        m{master}_write_strb    = 4'b0;"
+        yield f"        m{master}_write_addr    = 32'h0;"
+        yield f"        m{master}_write_data    = 32'h0;"
+        yield f"        m{master}_read_req      = 1'b0;"
+        yield f"        m{master}_read_addr     = 32'h0;"
+        if arbiter_stats:
+            yield f"        m{master}_grants        = 0;"
+            yield f"        m{master}_wait          = 0;"
+            yield f"        m{master}_max_wait      = 0;"
+            yield f"        m{master}_total_wait    = 0;"
+    yield f"    "
+    yield f"        /* memory initialization */"
+    for slave in range(s):
+        yield f"        write{slave}_addr      = 32'h0;"
+        yield f"        read{slave}_addr       = 32'h0;"
+    yield f"    end"
+    yield f"    "
+
+    # generate address and data list
+    yield f"    /* generate address and data list */"
+    yield f"    initial begin"
+    if plusargs:
+        # read before anything draws or dumps, the test sequence starts
+        # after reset
+        yield from knob_sequence(m, s, traffic, dump, dump_ports, dump_window, dump_format)
+    yield f"        for (i = 0; i < {entries}; i = i + 1) begin"
+    if plusargs:
+        # every slave's region, within the address window
+        yield f"            region = {rand()} % {s};"
+        yield f"            case (region)"
+        for i, (low, high) in enumerate(topology.regions(0x100)):
+            words = min(64, (high - low + 1) // 4)
+            yield (
+                f"                {i}: addr_list[i] = LOW_ADDR{i} + (({rand()} % ((addr_words < {words}) ? addr_words : {words})) * 4);"
+            )
+        yield f"            endcase"
+    elif address_map:
+        yield f"            region = $urandom % {s};"
+        yield f"            case (region)"
+        for i, (low, high) in enumerate(topology.regions(0x100)):
+            words = min(64, (high - low + 1) // 4)
+            yield f"                {i}: addr_list[i] = LOW_ADDR{i} + (($urandom % {words}) * 4);"
+        yield f"            endcase"
+    else:
+        yield f"            if ($urandom % 2)"
+        yield f"                addr_list[i] = 32'h00000100 + (($urandom % 64) * 4);"
+        yield f"            else"
+        yield f"                addr_list[i] = 32'h00000000 + (($urandom % 64) * 4);"
+    yield f"            "
+    yield f"            data_list[i] = {rand()};"
+    yield f"        end"
+    yield f"    end"
+    yield f"    "
+
+    # test sequence
+    yield f"    /* test case */"
+    yield f"    initial begin"
+    if not plusargs and dump != "none":
+        yield (
+            f'        $dumpfile("logical/sim/axi4_lite_interconnect/axi4_lite_interconnect_m{m}s{s}.{dump_format}");'
+        )
+        yield from dump_vars(m, s, dump, dump_ports, "        ")
+        yield f"    "
+    yield f"        /* init memory */"
+    yield f"        for (i = 0; i < 256; i = i + 1) begin"
+    for slave in range(s):
+        yield f"            slave{slave}_mem[i] = 32'h0;"
+    yield f"        end"
+    yield f"    "
+    yield f"        for (i = 0; i < {entries}; i = i + 1)"
+    yield f"            has_written[i] = 1'b0;"
+    yield f"    "
+    yield f"        #10; iRST = 1'b1;"
+    yield f"    "
+    yield (
+        f'        $display("\\n[INFO] Memulai simulasi AXI4-Lite Interconnect (random read/write)\\n");'
+    )
+    yield f"    "
+    if traffic:
+        # every master runs its own process, master 0 included
+        yield f"        wait (masters_done == {m});"
+        yield f"    "
+        yield from traffic_report(m)
+    else:
+        yield f"        while (total_ops < {ops}) begin"
+        yield f"            if ({write_op()}) begin"
+        yield f"                /* ================== WRITE ================== */"
+        yield f"                "
+        yield f"                idx = {pick()};"
+        yield f"    "
+        yield (
+            f'                $display("[WRITE] Addr = 0x%08h, Data = 0x%08h", addr_list[idx], data_list[idx]);'
+        )
+        yield f"    "
+        yield f"                m0_write_addr       <= addr_list[idx];"
+        yield f"                m0_write_data       <= data_list[idx];"
+        yield f"                m0_write_strb       <= 4'b1111;"
+        yield f"                m0_write_req        <= 1'b1;"
+        yield f"    "
+        yield f"                @(posedge m0_BREADY);"
+        yield f"                    m0_write_req    <= 1'b0;"
+        yield f"    "
+        yield f"                has_written[idx]    = 1'b1;"
+        yield f"    "
+        yield f"            end else begin"
+        yield f"                /* ================== READ ================== */"
+        yield f"                found = 0;"
+        yield f"    "
+        yield f"                repeat (5) begin"
+        yield f"                    try_idx = {pick()};"
+        yield f"    "
+        yield f"                    if (has_written[try_idx]) begin"
+        yield f"                        valid_idx   = try_idx;"
+        yield f"                        found       = 1;"
+        yield f"                    end"
+        yield f"                end"
+        yield f"    "
+        yield f"                if (found) begin"
+        yield (
+            f'                    $display("[READ ] Addr = 0x%08h", addr_list[valid_idx]);'
+        )
+        yield f"    "
+        yield f"                    m0_read_addr    <= addr_list[valid_idx];"
+        yield f"                    m0_read_req     <= 1'b1;"
+        yield f"    "
+        yield f"                    @(posedge m0_RREADY);"
+        yield f"                        m0_read_req <= 1'b0;"
+        yield f"                end else begin"
+        yield (
+            f'                    $display("[SKIP ] Tidak ada alamat yang valid untuk read");'
+        )
+        yield f"                end"
+        yield f"            end"
+        yield f"    "
+        yield f"            total_ops += 1;"
+        yield f"        end"
+        yield f"    "
+    if decerr_test:
+        yield from decerr_sequence()
+    if arbiter_stats:
+        if not traffic:
+            yield f"        wait (masters_done == {m - 1});"
+            yield f"    "
+        yield f'        $display("\\n[STATS] arbitration per master");'
+        for master in range(m):
+            yield (
+                f'        $display("[STATS] m{master}: grants = %0d, mean wait = %0d, worst-case wait = %0d cycles", m{master}_grants, m{master}_total_wait / ((m{master}_grants > 0) ? m{master}_grants : 1), m{master}_max_wait);'
+            )
+        yield f"    "
+    if throughput:
+        yield (
+            f'        $display("\\n[THROUGHPUT] %0d transactions in %0d cycles, one per %0d.%02d cycles", tp_ops, tp_last, tp_last / ((tp_ops > 0) ? tp_ops : 1), (tp_last * 100 / ((tp_ops > 0) ? tp_ops : 1)) % 100);'
+        )
+        yield f"    "
+    if reg_slice != "none":
+        yield (
+            f'        $display("\\n[LATENCY] m0: ops = %0d, mean = %0d, max = %0d cycles (slices add %0d per round trip)", op_count, op_total / ((op_count > 0) ? op_count : 1), op_max, SLICE_LATENCY);'
+        )
+        yield f"    "
+    if monitors:
+        yield from monitor_report(m, s)
+    if txlog:
+        # the last responses may still be on their way
+        idle = " && ".join(f"m{master}_tx_wstart < 0 && m{master}_tx_rstart < 0" for master in range(m))
+        yield f"        wait ({idle});"
+        yield f"        @(posedge iCLK);"
+        yield f"        $fclose(txlog);"
+    yield f'        $display("\\n[INFO] Selesai semua test random read-write\\n");'
+    yield f"        $finish;"
+    yield f"    end"
+    yield f"    "
+
+    # contention traffic and arbitration monitors, --traffic drives every
+    # master instead
+    if arbiter_stats:
+        if not traffic:
+            for master in range(1, m):
+                yield f"    /* master {master} contention traffic */"
+                yield f"    initial begin"
+                yield f"        @(posedge iRST);"
+                yield (
+                    f"        for (m{master}_ops = 0; m{master}_ops < {ops}; m{master}_ops = m{master}_ops + 1) begin"
+                )
+                stream = f"m{master}_seed"
+                yield f"            if ({write_op(stream)}) begin"
+                yield f"                m{master}_write_addr   <= addr_list[{pick(stream)}];"
+                yield f"                m{master}_write_data   <= {rand(stream)};"
+                yield f"                m{master}_write_strb   <= 4'b1111;"
+                yield f"                m{master}_write_req    <= 1'b1;"
+                yield f"    "
+                yield f"                @(posedge m{master}_BREADY);"
+                yield f"                    m{master}_write_req <= 1'b0;"
+                yield f"            end else begin"
+                yield f"                m{master}_read_addr    <= addr_list[{pick(stream)}];"
+                yield f"                m{master}_read_req     <= 1'b1;"
+                yield f"    "
+                yield f"                @(posedge m{master}_RREADY);"
+                yield f"                    m{master}_read_req  <= 1'b0;"
+                yield f"            end"
+                yield f"        end"
+                yield f"        masters_done = masters_done + 1;"
+                yield f"    end"
+                yield f"    "
+
+        for master in range(m):
+            yield f"    /* master {master} arbitration monitor */"
+            yield f"    always @(posedge iCLK) begin"
+            yield (
+                f"        if ((m{master}_AWVALID && m{master}_AWREADY) || (m{master}_ARVALID && m{master}_ARREADY)) begin"
+            )
+            yield f"            m{master}_grants       <= m{master}_grants + 1;"
+            yield f"            m{master}_total_wait   <= m{master}_total_wait + m{master}_wait + 1;"
+            yield f"            m{master}_wait         <= 0;"
+            yield f"            if (m{master}_wait + 1 > m{master}_max_wait)"
+            yield f"                m{master}_max_wait <= m{master}_wait + 1;"
+            yield f"        end else if (m{master}_AWVALID || m{master}_ARVALID)"
+            yield f"            m{master}_wait         <= m{master}_wait + 1;"
+            yield f"    end"
+            yield f"    "
+
+    # independent traffic on every master
+    if traffic:
+        yield from traffic_sequence(m, s, topology.regions(0x100))
+
+    # latency monitor and watchdog
+    if reg_slice != "none":
+        yield f"    /* master 0 latency monitor */"
+        yield f"    always @(posedge iCLK) begin"
+        yield f"        if ((m0_BVALID && m0_BREADY) || (m0_RVALID && m0_RREADY)) begin"
+        yield f"            op_count       <= op_count + 1;"
+        yield f"            op_total       <= op_total + op_cycles + 1;"
+        yield f"            op_cycles      <= 0;"
+        yield f"            if (op_cycles + 1 > op_max)"
+        yield f"                op_max     <= op_cycles + 1;"
+        yield f"        end else if (m0_AWVALID || m0_ARVALID || op_cycles > 0)"
+        yield f"            op_cycles      <= op_cycles + 1;"
+        yield f"    "
+        yield f"        if (op_cycles > OP_TIMEOUT) begin"
+        yield (
+            f'            $display("[ERROR] m0 operation exceeded %0d cycles", OP_TIMEOUT);'
+        )
+        yield f"            $finish;"
+        yield f"        end"
+        yield f"    end"
+        yield f"    "
+
+    # throughput monitor: responses completed on every master, counted from
+    # the first request to the last response
+    if throughput:
+        requests = " || ".join(f"m{master}_AWVALID || m{master}_ARVALID" for master in range(m))
+        yield f"    /* throughput monitor */"
+        yield f"    always @(posedge iCLK) begin"
+        yield f"        if ({requests})"
+        yield f"            tp_started     <= 1'b1;"
+        yield f"        if (tp_started || {requests})"
+        yield f"            tp_cycles      <= tp_cycles + 1;"
+        responses = [
+            f"(m{master}_BVALID && m{master}_BREADY) + (m{master}_RVALID && m{master}_RREADY)"
+            for master in range(m)
+        ]
+        yield f"        tp_ops             <= tp_ops + {' + '.join(responses)};"
+        yield f"        if ({' || '.join(response.replace(' + ', ' || ') for response in responses)})"
+        yield f"            tp_last        <= tp_cycles + 1;"
+        yield f"    end"
+        yield f"    "
+
+    # handshake monitors on every master and slave port
+    if monitors:
+        yield from monitor_sequence(m, s)
+
+    # every completed transaction, for logical.simulation.scoreboard
+    if txlog:
+        yield from txlog_sequence(m, s, plusargs)
+
+    # dumping switched on and off by the window knobs
+    if dump_window:
+        yield from dump_window_sequence(m, traffic)
+
+    # cycle counter and stall watchdog for the decode error test
+    if decerr_test:
+        yield f"    /* decode error watchdog */"
+        yield f"    always @(posedge iCLK) begin"
+        yield f"        cycles             <= cycles + 1;"
+        yield f"        if (decerr_busy && cycles - decerr_start > DECERR_TIMEOUT) begin"
+        yield (
+            f'            $display("[ERROR] bus stalled for %0d cycles after an access to 0x%08h", DECERR_TIMEOUT, UNMAPPED_ADDR);'
+        )
+        yield f"            $finish;"
+        yield f"        end"
+        yield f"    end"
+        yield f"    "
+
+    yield f"endmodule"
+
+
+def generate_tb(topology, **options):
+    return "\n".join(tb_lines(topology, **options))
+
+
+def traffic_sequence(m, s, regions):
+    tb = []
+
+    # the address of a word in a slave's region, wrapped to the region size
+    tb.append(f"    /* address of a word in a slave region */")
+    tb.append(f"    function [31:0] region_addr;")
+    tb.append(f"        input integer region, word;")
+    tb.append(f"        case (region)")
+    for i, (low, high) in enumerate(regions):
+        words = min(64, (high - low + 1) // 4)
+        tb.append(f"            {i}: region_addr = LOW_ADDR{i} + ((word % {words}) * 4);")
+    tb.append(f"            default: region_addr = LOW_ADDR0;")
+    tb.append(f"        endcase")
+    tb.append(f"    endfunction")
+    tb.append(f"    ")
+    tb.append(f"    always @(posedge iCLK)")
+    tb.append(f"        tr_cycles <= tr_cycles + 1;")
+    tb.append(f"    ")
+
+    # one process per master: requests at its own rate, a share of them to
+    # its hot slave and the rest spread over every slave
+    for master in range(m):
+        tb.append(f"    /* master {master} traffic */")
+        tb.append(f"    initial begin")
+        tb.append(f"        @(posedge iRST);")
+        tb.append(
+            f"        for (m{master}_issued = 0; m{master}_issued < m{master}_op_count; m{master}_issued = m{master}_issued + 1) begin"
+        )
+        tb.append(f"            while ({{$random(m{master}_seed)}} % 100 >= m{master}_rate)")
+        tb.append(f"                @(posedge iCLK);")
+        tb.append(f"            if ({{$random(m{master}_seed)}} % 100 < m{master}_hot_pct)")
+        tb.append(f"                m{master}_region = m{master}_hot;")
+        tb.append(f"            else")
+        tb.append(f"                m{master}_region = {{$random(m{master}_seed)}} % {s};")
+        tb.append(f"            if (m{master}_first < 0)")
+        tb.append(f"                m{master}_first = tr_cycles;")
+        tb.append(f"    ")
+        tb.append(f"            if ({{$random(m{master}_seed)}} % 100 < write_pct) begin")
+        tb.append(
+            f"                m{master}_write_addr   <= region_addr(m{master}_region, {{$random(m{master}_seed)}} % addr_words);"
+        )
+        tb.append(f"                m{master}_write_data   <= {{$random(m{master}_seed)}};")
+        tb.append(f"                m{master}_write_strb   <= 4'b1111;")
+        tb.append(f"                m{master}_write_req    <= 1'b1;")
+        tb.append(f"    ")
+        tb.append(f"                @(posedge m{master}_BREADY);")
+        tb.append(f"                    m{master}_write_req <= 1'b0;")
+        tb.append(f"                m{master}_writes       = m{master}_writes + 1;")
+        tb.append(f"            end else begin")
+        tb.append(
+            f"                m{master}_read_addr    <= region_addr(m{master}_region, {{$random(m{master}_seed)}} % addr_words);"
+        )
+        tb.append(f"                m{master}_read_req     <= 1'b1;")
+        tb.append(f"    ")
+        tb.append(f"                @(posedge m{master}_RREADY);")
+        tb.append(f"                    m{master}_read_req  <= 1'b0;")
+        tb.append(f"                m{master}_reads        = m{master}_reads + 1;")
+        tb.append(f"            end")
+        tb.append(f"        end")
+        tb.append(f"        m{master}_last          = tr_cycles;")
+        tb.append(f"        masters_done        = masters_done + 1;")
+        tb.append(f"    end")
+        tb.append(f"    ")
+
+    return tb
+
+
+def traffic_report(m):
+    tb = []
+
+    # per master, then over all masters from the first request to the last
+    tb.append(f'        $display("\\n[TRAFFIC] independent traffic per master");')
+    for master in range(m):
+        tb.append(
+            f'        $display("[TRAFFIC] m{master}: %0d ops (%0d writes, %0d reads) in %0d cycles, rate = %0d%%, %0d%% to slave %0d", '
+            f"m{master}_writes + m{master}_reads, m{master}_writes, m{master}_reads, (m{master}_first < 0) ? 0 : m{master}_last - m{master}_first, "
+            f"m{master}_rate, m{master}_hot_pct, m{master}_hot);"
+        )
+    tb.append(f"        tr_ops              = 0;")
+    tb.append(f"        tr_first            = -1;")
+    tb.append(f"        tr_last             = 0;")
+    for master in range(m):
+        tb.append(f"        tr_ops              = tr_ops + m{master}_writes + m{master}_reads;")
+        tb.append(f"        if (m{master}_first >= 0 && (tr_first < 0 || m{master}_first < tr_first)) tr_first = m{master}_first;")
+        tb.append(f"        if (m{master}_last > tr_last) tr_last = m{master}_last;")
+    tb.append(f"        tr_last             = (tr_first < 0 || tr_last <= tr_first) ? 1 : tr_last - tr_first;")
+    tb.append(
+        f'        $display("[TRAFFIC] all: %0d ops in %0d cycles, %0d.%02d per cycle", tr_ops, tr_last, tr_ops / tr_last, (tr_ops * 100 / tr_last) % 100);'
+    )
+    tb.append(f"    ")
+
+    return tb
+
+
+def monitor_sequence(m, s):
+    tb = []
+    ports = [f"m{master}" for master in range(m)] + [f"s{slave}" for slave in range(s)]
+    channels = 2 * len(ports)
+
+    # channel k = 2 * port + read, ports are the masters then the slaves.
+    # A request is timed from its first valid cycle, its start time waits in
+    # the channel's queue until the response handshake, so responses to
+    # outstanding requests are matched in order
+    tb.append(f"    /* bus monitors: channel = 2 * port + read, masters then slaves */")
+    tb.append(f"    parameter           MON_BINS   = 256;    // latency histogram bins, the last one collects the rest")
+    tb.append(f"    parameter           MON_DEPTH  = 16;     // requests in flight per channel")
+    tb.append(f"    parameter           MON_WINDOW = 64;     // cycles per utilization sample")
+    tb.append(f"    integer         mon_cycles = 0, mon_i;")
+    tb.append(f"    integer         mon_hist [0:{channels} * MON_BINS - 1];")
+    tb.append(f"    integer         mon_start [0:{channels} * MON_DEPTH - 1];")
+    tb.append(f"    integer         mon_head [0:{channels - 1}], mon_tail [0:{channels - 1}], mon_since [0:{channels - 1}];")
+    tb.append(f"    integer         mon_count [0:{channels - 1}], mon_max [0:{channels - 1}], mon_total [0:{channels - 1}];")
+    tb.append(f"    integer         mon_first [0:{channels - 1}], mon_last [0:{channels - 1}];")
+    tb.append(f"    reg             mon_waiting [0:{channels - 1}];")
+    tb.append(f"    integer         mon_window [0:{len(ports) - 1}], mon_util [0:{len(ports)} * 11 - 1];")
+    tb.append(f"    ")
+    tb.append(f"    initial begin")
+    tb.append(f"        for (mon_i = 0; mon_i < {channels} * MON_BINS; mon_i = mon_i + 1)")
+    tb.append(f"            mon_hist[mon_i] = 0;")
+    tb.append(f"        for (mon_i = 0; mon_i < {channels}; mon_i = mon_i + 1) begin")
+    tb.append(f"            mon_head[mon_i]     = 0;")
+    tb.append(f"            mon_tail[mon_i]     = 0;")
+    tb.append(f"            mon_count[mon_i]    = 0;")
+    tb.append(f"            mon_max[mon_i]      = 0;")
+    tb.append(f"            mon_total[mon_i]    = 0;")
+    tb.append(f"            mon_first[mon_i]    = -1;")
+    tb.append(f"            mon_last[mon_i]     = -1;")
+    tb.append(f"            mon_waiting[mon_i]  = 1'b0;")
+    tb.append(f"        end")
+    tb.append(f"        for (mon_i = 0; mon_i < {len(ports)}; mon_i = mon_i + 1)")
+    tb.append(f"            mon_window[mon_i] = 0;")
+    tb.append(f"        for (mon_i = 0; mon_i < {len(ports)} * 11; mon_i = mon_i + 1)")
+    tb.append(f"            mon_util[mon_i] = 0;")
+    tb.append(f"    end")
+    tb.append(f"    ")
+    tb.append(f"    always @(posedge iCLK)")
+    tb.append(f"        mon_cycles <= mon_cycles + 1;")
+    tb.append(f"    ")
+
+    # request and response handshakes of one channel
+    tb.append(f"    task mon_request;")
+    tb.append(f"        input integer k;")
+    tb.append(f"        input valid, ready;")
+    tb.append(f"        begin")
+    tb.append(f"            if (valid && !mon_waiting[k]) begin")
+    tb.append(f"                mon_since[k]    = mon_cycles;")
+    tb.append(f"                mon_waiting[k]  = 1'b1;")
+    tb.append(f"                if (mon_first[k] < 0)")
+    tb.append(f"                    mon_first[k] = mon_cycles;")
+    tb.append(f"            end")
+    tb.append(f"            if (valid && ready) begin")
+    tb.append(f"                mon_start[k * MON_DEPTH + mon_tail[k]] = mon_since[k];")
+    tb.append(f"                mon_tail[k]     = (mon_tail[k] + 1) % MON_DEPTH;")
+    tb.append(f"                mon_waiting[k]  = 1'b0;")
+    tb.append(f"            end")
+    tb.append(f"        end")
+    tb.append(f"    endtask")
+    tb.append(f"    ")
+    tb.append(f"    task mon_response;")
+    tb.append(f"        input integer k;")
+    tb.append(f"        input valid, ready;")
+    tb.append(f"        integer latency;")
+    tb.append(f"        begin")
+    tb.append(f"            if (valid && ready && mon_head[k] != mon_tail[k]) begin")
+    tb.append(f"                latency         = mon_cycles - mon_start[k * MON_DEPTH + mon_head[k]] + 1;")
+    tb.append(f"                mon_head[k]     = (mon_head[k] + 1) % MON_DEPTH;")
+    tb.append(f"                mon_count[k]    = mon_count[k] + 1;")
+    tb.append(f"                mon_last[k]     = mon_cycles;")
+    tb.append(f"                mon_total[k]    = mon_total[k] + latency;")
+    tb.append(f"                if (latency > mon_max[k])")
+    tb.append(f"                    mon_max[k]  = latency;")
+    tb.append(f"                if (latency > MON_BINS - 1)")
+    tb.append(f"                    latency     = MON_BINS - 1;")
+    tb.append(f"                mon_hist[k * MON_BINS + latency] = mon_hist[k * MON_BINS + latency] + 1;")
+    tb.append(f"            end")
+    tb.append(f"        end")
+    tb.append(f"    endtask")
+    tb.append(f"    ")
+
+    # utilization: cycles with a request waiting or in flight, binned in 10%
+    # steps every MON_WINDOW cycles
+    tb.append(f"    task mon_busy;")
+    tb.append(f"        input integer p;")
+    tb.append(f"        begin")
+    tb.append(
+        f"            if (mon_waiting[2 * p] || mon_waiting[2 * p + 1] || mon_head[2 * p] != mon_tail[2 * p] || mon_head[2 * p + 1] != mon_tail[2 * p + 1])"
+    )
+    tb.append(f"                mon_window[p]   = mon_window[p] + 1;")
+    tb.append(f"            if (mon_cycles % MON_WINDOW == MON_WINDOW - 1) begin")
+    tb.append(f"                mon_util[p * 11 + mon_window[p] * 10 / MON_WINDOW] = mon_util[p * 11 + mon_window[p] * 10 / MON_WINDOW] + 1;")
+    tb.append(f"                mon_window[p]   = 0;")
+    tb.append(f"            end")
+    tb.append(f"        end")
+    tb.append(f"    endtask")
+    tb.append(f"    ")
+
+    for p, port in enumerate(ports):
+        tb.append(f"    /* {port} monitor */")
+        tb.append(f"    always @(posedge iCLK) begin")
+        tb.append(f"        mon_request({2 * p}, {port}_AWVALID, {port}_AWREADY);")
+        tb.append(f"        mon_response({2 * p}, {port}_BVALID, {port}_BREADY);")
+        tb.append(f"        mon_request({2 * p + 1}, {port}_ARVALID, {port}_ARREADY);")
+        tb.append(f"        mon_response({2 * p + 1}, {port}_RVALID, {port}_RREADY);")
+        tb.append(f"        mon_busy({p});")
+        tb.append(f"    end")
+        tb.append(f"    ")
+
+    # percentiles from a channel range's histograms, so one task serves a
+    # single channel and all master channels together
+    tb.append(f"    task mon_latency;")
+    tb.append(f"        input integer first, last;")
+    tb.append(f"        output integer count, total, p50, p99, max;")
+    tb.append(f"        integer k, bin, seen;")
+    tb.append(f"        begin")
+    tb.append(f"            count = 0;")
+    tb.append(f"            total = 0;")
+    tb.append(f"            max = 0;")
+    tb.append(f"            for (k = first; k <= last; k = k + 1) begin")
+    tb.append(f"                count = count + mon_count[k];")
+    tb.append(f"                total = total + mon_total[k];")
+    tb.append(f"                if (mon_max[k] > max)")
+    tb.append(f"                    max = mon_max[k];")
+    tb.append(f"            end")
+    tb.append(f"            seen = 0;")
+    tb.append(f"            p50 = -1;")
+    tb.append(f"            p99 = -1;")
+    tb.append(f"            for (bin = 0; bin < MON_BINS; bin = bin + 1) begin")
+    tb.append(f"                for (k = first; k <= last; k = k + 1)")
+    tb.append(f"                    seen = seen + mon_hist[k * MON_BINS + bin];")
+    tb.append(f"                if (p50 < 0 && seen * 100 >= count * 50)")
+    tb.append(f"                    p50 = bin;")
+    tb.append(f"                if (p99 < 0 && seen * 100 >= count * 99)")
+    tb.append(f"                    p99 = bin;")
+    tb.append(f"            end")
+    tb.append(f"        end")
+    tb.append(f"    endtask")
+    tb.append(f"    ")
+
+    # transactions per cycle from the first request to the last response
+    tb.append(f"    task mon_rate;")
+    tb.append(f"        input integer first, last;")
+    tb.append(f"        output integer count, cycles;")
+    tb.append(f"        integer k, start, stop;")
+    tb.append(f"        begin")
+    tb.append(f"            count = 0;")
+    tb.append(f"            start = -1;")
+    tb.append(f"            stop = 0;")
+    tb.append(f"            for (k = first; k <= last; k = k + 1) begin")
+    tb.append(f"                count = count + mon_count[k];")
+    tb.append(f"                if (mon_first[k] >= 0 && (start < 0 || mon_first[k] < start))")
+    tb.append(f"                    start = mon_first[k];")
+    tb.append(f"                if (mon_last[k] > stop)")
+    tb.append(f"                    stop = mon_last[k];")
+    tb.append(f"            end")
+    tb.append(f"            cycles = (start < 0 || stop < start) ? 1 : stop - start + 1;")
+    tb.append(f"        end")
+    tb.append(f"    endtask")
+    tb.append(f"    ")
+
+    return tb
+
+
+def monitor_report(m, s):
+    tb = []
+    ports = [f"m{master}" for master in range(m)] + [f"s{slave}" for slave in range(s)]
+
+    # the stimulus moves on at the ready edge, so wait for the last responses
+    # to reach the masters before counting them
+    drained = " && ".join(f"mon_head[{k}] == mon_tail[{k}]" for k in range(2 * m))
+    tb.append(f"        wait ({drained});")
+    tb.append(f"        @(posedge iCLK);")
+
+    mean = "mon_sum / ((mon_n > 0) ? mon_n : 1), (mon_sum * 100 / ((mon_n > 0) ? mon_n : 1)) % 100"
+
+    # latency per channel, rate per port and over all masters, utilization
+    # as windows per 10% bin from idle to saturated
+    tb.append(f'        $display("\\n[MONITOR] latency in cycles from request valid to response handshake");')
+    for p, port in enumerate(ports):
+        for k, label in ((2 * p, "write"), (2 * p + 1, "read ")):
+            tb.append(f"        mon_latency({k}, {k}, mon_n, mon_sum, mon_p50, mon_p99, mon_worst);")
+            tb.append(
+                f'        $display("[MONITOR] {port} {label}: %0d transactions, mean = %0d.%02d, p50 = %0d, p99 = %0d, max = %0d", mon_n, {mean}, mon_p50, mon_p99, mon_worst);'
+            )
+    tb.append(f"        mon_latency(0, {2 * m - 1}, mon_n, mon_sum, mon_p50, mon_p99, mon_worst);")
+    tb.append(
+        f'        $display("[MONITOR] all masters: %0d transactions, mean = %0d.%02d, p50 = %0d, p99 = %0d, max = %0d", mon_n, {mean}, mon_p50, mon_p99, mon_worst);'
+    )
+    tb.append(f"    ")
+    tb.append(f'        $display("\\n[MONITOR] transactions per cycle from first request to last response");')
+    for p, port in enumerate(ports):
+        tb.append(f"        mon_rate({2 * p}, {2 * p + 1}, mon_n, mon_span);")
+        tb.append(
+            f'        $display("[MONITOR] {port}: %0d in %0d cycles, %0d.%02d per cycle", mon_n, mon_span, mon_n / mon_span, (mon_n * 100 / mon_span) % 100);'
+        )
+    tb.append(f"        mon_rate(0, {2 * m - 1}, mon_n, mon_span);")
+    tb.append(
+        f'        $display("[MONITOR] all masters: %0d in %0d cycles, %0d.%02d per cycle", mon_n, mon_span, mon_n / mon_span, (mon_n * 100 / mon_span) % 100);'
+    )
+    tb.append(f"    ")
+    tb.append(f'        $display("\\n[MONITOR] utilization, %0d-cycle windows per 10%% bin from 0%% to 100%% busy", MON_WINDOW);')
+    for p, port in enumerate(ports):
+        bins = ", ".join(f"mon_util[{p * 11 + b}]" for b in range(11))
+        tb.append(f'        $display("[MONITOR] {port}: {" ".join(["%0d"] * 11)}", {bins});')
+    tb.append(f"    ")
+
+    return tb
+
+
+def txlog_sequence(m, s, plusargs):
+    tb = []
+    path = f"logical/sim/axi4_lite_interconnect/axi4_lite_interconnect_m{m}s{s}.txlog"
+
+    # header: magic, version, masters, slaves and every slave's region. Then
+    # one record of five little endian words per transaction completed at a
+    # master: start and end cycle, kind, address and data, the layout that
+    # logical/simulation/scoreboard.py reads
+    tb.append(f"    /* transaction log: start, end, {{read, master, resp, strb}}, address, data */")
+    tb.append(f"    initial begin")
+    if plusargs:
+        tb.append(f'        if (!$value$plusargs("TXLOG=%s", txlog_file))')
+        tb.append(f'            txlog_file = "{path}";')
+        tb.append(f'        txlog = $fopen(txlog_file, "wb");')
+    else:
+        tb.append(f'        txlog = $fopen("{path}", "wb");')
+    tb.append(f'        $fwrite(txlog, "%u%u%u%u", 32\'h4c545841, 32\'d1, 32\'d{m}, 32\'d{s});')
+    for slave in range(s):
+        tb.append(f'        $fwrite(txlog, "%u%u", LOW_ADDR{slave}, HIGH_ADDR{slave});')
+    tb.append(f"    end")
+    tb.append(f"    ")
+    tb.append(f"    always @(posedge iCLK)")
+    tb.append(f"        tx_cycles <= tx_cycles + 1;")
+    tb.append(f"    ")
+
+    # a transaction starts at its first valid cycle and is logged at its
+    # response handshake, with the address and data of its own handshakes
+    for master in range(m):
+        tb.append(f"    /* master {master} logger */")
+        tb.append(f"    always @(posedge iCLK) begin")
+        tb.append(f"        if (m{master}_AWVALID && m{master}_tx_wstart < 0)")
+        tb.append(f"            m{master}_tx_wstart = tx_cycles;")
+        tb.append(f"        if (m{master}_AWVALID && m{master}_AWREADY)")
+        tb.append(f"            m{master}_tx_awaddr = m{master}_AWADDR;")
+        tb.append(f"        if (m{master}_WVALID && m{master}_WREADY) begin")
+        tb.append(f"            m{master}_tx_wdata  = m{master}_WDATA;")
+        tb.append(f"            m{master}_tx_wstrb  = m{master}_WSTRB;")
+        tb.append(f"        end")
+        tb.append(f"        if (m{master}_BVALID && m{master}_BREADY) begin")
+        tb.append(
+            f'            $fwrite(txlog, "%u%u%u%u%u", m{master}_tx_wstart, tx_cycles, {{8\'d0, 8\'d{master}, 6\'d0, m{master}_BRESP, 4\'d0, m{master}_tx_wstrb}}, m{master}_tx_awaddr, m{master}_tx_wdata);'
+        )
+        tb.append(f"            m{master}_tx_wstart = -1;")
+        tb.append(f"        end")
+        tb.append(f"        if (m{master}_ARVALID && m{master}_tx_rstart < 0)")
+        tb.append(f"            m{master}_tx_rstart = tx_cycles;")
+        tb.append(f"        if (m{master}_ARVALID && m{master}_ARREADY)")
+        tb.append(f"            m{master}_tx_araddr = m{master}_ARADDR;")
+        tb.append(f"        if (m{master}_RVALID && m{master}_RREADY) begin")
+        tb.append(
+            f'            $fwrite(txlog, "%u%u%u%u%u", m{master}_tx_rstart, tx_cycles, {{8\'h80, 8\'d{master}, 6\'d0, m{master}_RRESP, 8\'d0}}, m{master}_tx_araddr, m{master}_RDATA);'
+        )
+        tb.append(f"            m{master}_tx_rstart = -1;")
+        tb.append(f"        end")
+        tb.append(f"    end")
+        tb.append(f"    ")
+
+    return tb
+
+
+def knob_sequence(m, s, traffic=False, dump="all", dump_ports=None, dump_window=False, dump_format="vcd"):
+    tb = []
+
+    # plusargs override the defaults, out of range values are clamped
+    tb.append(f'        if ($value$plusargs("OPS=%d", ops) && ops < 0) ops = 0;')
+    tb.append(f'        if (!$value$plusargs("SEED=%d", seed)) seed = 0;')
+    for master in range(m):
+        tb.append(f"        {f'm{master}_seed':<17}= seed + {master};")
+    tb.append(f'        if ($value$plusargs("WRITE_PCT=%d", write_pct) && (write_pct < 0 || write_pct > 100))')
+    tb.append(f"            write_pct = (write_pct < 0) ? 0 : 100;")
+    tb.append(f'        if ($value$plusargs("ADDRS=%d", addrs) && (addrs < 1 || addrs > 256))')
+    tb.append(f"            addrs = (addrs < 1) ? 1 : 256;")
+    tb.append(f'        if ($value$plusargs("ADDR_WORDS=%d", addr_words) && (addr_words < 1 || addr_words > 64))')
+    tb.append(f"            addr_words = (addr_words < 1) ? 1 : 64;")
+    tb.append(f"    ")
+    if traffic:
+        tb.append(f'        if ($value$plusargs("RATE=%d", rate) && (rate < 1 || rate > 100))')
+        tb.append(f"            rate = (rate < 1) ? 1 : 100;")
+        tb.append(f'        if ($value$plusargs("HOT_PCT=%d", hot_pct) && (hot_pct < 0 || hot_pct > 100))')
+        tb.append(f"            hot_pct = (hot_pct < 0) ? 0 : 100;")
+        for master in range(m):
+            tb.append(f"        m{master}_op_count      = ops;")
+            tb.append(f"        m{master}_rate          = rate;")
+            tb.append(f"        m{master}_hot_pct       = hot_pct;")
+            tb.append(f'        if ($value$plusargs("M{master}_OPS=%d", m{master}_op_count) && m{master}_op_count < 0) m{master}_op_count = 0;')
+            tb.append(f'        if ($value$plusargs("M{master}_RATE=%d", m{master}_rate) && (m{master}_rate < 1 || m{master}_rate > 100))')
+            tb.append(f"            m{master}_rate = (m{master}_rate < 1) ? 1 : 100;")
+            tb.append(f'        if ($value$plusargs("M{master}_HOT=%d", m{master}_hot) && (m{master}_hot < 0 || m{master}_hot > {s - 1}))')
+            tb.append(f"            m{master}_hot = (m{master}_hot < 0) ? 0 : {s - 1};")
+            tb.append(f'        if ($value$plusargs("M{master}_HOT_PCT=%d", m{master}_hot_pct) && (m{master}_hot_pct < 0 || m{master}_hot_pct > 100))')
+            tb.append(f"            m{master}_hot_pct = (m{master}_hot_pct < 0) ? 0 : 100;")
+        tb.append(f"    ")
+    if dump_window:
+        tb.append(f'        if ($value$plusargs("DUMP_START=%d", dump_start) && dump_start < 0) dump_start = 0;')
+        tb.append(f'        if ($value$plusargs("DUMP_CYCLES=%d", dump_cycles) && dump_cycles < 0) dump_cycles = 0;')
+        tb.append(f'        if ($value$plusargs("DUMP_FROM_OP=%d", dump_from_op) && dump_from_op < 0) dump_from_op = 0;')
+        tb.append(f'        if ($value$plusargs("DUMP_ON_STALL=%d", dump_on_stall) && dump_on_stall < 0) dump_on_stall = 0;')
+        tb.append(f"    ")
+    if dump != "none":
+        tb.append(f'        if (!$test$plusargs("NODUMP")) begin')
+        tb.append(f'            if (!$value$plusargs("DUMPFILE=%s", dumpfile))')
+        tb.append(f'                dumpfile = "logical/sim/axi4_lite_interconnect/axi4_lite_interconnect_m{m}s{s}.{dump_format}";')
+        tb.append(f"            $dumpfile(dumpfile);")
+        tb.extend(dump_vars(m, s, dump, dump_ports, "            "))
+        if dump_window:
+            # off until a start knob triggers, or on from the start for
+            # +DUMP_CYCLES alone
+            tb.append(f"            if (dump_start > 0 || dump_from_op > 0 || dump_on_stall > 0) begin")
+            tb.append(f"                $dumpoff;")
+            tb.append(f"                dump_state = 1;")
+            tb.append(f"            end else begin")
+            tb.append(f"                dump_state = 2;")
+            tb.append(f"                dump_until = dump_cycles;")
+            tb.append(f"            end")
+        tb.append(f"        end")
+    tb.append(
+        f'        $display("[INFO] ops = %0d, seed = %0d, write = %0d%%, addresses = %0d, window = %0d words", ops, seed, write_pct, addrs, addr_words);'
+    )
+    tb.append(f"    ")
+
+    return tb
+
+
+def dump_vars(m, s, dump="all", dump_ports=None, indent="        "):
+    tb = []
+
+    # every net below the testbench, or only the clock, reset and the port
+    # signals of the chosen masters and slaves
+    if dump == "all":
+        tb.append(f"{indent}$dumpvars(0, tb_axi4_lite_interconnect_m{m}s{s});")
+        return tb
+    ports = dump_ports or [f"m{master}" for master in range(m)] + [f"s{slave}" for slave in range(s)]
+    signals = ["iCLK", "iRST"]
+    for port in ports:
+        signals += [f"{port}_{sig}" for sig in PORT_SIGNALS]
+    tb.append(f"{indent}$dumpvars(1,")
+    for i in range(0, len(signals), 6):
+        last = i + 6 >= len(signals)
+        tb.append(f"{indent}    {', '.join(signals[i : i + 6])}{');' if last else ','}")
+
+    return tb
+
+
+def dump_window_sequence(m, traffic=False):
+    tb = []
+
+    # transactions issued so far and the longest wait for READY on a request
+    # channel, any master
+    issued = " + ".join(f"m{master}_issued" for master in range(m)) if traffic else "total_ops"
+    stalled = " || ".join(f"m{master}_dump_wait >= dump_on_stall" for master in range(m))
+
+    tb.append(f"    /* dump window */")
+    tb.append(f"    always @(posedge iCLK) begin")
+    tb.append(f"        dump_cycle         <= dump_cycle + 1;")
+    for master in range(m):
+        waiting = " || ".join(f"(m{master}_{channel}VALID && !m{master}_{channel}READY)" for channel in ("AW", "W", "AR"))
+        tb.append(f"        {f'm{master}_dump_wait':<19}<= ({waiting}) ? m{master}_dump_wait + 1 : 0;")
+    tb.append(f"    ")
+    tb.append(
+        f"        if (dump_state == 1 && ((dump_start > 0 && dump_cycle >= dump_start) || (dump_from_op > 0 && {issued} >= dump_from_op) ||"
+    )
+    tb.append(f"                (dump_on_stall > 0 && ({stalled})))) begin")
+    tb.append(f"            $dumpon;")
+    tb.append(f"            dump_state     <= 2;")
+    tb.append(f"            dump_until     <= dump_cycle + dump_cycles;")
+    tb.append(f'            $display("[DUMP] dumping from cycle %0d", dump_cycle);')
+    tb.append(f"        end else if (dump_state == 2 && dump_cycles > 0 && dump_cycle >= dump_until) begin")
+    tb.append(f"            $dumpoff;")
+    tb.append(f"            dump_state     <= 3;")
+    tb.append(f'            $display("[DUMP] dumping stopped at cycle %0d", dump_cycle);')
+    tb.append(f"        end")
+    tb.append(f"    end")
+    tb.append(f"    ")
+
+    return tb
+
+
+def decerr_sequence():
+    tb = []
+
+    # unmapped write and read on master 0 must end in DECERR, then a mapped
+    # write and read back must complete: the bus stayed live
+    tb.append(f'        $display("\\n[DECERR] m0 access to unmapped 0x%08h", UNMAPPED_ADDR);')
+    tb.append(f"        decerr_busy         = 1'b1;")
+    tb.append(f"        decerr_start        = cycles;")
+    tb.append(f"        m0_write_addr       <= UNMAPPED_ADDR;")
+    tb.append(f"        m0_write_data       <= 32'hdead_beef;")
+    tb.append(f"        m0_write_strb       <= 4'b1111;")
+    tb.append(f"        m0_write_req        <= 1'b1;")
+    tb.append(f"    ")
+    tb.append(f"        @(posedge m0_BREADY);")
+    tb.append(f"            m0_write_req    <= 1'b0;")
+    tb.append(f"        wait (m0_BVALID);")
+    tb.append(f"        decerr_resp         = m0_BRESP;")
+    tb.append(f"        @(posedge iCLK);")
+    tb.append(f"        decerr_write        = cycles - decerr_start;")
+    tb.append(f"        if (decerr_resp !== 2'b11) begin")
+    tb.append(f"            decerr_errors   = decerr_errors + 1;")
+    tb.append(f'            $display("[ERROR] unmapped write: BRESP = %b, DECERR expected", decerr_resp);')
+    tb.append(f"        end")
+    tb.append(f"    ")
+    tb.append(f"        decerr_start        = cycles;")
+    tb.append(f"        m0_read_addr        <= UNMAPPED_ADDR;")
+    tb.append(f"        m0_read_req         <= 1'b1;")
+    tb.append(f"    ")
+    tb.append(f"        @(posedge m0_RREADY);")
+    tb.append(f"            m0_read_req     <= 1'b0;")
+    tb.append(f"        wait (m0_RVALID);")
+    tb.append(f"        decerr_resp         = m0_RRESP;")
+    tb.append(f"        @(posedge iCLK);")
+    tb.append(f"        decerr_read         = cycles - decerr_start;")
+    tb.append(f"        if (decerr_resp !== 2'b11) begin")
+    tb.append(f"            decerr_errors   = decerr_errors + 1;")
+    tb.append(f'            $display("[ERROR] unmapped read: RRESP = %b, DECERR expected", decerr_resp);')
+    tb.append(f"        end")
+    tb.append(f"    ")
+    tb.append(f"        /* recovery: mapped write and read back */")
+    tb.append(f"        decerr_start        = cycles;")
+    tb.append(f"        m0_write_addr       <= addr_list[0];")
+    tb.append(f"        m0_write_data       <= data_list[0];")
+    tb.append(f"        m0_write_strb       <= 4'b1111;")
+    tb.append(f"        m0_write_req        <= 1'b1;")
+    tb.append(f"    ")
+    tb.append(f"        @(posedge m0_BREADY);")
+    tb.append(f"            m0_write_req    <= 1'b0;")
+    tb.append(f"        wait (m0_BVALID);")
+    tb.append(f"        @(posedge iCLK);")
+    tb.append(f"        m0_read_addr        <= addr_list[0];")
+    tb.append(f"        m0_read_req         <= 1'b1;")
+    tb.append(f"    ")
+    tb.append(f"        @(posedge m0_RREADY);")
+    tb.append(f"            m0_read_req     <= 1'b0;")
+    tb.append(f"        wait (m0_RVALID);")
+    tb.append(f"        if (m0_RRESP !== 2'b00 || m0_RDATA !== data_list[0]) begin")
+    tb.append(f"            decerr_errors   = decerr_errors + 1;")
+    tb.append(
+        f'            $display("[ERROR] recovery read 0x%08h: RRESP = %b, data = 0x%08h, 0x%08h expected", addr_list[0], m0_RRESP, m0_RDATA, data_list[0]);'
+    )
+    tb.append(f"        end")
+    tb.append(f"        @(posedge iCLK);")
+    tb.append(f"        recovery            = cycles - decerr_start;")
+    tb.append(f"        decerr_busy         = 1'b0;")
+    tb.append(f"    ")
+    tb.append(
+        f'        $display("[DECERR] m0: write = %0d, read = %0d cycles to DECERR, recovery = %0d cycles for a mapped write and read", decerr_write, decerr_read, recovery);'
+    )
+    tb.append(f'        $display("[DECERR] %0d errors", decerr_errors);')
+    tb.append(f"    ")
+
+    return tb
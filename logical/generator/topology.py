@@ -0,0 +1,145 @@
+import json
+
+
+ARBITERS = ["fixed", "rr", "weighted", "lru"]
+REG_SLICES = ["none", "forward", "backward", "full"]
+SLICE_PORTS = ["master", "slave", "both"]
+MUXES = ["priority", "onehot"]
+
+# channels as (name, flows from master to slave, payload signals and widths)
+CHANNELS = (
+    ("AW", True, (("AWADDR", "ADDR_WIDTH"),)),
+    ("W", True, (("WSTRB", "(DATA_WIDTH/8)"), ("WDATA", "DATA_WIDTH"))),
+    ("B", False, (("BRESP", "2"),)),
+    ("AR", True, (("ARADDR", "ADDR_WIDTH"),)),
+    ("R", False, (("RRESP", "2"), ("RDATA", "DATA_WIDTH"))),
+)
+
+
+def load_address_map(path, s):
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML address maps need PyYAML, use JSON or 'pip install pyyaml'")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    # one region per slave, in slave order: base plus size or high
+    regions = []
+    for i, entry in enumerate(data["slaves"]):
+        name = entry.get("name", f"s{i}")
+        low = int(str(entry["base"]), 0)
+        if "high" in entry:
+            high = int(str(entry["high"]), 0)
+        else:
+            high = low + int(str(entry["size"]), 0) - 1
+        if high < low or high > 0xFFFFFFFF:
+            raise ValueError(f"Region '{name}' is empty or outside the 32-bit address space")
+        regions.append((name, low, high))
+    if len(regions) != s:
+        raise ValueError(f"Address map has {len(regions)} regions, {s} slaves expected")
+    return regions
+
+
+def check_address_map(regions):
+    # overlaps are fatal, gaps between regions are returned for a warning
+    gaps = []
+    ordered = sorted(regions, key=lambda region: region[1])
+    for (name_a, _, high_a), (name_b, low_b, _) in zip(ordered, ordered[1:]):
+        if low_b <= high_a:
+            raise ValueError(f"Regions '{name_a}' and '{name_b}' overlap at 0x{low_b:08x}")
+        if low_b > high_a + 1:
+            gaps.append((name_a, name_b, high_a + 1, low_b - 1))
+    return gaps
+
+
+def region_mask(low, high):
+    # base/mask decode for power-of-two sized, size-aligned regions
+    size = high - low + 1
+    if size & (size - 1) or low % size:
+        return None
+    return ~(size - 1) & 0xFFFFFFFF
+
+
+def hex32(value):
+    return f"32'h{value >> 16:04x}_{value & 0xFFFF:04x}"
+
+
+class Topology:
+    # masters, slaves and address map of one interconnect, shared by the rtl,
+    # wrapper and testbench emitters so every output agrees on them
+
+    def __init__(self, m, s, address_map=None):
+        if m < 1 or s < 1:
+            raise ValueError("At least one master and one slave are needed")
+        self.m = m
+        self.s = s
+        self.address_map = address_map
+        self.name = f"m{m}s{s}"
+        self.masters = [f"m{master}" for master in range(m)]
+        self.slaves = [f"s{slave}" for slave in range(s)]
+
+    @classmethod
+    def parse(cls, config, address_map=None):
+        if not config.startswith("m") or "s" not in config:
+            raise ValueError("Format must be 'm{n}s{n}', example: m2s1")
+        m_part, s_part = config[1:].split("s")
+        m, s = int(m_part), int(s_part)
+        regions = load_address_map(address_map, s) if address_map else None
+        return cls(m, s, regions)
+
+    def gaps(self):
+        return check_address_map(self.address_map) if self.address_map else []
+
+    def regions(self, stride):
+        # (low, high) per slave: the address map, or consecutive blocks of stride
+        if self.address_map:
+            return [(low, high) for _, low, high in self.address_map]
+        return [(slave * stride, slave * stride + stride - 1) for slave in range(self.s)]
+
+    def instance_ports(self):
+        # named port connections of the scalar interconnect, one line per channel group
+        lines = []
+        for master in self.masters:
+            lines.append(f"        /* master {master[1:]} signals */")
+            lines.append(
+                f"        .{master}_AWVALID({master}_AWVALID), .{master}_AWADDR({master}_AWADDR), .{master}_AWREADY({master}_AWREADY),"
+            )
+            lines.append(
+                f"        .{master}_WVALID({master}_WVALID), .{master}_WSTRB({master}_WSTRB), .{master}_WDATA({master}_WDATA), .{master}_WREADY({master}_WREADY),"
+            )
+            lines.append(
+                f"        .{master}_BREADY({master}_BREADY), .{master}_BVALID({master}_BVALID), .{master}_BRESP({master}_BRESP),"
+            )
+            lines.append(
+                f"        .{master}_ARVALID({master}_ARVALID), .{master}_ARADDR({master}_ARADDR), .{master}_ARREADY({master}_ARREADY),"
+            )
+            lines.append(
+                f"        .{master}_RREADY({master}_RREADY), .{master}_RVALID({master}_RVALID), .{master}_RRESP({master}_RRESP), .{master}_RDATA({master}_RDATA),"
+            )
+            lines.append("")
+        for slave in self.slaves:
+            lines.append(f"        /* slave {slave[1:]} signals */")
+            lines.append(
+                f"        .{slave}_AWREADY({slave}_AWREADY), .{slave}_AWVALID({slave}_AWVALID), .{slave}_AWADDR({slave}_AWADDR),"
+            )
+            lines.append(
+                f"        .{slave}_WREADY({slave}_WREADY), .{slave}_WVALID({slave}_WVALID), .{slave}_WSTRB({slave}_WSTRB), .{slave}_WDATA({slave}_WDATA),"
+            )
+            lines.append(
+                f"        .{slave}_BVALID({slave}_BVALID), .{slave}_BRESP({slave}_BRESP), .{slave}_BREADY({slave}_BREADY),"
+            )
+            lines.append(
+                f"        .{slave}_ARREADY({slave}_ARREADY), .{slave}_ARVALID({slave}_ARVALID), .{slave}_ARADDR({slave}_ARADDR),"
+            )
+            lines.append(
+                f"        .{slave}_RVALID({slave}_RVALID), .{slave}_RRESP({slave}_RRESP), .{slave}_RDATA({slave}_RDATA), .{slave}_RREADY({slave}_RREADY),"
+            )
+            lines.append("")
+        # no separator after the last connection
+        lines.pop()
+        lines[-1] = lines[-1][:-1]
+        return lines
@@ -0,0 +1,175 @@
+from .topology import hex32
+
+
+def wrapper_lines(topology):
+    m, s = topology.m, topology.s
+
+    # header
+    yield f"module wrapper_axi4_lite_interconnect_m{m}s{s} #("
+
+    # parameters
+    yield f"    /* parameters */"
+    yield "    parameter ADDR_WIDTH    = 32,"
+    yield "    parameter DATA_WIDTH    = 32"
+    yield ""
+
+    # generate address parameters for each slave
+    yield f"    /* address parameters */"
+    for i, (low, high) in enumerate(topology.regions(0x10000)):
+        yield f"    parameter LOW_ADDR{i}     = {hex32(low)},"
+        yield (
+            f"    parameter HIGH_ADDR{i}    = {hex32(high)}{',' if i != s-1 else ''}"
+        )
+
+    yield ") ("
+
+    yield f"    /* input */"
+    yield f"    input                           iCLK, iRST,"
+    yield f""
+    yield f"    /* output */"
+    yield f"    output  [ADDR_WIDTH-1:0]        ADDR,"
+    yield f"    output  [DATA_WIDTH-1:0]        DATA"
+    yield f");"
+    yield f"    "
+
+    # master signals
+    for master in range(m):
+        yield f"    /* master {master} signals */"
+        yield (
+            f"    wire                            m{master}_AWVALID, m{master}_AWREADY;"
+        )
+        yield f"    wire    [ADDR_WIDTH-1:0]        m{master}_AWADDR;"
+        yield f"    "
+        yield (
+            f"    wire                            m{master}_WVALID, m{master}_WREADY;"
+        )
+        yield f"    wire    [(DATA_WIDTH/8)-1:0]    m{master}_WSTRB;"
+        yield f"    wire    [DATA_WIDTH-1:0]        m{master}_WDATA;"
+        yield f"    "
+        yield (
+            f"    wire                            m{master}_BREADY, m{master}_BVALID;"
+        )
+        yield f"    wire    [1:0]                   m{master}_BRESP;"
+        yield f"    "
+        yield (
+            f"    wire                            m{master}_ARVALID, m{master}_ARREADY;"
+        )
+        yield f"    wire    [ADDR_WIDTH-1:0]        m{master}_ARADDR;"
+        yield f"    "
+        yield (
+            f"    wire                            m{master}_RREADY, m{master}_RVALID;"
+        )
+        yield f"    wire    [1:0]                   m{master}_RRESP;"
+        yield f"    wire    [DATA_WIDTH-1:0]        m{master}_RDATA;"
+        yield f"    "
+        yield f"    "
+
+    # slave signals
+    for slave in range(s):
+        yield f"    /* slave {slave} signals */"
+        yield (
+            f"    wire                            s{slave}_AWVALID, s{slave}_AWREADY;"
+        )
+        yield f"    wire    [ADDR_WIDTH-1:0]        s{slave}_AWADDR;"
+        yield f"    "
+        yield (
+            f"    wire                            s{slave}_WVALID, s{slave}_WREADY;"
+        )
+        yield f"    wire    [(DATA_WIDTH/8)-1:0]    s{slave}_WSTRB;"
+        yield f"    wire    [DATA_WIDTH-1:0]        s{slave}_WDATA;"
+        yield f"    "
+        yield (
+            f"    wire                            s{slave}_BREADY, s{slave}_BVALID;"
+        )
+        yield f"    wire    [1:0]                   s{slave}_BRESP;"
+        yield f"    "
+        yield (
+            f"    wire                            s{slave}_ARVALID, s{slave}_ARREADY;"
+        )
+        yield f"    wire    [ADDR_WIDTH-1:0]        s{slave}_ARADDR;"
+        yield f"    "
+        yield (
+            f"    wire                            s{slave}_RREADY, s{slave}_RVALID;"
+        )
+        yield f"    wire    [1:0]                   s{slave}_RRESP;"
+        yield f"    wire    [DATA_WIDTH-1:0]        s{slave}_RDATA;"
+        yield f"    "
+        yield f"    "
+
+    # instantiate masters
+    for master in range(m):
+        yield f"    axi4_lite_master_wrapper #("
+        yield f"        .ADDR_WIDTH(ADDR_WIDTH), .DATA_WIDTH(DATA_WIDTH)"
+        yield f"    ) master{master} ("
+        yield f"        .iCLK(iCLK), .iRST(iRST),"
+        yield f"        "
+        yield "        /* write */"
+        yield (
+            f"        .m_AWREADY(m{master}_AWREADY), .m_AWVALID(m{master}_AWVALID), .m_AWPROT(), .m_AWADDR(m{master}_AWADDR),"
+        )
+        yield (
+            f"        .m_WREADY(m{master}_WREADY), .m_WVALID(m{master}_WVALID), .m_WDATA(m{master}_WDATA), .m_WSTRB(m{master}_WSTRB),"
+        )
+        yield (
+            f"        .m_BVALID(m{master}_BVALID), .m_BRESP(m{master}_BRESP), .m_BREADY(m{master}_BREADY),"
+        )
+        yield f"        "
+        yield "        /* read */"
+        yield (
+            f"        .m_ARREADY(m{master}_ARREADY), .m_ARVALID(m{master}_ARVALID), .m_ARPROT(), .m_ARADDR(m{master}_ARADDR),"
+        )
+        yield (
+            f"        .m_RVALID(m{master}_RVALID), .m_RRESP(m{master}_RRESP), .m_RDATA(m{master}_RDATA), .m_RREADY(m{master}_RREADY)"
+        )
+        yield f"    );"
+        yield f"    "
+
+    # instantiate slaves
+    for slave in range(s):
+        yield f"    axi4_lite_slave_wrapper #("
+        yield f"        .ADDR_WIDTH(ADDR_WIDTH), .DATA_WIDTH(DATA_WIDTH)"
+        yield f"    ) slave{slave} ("
+        yield f"        .iCLK(iCLK), .iRST(iRST),"
+        yield f"        "
+        yield "        /* write */"
+        yield (
+            f"        .s_AWVALID(s{slave}_AWVALID), .s_AWPROT(3'b0), .s_AWADDR(s{slave}_AWADDR), .s_AWREADY(s{slave}_AWREADY),"
+        )
+        yield (
+            f"        .s_WVALID(s{slave}_WVALID), .s_WDATA(s{slave}_WDATA), .s_WSTRB(s{slave}_WSTRB), .s_WREADY(s{slave}_WREADY),"
+        )
+        yield (
+            f"        .s_BREADY(s{slave}_BREADY), .s_BVALID(s{slave}_BVALID), .s_BRESP(s{slave}_BRESP),"
+        )
+        yield f"        "
+        yield "        /* read */"
+        yield (
+            f"        .s_ARVALID(s{slave}_ARVALID), .s_ARPROT(3'b0), .s_ARADDR(s{slave}_ARADDR), .s_ARREADY(s{slave}_ARREADY),"
+        )
+        yield (
+            f"        .s_RREADY(s{slave}_RREADY), .s_RVALID(s{slave}_RVALID), .s_RRESP(s{slave}_RRESP), .s_RDATA(s{slave}_RDATA)"
+        )
+        yield f"    );"
+        yield f"    "
+
+    # instantiate interconnect
+    yield f"    axi4_lite_interconnect_m{m}s{s} #("
+    for slave in range(s):
+        yield (
+            f"        .LOW_ADDR{slave}(LOW_ADDR{slave}), .HIGH_ADDR{slave}(HIGH_ADDR{slave}){',' if slave != s-1 else ''}"
+        )
+    yield f"    ) interconnect ("
+    yield f"        .iCLK(iCLK), .iRST(iRST),"
+    yield f"        "
+
+    # port connections
+    yield from topology.instance_ports()
+
+    yield f"    );"
+    yield f"    "
+
+    yield f"endmodule"
+
+
+def generate_wrapper(topology):
+    return "\n".join(wrapper_lines(topology))
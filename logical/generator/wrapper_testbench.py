@@ -0,0 +1,163 @@
+def tb_lines(topology):
+    m, s = topology.m, topology.s
+
+    # header
+    yield "`timescale 1ns / 1ns\n"
+    yield f"module tb_wrapper_axi4_lite_interconnect_m{m}s{s}();"
+
+    # address parameters
+    yield f"    /* address parameters */"
+    for i, (start_addr, end_addr) in enumerate(topology.regions(0x100)):
+        yield f"    parameter LOW_ADDR{i}     = 32'h{start_addr:08x};"
+        yield f"    parameter HIGH_ADDR{i}    = 32'h{end_addr:08x};"
+    yield ""
+
+    # clock and reset
+    yield "    parameter           CLK_PERIOD = 10;"
+    yield "    reg                 iCLK, iRST;"
+    yield ""
+
+    # master signals
+    for master in range(m):
+        yield f"    /* master {master} signals */"
+        yield f"    wire                m{master}_AWVALID, m{master}_AWREADY;"
+        yield f"    wire    [31:0]      m{master}_AWADDR;"
+        yield ""
+        yield f"    wire                m{master}_WVALID, m{master}_WREADY;"
+        yield f"    wire    [3:0]       m{master}_WSTRB;"
+        yield f"    wire    [31:0]      m{master}_WDATA;"
+        yield ""
+        yield f"    wire                m{master}_BREADY, m{master}_BVALID;"
+        yield f"    wire    [1:0]       m{master}_BRESP;"
+        yield ""
+        yield f"    wire                m{master}_ARVALID, m{master}_ARREADY;"
+        yield f"    wire    [31:0]      m{master}_ARADDR;"
+        yield ""
+        yield f"    wire                m{master}_RREADY, m{master}_RVALID;"
+        yield f"    wire    [1:0]       m{master}_RRESP;"
+        yield f"    wire    [31:0]      m{master}_RDATA;"
+        yield ""
+        yield ""
+
+    # slave signals
+    for slave in range(s):
+        yield f"    /* slave {slave} signals */"
+        yield f"    wire                s{slave}_AWVALID, s{slave}_AWREADY;"
+        yield f"    wire    [31:0]      s{slave}_AWADDR;"
+        yield ""
+        yield f"    wire                s{slave}_WVALID, s{slave}_WREADY;"
+        yield f"    wire    [3:0]       s{slave}_WSTRB;"
+        yield f"    wire    [31:0]      s{slave}_WDATA;"
+        yield ""
+        yield f"    wire                s{slave}_BREADY, s{slave}_BVALID;"
+        yield f"    wire    [1:0]       s{slave}_BRESP;"
+        yield ""
+        yield f"    wire                s{slave}_ARVALID, s{slave}_ARREADY;"
+        yield f"    wire    [31:0]      s{slave}_ARADDR;"
+        yield ""
+        yield f"    wire                s{slave}_RREADY, s{slave}_RVALID;"
+        yield f"    wire    [1:0]       s{slave}_RRESP;"
+        yield f"    wire    [31:0]      s{slave}_RDATA;"
+        yield ""
+        yield ""
+
+    # master instances
+    for master in range(m):
+        yield f"    /* master {master} */"
+        yield f"    dut_axi4_lite_master_wrapper #("
+        yield f"        .ADDR_WIDTH(32), .DATA_WIDTH(32)"
+        yield f"    ) master{master} ("
+        yield f"        .iCLK(iCLK), .iRST(iRST),"
+        yield ""
+        yield "        /* write */"
+        yield (
+            f"        .m_AWREADY(m{master}_AWREADY), .m_AWVALID(m{master}_AWVALID), .m_AWPROT(), .m_AWADDR(m{master}_AWADDR),"
+        )
+        yield (
+            f"        .m_WREADY(m{master}_WREADY), .m_WVALID(m{master}_WVALID), .m_WDATA(m{master}_WDATA), .m_WSTRB(m{master}_WSTRB),"
+        )
+        yield (
+            f"        .m_BVALID(m{master}_BVALID), .m_BRESP(m{master}_BRESP), .m_BREADY(m{master}_BREADY),"
+        )
+        yield ""
+        yield "        /* read */"
+        yield (
+            f"        .m_ARREADY(m{master}_ARREADY), .m_ARVALID(m{master}_ARVALID), .m_ARPROT(), .m_ARADDR(m{master}_ARADDR),"
+        )
+        yield (
+            f"        .m_RVALID(m{master}_RVALID), .m_RRESP(m{master}_RRESP), .m_RDATA(m{master}_RDATA), .m_RREADY(m{master}_RREADY)"
+        )
+        yield "    );"
+        yield ""
+
+    # Slave instances
+    for slave in range(s):
+        yield f"    /* slave {slave} */"
+        yield f"    dut_axi4_lite_slave_wrapper #("
+        yield f"        .ADDR_WIDTH(32), .DATA_WIDTH(32)"
+        yield f"    ) slave{slave} ("
+        yield f"        .iCLK(iCLK), .iRST(iRST),"
+        yield ""
+        yield "        /* write */"
+        yield (
+            f"        .s_AWVALID(s{slave}_AWVALID), .s_AWPROT(3'b0), .s_AWADDR(s{slave}_AWADDR), .s_AWREADY(s{slave}_AWREADY),"
+        )
+        yield (
+            f"        .s_WVALID(s{slave}_WVALID), .s_WDATA(s{slave}_WDATA), .s_WSTRB(s{slave}_WSTRB), .s_WREADY(s{slave}_WREADY),"
+        )
+        yield (
+            f"        .s_BREADY(s{slave}_BREADY), .s_BVALID(s{slave}_BVALID), .s_BRESP(s{slave}_BRESP),"
+        )
+        yield ""
+        yield "        /* read */"
+        yield (
+            f"        .s_ARVALID(s{slave}_ARVALID), .s_ARPROT(3'b0), .s_ARADDR(s{slave}_ARADDR), .s_ARREADY(s{slave}_ARREADY),"
+        )
+        yield (
+            f"        .s_RREADY(s{slave}_RREADY), .s_RVALID(s{slave}_RVALID), .s_RRESP(s{slave}_RRESP), .s_RDATA(s{slave}_RDATA)"
+        )
+        yield "    );"
+        yield ""
+
+    # interconnect instance
+    yield "    /* interconnect */"
+    yield f"    axi4_lite_interconnect_m{m}s{s} #("
+    for slave in range(s):
+        yield (
+            f"        .LOW_ADDR{slave}(LOW_ADDR{slave}), .HIGH_ADDR{slave}(HIGH_ADDR{slave}){',' if slave != s-1 else ''}"
+        )
+    yield "    ) interconnect ("
+    yield "        .iCLK(iCLK), .iRST(iRST),"
+    yield ""
+
+    # port connections
+    yield from topology.instance_ports()
+
+    yield "    );"
+    yield ""
+
+    # clock generation
+    yield "    initial begin"
+    yield "        iCLK = 1'b1;"
+    yield "        forever #(CLK_PERIOD/2) iCLK = ~iCLK;"
+    yield "    end"
+    yield ""
+
+    # test sequence
+    yield "    initial begin"
+    yield (
+        f'        $dumpfile("logical/sim/wrapper/wrapper_axi4_lite_interconnect_m{m}s{s}.vcd");'
+    )
+    yield f"        $dumpvars(0, tb_wrapper_axi4_lite_interconnect_m{m}s{s});"
+    yield ""
+    yield "        iCLK = 1; iRST = 0;"
+    yield "        #10; iRST = 1;"
+    yield ""
+    yield "        #300; $finish;"
+    yield "    end"
+    yield ""
+    yield "endmodule"
+
+
+def generate_tb(topology):
+    return "\n".join(tb_lines(topology))
@@ -0,0 +1,101 @@
+module axi4_lite_arbiter #(
+    parameter N             = 2,
+    parameter POLICY        = 0,    // 0: fixed, 1: round-robin, 2: weighted, 3: lru
+    parameter WEIGHT_WIDTH  = 4,
+    parameter WEIGHTS       = {N{{(WEIGHT_WIDTH-1){1'b0}}, 1'b1}}
+) (
+    input                               iCLK,
+    input                               iRST,
+
+    /* request */
+    input       [N-1:0]                 req,
+    input                               update,
+
+    /* grant */
+    output reg  [N-1:0]                 grant,
+    output reg  [$clog2(N+1)-1:0]       grant_idx
+);
+
+    /* policies */
+    localparam FIXED    = 0;
+    localparam RR       = 1;
+    localparam WEIGHTED = 2;
+    localparam LRU      = 3;
+
+    integer                     i, j, idx;
+    reg                         found, wins, refill;
+
+    /* arbitration state */
+    reg [$clog2(N+1)-1:0]       last;                   // last granted requester
+    reg [WEIGHT_WIDTH-1:0]      credit [0:N-1];         // weighted: grants left this round
+    reg [N*N-1:0]               prio;                   // lru: prio[i*N+j] = i wins over j
+    reg [N-1:0]                 eligible;
+
+    /* weighted: only requesters with credit left, refill once all are spent */
+    always @(*) begin
+        eligible = req;
+        refill   = 1'b0;
+        if (POLICY == WEIGHTED) begin
+            for (i = 0; i < N; i = i + 1)
+                eligible[i] = req[i] && (credit[i] != 0);
+            if (eligible == 0) begin
+                eligible = req;
+                refill   = 1'b1;
+            end
+        end
+    end
+
+    /* grant, searched in policy order */
+    always @(*) begin
+        grant       = {N{1'b0}};
+        grant_idx   = N;
+        found       = 1'b0;
+        for (i = 0; i < N; i = i + 1) begin
+            case (POLICY)
+                RR:         idx = (last + 1 + i >= N) ? last + 1 + i - N : last + 1 + i;
+                WEIGHTED:   idx = (last + i >= N)     ? last + i - N     : last + i;
+                default:    idx = i;
+            endcase
+
+            wins = 1'b1;
+            if (POLICY == LRU)
+                for (j = 0; j < N; j = j + 1)
+                    if (j != idx && req[j] && !prio[idx*N+j]) wins = 1'b0;
+
+            if (!found && eligible[idx] && wins) begin
+                found       = 1'b1;
+                grant[idx]  = 1'b1;
+                grant_idx   = idx;
+            end
+        end
+    end
+
+    /* state update on an accepted grant */
+    always @(posedge iCLK or negedge iRST) begin
+        if (!iRST) begin
+            last <= (POLICY == WEIGHTED) ? 0 : N - 1;
+            for (i = 0; i < N; i = i + 1) begin
+                credit[i] <= WEIGHTS[i*WEIGHT_WIDTH +: WEIGHT_WIDTH];
+                for (j = 0; j < N; j = j + 1)
+                    prio[i*N+j] <= (i < j);
+            end
+        end else if (update && found) begin
+            last <= grant_idx;
+
+            if (refill) begin
+                for (i = 0; i < N; i = i + 1)
+                    credit[i] <= WEIGHTS[i*WEIGHT_WIDTH +: WEIGHT_WIDTH];
+                credit[grant_idx] <= WEIGHTS[grant_idx*WEIGHT_WIDTH +: WEIGHT_WIDTH] - 1;
+            end else
+                credit[grant_idx] <= credit[grant_idx] - 1;
+
+            for (j = 0; j < N; j = j + 1) begin
+                if (j != grant_idx) begin
+                    prio[grant_idx*N+j] <= 1'b0;
+                    prio[j*N+grant_idx] <= 1'b1;
+                end
+            end
+        end
+    end
+
+endmodule
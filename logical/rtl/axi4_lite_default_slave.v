@@ -0,0 +1,80 @@
+module axi4_lite_default_slave #(
+    parameter DATA_WIDTH    = 32
+) (
+    input                               iCLK,
+    input                               iRST,
+
+    /* write address channel */
+    input                               s_AWVALID,
+    output                              s_AWREADY,
+
+    /* write data channel */
+    input                               s_WVALID,
+    output                              s_WREADY,
+
+    /* write response channel */
+    input                               s_BREADY,
+    output                              s_BVALID,
+    output      [1:0]                   s_BRESP,
+
+    /* read address channel */
+    input                               s_ARVALID,
+    output                              s_ARREADY,
+
+    /* read data channel */
+    input                               s_RREADY,
+    output                              s_RVALID,
+    output      [1:0]                   s_RRESP,
+    output      [DATA_WIDTH-1:0]        s_RDATA
+);
+
+    /* decode error, the address hit no slave */
+    localparam DECERR   = 2'b11;
+
+    /* write: address and data taken as they arrive, one response at a time */
+    reg         aw_done, w_done, bvalid;
+
+    always @(posedge iCLK or negedge iRST) begin
+        if (!iRST) begin
+            aw_done     <= 1'b0;
+            w_done      <= 1'b0;
+            bvalid      <= 1'b0;
+        end else if (bvalid) begin
+            if (s_BREADY)
+                bvalid  <= 1'b0;
+        end else begin
+            if (s_AWVALID && s_AWREADY)
+                aw_done <= 1'b1;
+            if (s_WVALID && s_WREADY)
+                w_done  <= 1'b1;
+            if ((aw_done || s_AWVALID) && (w_done || s_WVALID)) begin
+                aw_done <= 1'b0;
+                w_done  <= 1'b0;
+                bvalid  <= 1'b1;
+            end
+        end
+    end
+
+    assign s_AWREADY    = !aw_done && !bvalid;
+    assign s_WREADY     = !w_done  && !bvalid;
+    assign s_BVALID     = bvalid;
+    assign s_BRESP      = (bvalid) ? DECERR : 2'b00;
+
+    /* read: response the cycle after the address */
+    reg         rvalid;
+
+    always @(posedge iCLK or negedge iRST) begin
+        if (!iRST)
+            rvalid      <= 1'b0;
+        else if (rvalid)
+            rvalid      <= !s_RREADY;
+        else if (s_ARVALID)
+            rvalid      <= 1'b1;
+    end
+
+    assign s_ARREADY    = !rvalid;
+    assign s_RVALID     = rvalid;
+    assign s_RRESP      = (rvalid) ? DECERR : 2'b00;
+    assign s_RDATA      = {DATA_WIDTH{1'b0}};
+
+endmodule
@@ -0,0 +1,49 @@
+module axi4_lite_fifo #(
+    parameter WIDTH         = 4,
+    parameter DEPTH         = 2,
+    parameter EMPTY_VALUE   = 0
+) (
+    input                               iCLK,
+    input                               iRST,
+
+    /* write */
+    input                               push,
+    input       [WIDTH-1:0]             push_data,
+    output                              full,
+
+    /* read */
+    input                               pop,
+    output      [WIDTH-1:0]             head,
+    output                              empty
+);
+
+    localparam PTR_WIDTH    = (DEPTH > 1) ? $clog2(DEPTH) : 1;
+
+    reg [WIDTH-1:0]         mem [0:DEPTH-1];
+    reg [PTR_WIDTH-1:0]     wr_ptr, rd_ptr;
+    reg [PTR_WIDTH:0]       count;
+
+    wire                    do_push = push && (!full || pop);
+    wire                    do_pop  = pop  && !empty;
+
+    always @(posedge iCLK or negedge iRST) begin
+        if (!iRST) begin
+            wr_ptr          <= 0;
+            rd_ptr          <= 0;
+            count           <= 0;
+        end else begin
+            if (do_push) begin
+                mem[wr_ptr] <= push_data;
+                wr_ptr      <= (wr_ptr == DEPTH - 1) ? 0 : wr_ptr + 1;
+            end
+            if (do_pop)
+                rd_ptr      <= (rd_ptr == DEPTH - 1) ? 0 : rd_ptr + 1;
+            count           <= count + do_push - do_pop;
+        end
+    end
+
+    assign full     = (count == DEPTH);
+    assign empty    = (count == 0);
+    assign head     = (empty) ? EMPTY_VALUE : mem[rd_ptr];
+
+endmodule
@@ -0,0 +1,3 @@
+`include "logical/rtl/axi4_lite_master.v"
+`include "logical/rtl/axi4_lite_slave.v"
+`include "logical/rtl/axi4_lite_interconnect/axi4_lite_interconnect_m1s2.v"
@@ -0,0 +1,28 @@
+module axi4_lite_onehot_mux #(
+    parameter N             = 2,
+    parameter WIDTH         = 32
+) (
+    /* select */
+    input       [N-1:0]                 sel,        // one-hot, all zero drives 0
+
+    /* data */
+    input       [N*WIDTH-1:0]           in,         // input 0 in the low bits
+    output      [WIDTH-1:0]             out
+);
+
+    genvar i, b;
+
+    /* and-or reduction per output bit */
+    generate
+        for (b = 0; b < WIDTH; b = b + 1) begin : g_bit
+            wire [N-1:0]    column;
+
+            for (i = 0; i < N; i = i + 1) begin : g_in
+                assign column[i] = in[i*WIDTH+b];
+            end
+
+            assign out[b] = |(column & sel);
+        end
+    endgenerate
+
+endmodule
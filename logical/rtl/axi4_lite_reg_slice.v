@@ -0,0 +1,83 @@
+module axi4_lite_reg_slice #(
+    parameter WIDTH         = 32,
+    parameter MODE          = 1     // 0: bypass, 1: forward, 2: backward, 3: full
+) (
+    input                               iCLK,
+    input                               iRST,
+
+    /* upstream */
+    input                               in_valid,
+    input       [WIDTH-1:0]             in_data,
+    output                              in_ready,
+
+    /* downstream */
+    output                              out_valid,
+    output      [WIDTH-1:0]             out_data,
+    input                               out_ready
+);
+
+    /* modes */
+    localparam BYPASS   = 0;
+    localparam FORWARD  = 1;
+    localparam BACKWARD = 2;
+    localparam FULL     = 3;
+
+    wire                    mid_valid, mid_ready;
+    wire [WIDTH-1:0]        mid_data;
+
+    /* backward stage: registered ready, skid buffer holds one beat */
+    generate
+        if (MODE == BACKWARD || MODE == FULL) begin : g_backward
+            reg                 skid_valid;
+            reg [WIDTH-1:0]     skid_data;
+
+            always @(posedge iCLK or negedge iRST) begin
+                if (!iRST) begin
+                    skid_valid  <= 1'b0;
+                    skid_data   <= {WIDTH{1'b0}};
+                end else if (skid_valid) begin
+                    if (mid_ready)
+                        skid_valid  <= 1'b0;
+                end else if (in_valid && !mid_ready) begin
+                    skid_valid  <= 1'b1;
+                    skid_data   <= in_data;
+                end
+            end
+
+            assign in_ready     = !skid_valid;
+            assign mid_valid    = in_valid || skid_valid;
+            assign mid_data     = (skid_valid) ? skid_data : in_data;
+        end else begin : g_backward_bypass
+            assign in_ready     = mid_ready;
+            assign mid_valid    = in_valid;
+            assign mid_data     = in_data;
+        end
+    endgenerate
+
+    /* forward stage: registered valid and data */
+    generate
+        if (MODE == FORWARD || MODE == FULL) begin : g_forward
+            reg                 data_valid;
+            reg [WIDTH-1:0]     data;
+
+            always @(posedge iCLK or negedge iRST) begin
+                if (!iRST) begin
+                    data_valid  <= 1'b0;
+                    data        <= {WIDTH{1'b0}};
+                end else if (mid_ready) begin
+                    data_valid  <= mid_valid;
+                    data        <= mid_data;
+                end
+            end
+
+            assign mid_ready    = !data_valid || out_ready;
+            assign out_valid    = data_valid;
+            assign out_data     = data;
+        end else begin : g_forward_bypass
+            assign mid_ready    = out_ready;
+            assign out_valid    = mid_valid;
+            assign out_data     = mid_data;
+        end
+    endgenerate
+
+endmodule
@@ -0,0 +1,275 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .regress import CONFIG, expand, paths, sources, check
+
+
+REPORT = "logical/sim/bench.json"
+BASELINE = "logical/sim/bench_baseline.json"
+
+# the testbench every run uses: a process per master, port monitors and no
+# dump, which would dominate the simulation time
+TBFLAGS = ["--traffic", "--monitors", "--dump", "none"]
+
+
+def hotspot(m, s):
+    # every master to slave 0
+    return ["+HOT_PCT=100"] + [f"+M{master}_HOT=0" for master in range(m)]
+
+
+def uniform(m, s):
+    return ["+HOT_PCT=0"]
+
+
+def disjoint(m, s):
+    # master n to slave n, only while every master has a slave of its own
+    if m > s:
+        return None
+    return ["+HOT_PCT=100"] + [f"+M{master}_HOT={master}" for master in range(m)]
+
+
+def read_heavy(m, s):
+    return ["+HOT_PCT=0", "+WRITE_PCT=10"]
+
+
+def write_heavy(m, s):
+    return ["+HOT_PCT=0", "+WRITE_PCT=90"]
+
+
+# a pattern's plusargs for m masters and s slaves, None when the size cannot
+# run it
+PATTERNS = {
+    "hotspot": hotspot,
+    "uniform": uniform,
+    "disjoint": disjoint,
+    "read-heavy": read_heavy,
+    "write-heavy": write_heavy,
+}
+
+TRAFFIC = re.compile(r"\[TRAFFIC\] all: (\d+) ops in (\d+) cycles")
+LATENCY = re.compile(
+    r"\[MONITOR\] all masters: (\d+) transactions, mean = (\d+)\.(\d+), p50 = (-?\d+), p99 = (-?\d+), max = (\d+)"
+)
+
+# compared with the baseline: the cycle counts are exact for a seed, so any
+# change is reported, wall times only beyond the tolerance. True where higher
+# is better
+EXACT = {"per_cycle": True, "latency_mean": False, "latency_p99": False, "rtl_lines": None, "tb_lines": None}
+TIMED = {"compile_s": False, "sim_s": False}
+
+
+def last_line(proc):
+    lines = (proc.stdout + proc.stderr).strip().splitlines()
+    return lines[-1] if lines else f"exit {proc.returncode}"
+
+
+def lines(path):
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def bench(config, patterns, genflags=(), ops=200, seed=1, iverilog="iverilog", vvp="vvp", timeout=None):
+    # generate and compile one size once, then simulate every pattern on it.
+    # The compile is timed without the cache, it is what is measured
+    files = paths(config)
+    m, s = (int(n) for n in CONFIG.fullmatch(config).groups())
+    base = {"config": config, "rtl_lines": None, "tb_lines": None, "generate_s": None, "compile_s": None}
+    results = []
+
+    def failed(status, message):
+        return [dict(base, pattern=pattern, status=status, message=message) for pattern in patterns]
+
+    try:
+        generator = [sys.executable, "-m", "logical.generator", config, "--targets", "rtl,tb,include"]
+        start = time.perf_counter()
+        proc = subprocess.run(generator + TBFLAGS + list(genflags), capture_output=True, text=True)
+        base["generate_s"] = round(time.perf_counter() - start, 3)
+        if proc.returncode:
+            return failed("error", f"generate failed: {last_line(proc)}")
+        base["rtl_lines"], base["tb_lines"] = lines(files["rtl"]), lines(files["tb"])
+
+        os.makedirs(os.path.dirname(files["vvp"]), exist_ok=True)
+        start = time.perf_counter()
+        proc = subprocess.run([iverilog, "-o", files["vvp"]] + sources(config), capture_output=True, text=True)
+        base["compile_s"] = round(time.perf_counter() - start, 3)
+        if proc.returncode:
+            return failed("error", f"compile failed: {last_line(proc)}")
+    except OSError as e:
+        return failed("error", str(e))
+
+    for pattern in patterns:
+        result = dict(
+            base,
+            pattern=pattern,
+            status="pass",
+            message="",
+            ops=None,
+            cycles=None,
+            per_cycle=None,
+            latency_mean=None,
+            latency_p50=None,
+            latency_p99=None,
+            latency_max=None,
+            sim_s=None,
+        )
+        traffic = PATTERNS[pattern](m, s)
+        if traffic is None:
+            result.update(status="skip", message=f"{pattern} does not fit {m} masters and {s} slaves")
+            results.append(result)
+            continue
+        plusargs = [f"+OPS={ops}", f"+SEED={seed}"] + traffic
+        start = time.perf_counter()
+        try:
+            proc = subprocess.run([vvp, files["vvp"]] + plusargs, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            result.update(status="timeout", message=f"simulation exceeded {timeout} s")
+            results.append(result)
+            continue
+        except OSError as e:
+            result.update(status="error", message=str(e))
+            results.append(result)
+            continue
+        result["sim_s"] = round(time.perf_counter() - start, 3)
+
+        result["status"], result["message"], _ = check(proc.stdout)
+        traffic, latency = TRAFFIC.search(proc.stdout), LATENCY.search(proc.stdout)
+        if traffic:
+            result["ops"], result["cycles"] = int(traffic.group(1)), int(traffic.group(2))
+            result["per_cycle"] = round(result["ops"] / result["cycles"], 4)
+        if latency:
+            result["latency_mean"] = float(f"{latency.group(2)}.{latency.group(3)}")
+            result["latency_p50"], result["latency_p99"], result["latency_max"] = (int(latency.group(n)) for n in (4, 5, 6))
+        if result["status"] == "pass" and not (traffic and latency):
+            result.update(status="fail", message="no traffic or monitor report in the output")
+        results.append(result)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    # (config, pattern, metric, baseline, now, verdict) for every metric that
+    # moved, verdict is "better", "worse" or "changed"
+    before = {(entry["config"], entry["pattern"]): entry for entry in baseline["results"]}
+    changes = []
+    for result in results:
+        old = before.get((result["config"], result["pattern"]))
+        if old is None or result["status"] != "pass":
+            continue
+        for metric, higher in list(EXACT.items()) + list(TIMED.items()):
+            was, now = old.get(metric), result.get(metric)
+            if was is None or now is None or was == now:
+                continue
+            if metric in TIMED and abs(now - was) <= was * tolerance / 100:
+                continue
+            if higher is None:
+                verdict = "changed"
+            else:
+                verdict = "better" if (now > was) == higher else "worse"
+            changes.append((result["config"], result["pattern"], metric, was, now, verdict))
+    return changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.simulation.bench",
+        usage="%(prog)s mXsY [mXsY ...] [options] [generator options (default: --crossbar)]",
+        description="simulate traffic patterns across interconnect sizes, record throughput, latency, "
+        "generated lines, compile and simulation time, and compare them with a baseline",
+    )
+    parser.add_argument(
+        "--patterns",
+        default=",".join(PATTERNS),
+        help=f"comma-separated traffic patterns (default: {','.join(PATTERNS)})",
+    )
+    parser.add_argument("--ops", type=int, default=200, help="operations per master (default: 200)")
+    parser.add_argument("--seed", type=int, default=1, help="stimulus seed, the same seed replays the same traffic (default: 1)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="sizes benchmarked in parallel (default: cores)")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per simulation (default: 600)")
+    parser.add_argument("--report", default=REPORT, help=f"JSON results path (default: {REPORT})")
+    parser.add_argument("--baseline", default=BASELINE, help=f"results to compare with (default: {BASELINE})")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=20, help="percent a wall time may move (default: 20)")
+    parser.add_argument("--iverilog", default="iverilog")
+    parser.add_argument("--vvp", default="vvp")
+    args, rest = parser.parse_known_args(argv)
+
+    specs = [arg for arg in rest if CONFIG.fullmatch(arg)]
+    # the default state machine cannot serve concurrent masters, so without
+    # generator options the sizes are built as crossbars
+    genflags = [arg for arg in rest if not CONFIG.fullmatch(arg)] or ["--crossbar"]
+    try:
+        configs = expand(specs)
+        if not configs:
+            raise ValueError("No configuration given, e.g. m2s2 m4s4 m8s8")
+        patterns = args.patterns.split(",")
+        for pattern in patterns:
+            if pattern not in PATTERNS:
+                raise ValueError(f"Unknown pattern '{pattern}', choose from {', '.join(PATTERNS)}")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # sizes in parallel, the patterns of one size share its compiled testbench
+    start = time.perf_counter()
+    results = {}
+    print(f"{'config':<10}{'pattern':<13}{'per cycle':>10}{'mean':>8}{'p99':>6}{'rtl lines':>11}{'compile s':>11}{'sim s':>8}")
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [
+            pool.submit(bench, config, patterns, genflags, args.ops, args.seed, args.iverilog, args.vvp, args.timeout)
+            for config in configs
+        ]
+        for future in as_completed(futures):
+            for result in future.result():
+                results[(result["config"], result["pattern"])] = result
+                if result["status"] != "pass":
+                    print(f"{result['config']:<10}{result['pattern']:<13}{result['status'].upper()}  {result['message']}")
+                    continue
+                print(
+                    f"{result['config']:<10}{result['pattern']:<13}{result['per_cycle']:>10.4f}{result['latency_mean']:>8.2f}"
+                    f"{result['latency_p99']:>6}{result['rtl_lines']:>11}{result['compile_s']:>11.2f}{result['sim_s']:>8.2f}"
+                )
+            sys.stdout.flush()
+    wall = time.perf_counter() - start
+
+    ordered = [results[(config, pattern)] for config in configs for pattern in patterns]
+    skipped = sum(result["status"] == "skip" for result in ordered)
+    failed = sum(result["status"] not in ("pass", "skip") for result in ordered)
+    report = {
+        "options": genflags,
+        "patterns": patterns,
+        "ops": args.ops,
+        "seed": args.seed,
+        "wall_s": round(wall, 3),
+        "results": ordered,
+    }
+    for path in [args.report] + ([args.baseline] if args.save_baseline else []):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    worse = 0
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if (baseline["options"], baseline["ops"], baseline["seed"]) != (genflags, args.ops, args.seed):
+            print(f"\nWarning: {args.baseline} was run with other options, ops or seed, the cycle counts do not compare")
+        changes = compare(ordered, baseline, args.tolerance)
+        worse = sum(change[5] == "worse" for change in changes)
+        print(f"\ncompared with {args.baseline}: {len(changes)} changes, {worse} worse")
+        for config, pattern, metric, was, now, verdict in changes:
+            print(f"  {verdict.upper():<9}{config:<10}{pattern:<13}{metric:<14}{was} -> {now}")
+
+    print(
+        f"\n{len(ordered) - failed - skipped}/{len(ordered)} runs passed, {skipped} skipped in {wall:.1f} s, report: {args.report}"
+    )
+    sys.exit(1 if failed or worse else 0)
+
+
+if __name__ == "__main__":
+    main()
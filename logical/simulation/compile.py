@@ -0,0 +1,123 @@
+import os
+import re
+import sys
+import shutil
+import hashlib
+import argparse
+import subprocess
+
+
+CACHE = "logical/sim/cache"
+INCLUDE = re.compile(r'^\s*`include\s+"([^"]+)"', re.MULTILINE)
+
+
+def resolve(name, including, include_dirs):
+    # as iverilog searches: the working directory, the including file's
+    # directory, then every -I directory
+    for base in [""] + [os.path.dirname(including)] + include_dirs:
+        path = os.path.join(base, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def sources(args):
+    # every file the compile reads: the source arguments and, transitively,
+    # the files they include, in the order iverilog meets them
+    include_dirs = [arg[2:] for arg in args if arg.startswith("-I") and len(arg) > 2]
+    include_dirs += [value for flag, value in zip(args, args[1:]) if flag == "-I"]
+    pending = [arg for arg in args if not arg.startswith("-") and os.path.isfile(arg)]
+    found, missing = [], []
+    while pending:
+        path = pending.pop(0)
+        if path in found:
+            continue
+        found.append(path)
+        with open(path) as f:
+            text = f.read()
+        # commented out includes are not read
+        text = re.sub(r"//.*", "", text)
+        for name in INCLUDE.findall(text):
+            include = resolve(name, path, include_dirs)
+            if include is None:
+                missing.append(name)
+            else:
+                pending.append(include)
+    return found, missing
+
+
+def compile_key(iverilog, args):
+    # the compiler, its arguments and the content of every file read
+    digest = hashlib.sha256()
+    tool = shutil.which(iverilog) or iverilog
+    try:
+        stat = os.stat(tool)
+        digest.update(f"{tool} {stat.st_size} {stat.st_mtime_ns}\n".encode())
+    except OSError:
+        digest.update(f"{tool}\n".encode())
+    digest.update("\0".join(args).encode() + b"\n")
+    found, missing = sources(args)
+    for path in found:
+        digest.update(path.encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    for name in missing:
+        digest.update(b"missing\0" + name.encode())
+    return digest.hexdigest()
+
+
+def place(cached, output):
+    # linked into place when the file system allows, replaced in one step
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    partial = f"{output}.{os.getpid()}.tmp"
+    try:
+        os.link(cached, partial)
+    except OSError:
+        shutil.copy2(cached, partial)
+    os.replace(partial, output)
+
+
+def compile_vvp(output, args, iverilog="iverilog", cache=CACHE):
+    # iverilog -o output args, reusing the compiled output of an earlier
+    # identical compile: returns whether it came from the cache
+    key = compile_key(iverilog, args)
+    cached = os.path.join(cache, f"{key}.vvp")
+    if os.path.exists(cached):
+        place(cached, output)
+        return True
+
+    os.makedirs(cache, exist_ok=True)
+    partial = f"{cached}.{os.getpid()}.tmp"
+    try:
+        subprocess.run([iverilog, "-o", partial] + args, check=True)
+        os.replace(partial, cached)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    place(cached, output)
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.simulation.compile",
+        usage="%(prog)s -o OUT.vvp [--iverilog PATH] [iverilog flags] sources...",
+        description="iverilog with a cache keyed on its flags and every included source",
+    )
+    parser.add_argument("-o", dest="output", required=True)
+    parser.add_argument("--iverilog", default="iverilog")
+    parser.add_argument("--cache", default=CACHE, help=f"compiled outputs by key (default: {CACHE})")
+    args, rest = parser.parse_known_args(argv)
+
+    try:
+        cached = compile_vvp(args.output, rest, args.iverilog, args.cache)
+    except subprocess.CalledProcessError as e:
+        sys.exit(e.returncode)
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"{'Cached' if cached else 'Compiled'}: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
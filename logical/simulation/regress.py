@@ -0,0 +1,232 @@
+import os
+import re
+import sys
+import json
+import time
+import signal
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from xml.etree import ElementTree
+
+
+TOP = "axi4_lite_interconnect"
+CONFIG = re.compile(r"m([\d.,]+)s([\d.,]+)")
+
+# testbench clock period, vvp reports the $finish time in ns
+CLK_PERIOD = 10
+DONE = "[INFO] Selesai semua test"
+
+
+def numbers(spec):
+    # "4", "1..8" or a comma list of both, e.g. "1,2,4..6"
+    values = []
+    for part in spec.split(","):
+        low, _, high = part.partition("..")
+        values.extend(range(int(low), int(high or low) + 1))
+    return values
+
+
+def expand(specs):
+    # configurations from master and slave ranges, e.g. m1..8s1..16 or m2,4s4
+    configs = []
+    for spec in specs:
+        match = CONFIG.fullmatch(spec)
+        if not match:
+            raise ValueError(f"Configuration '{spec}' must look like m2s2, m1..8s1..16 or m1,2,4s4")
+        for m in numbers(match.group(1)):
+            for s in numbers(match.group(2)):
+                configs.append(f"m{m}s{s}")
+    # in order, each size once
+    return list(dict.fromkeys(configs))
+
+
+def paths(config):
+    return {
+        "rtl": f"logical/rtl/{TOP}/{TOP}_{config}.v",
+        "include": f"logical/rtl/{TOP}/include_{config}.vh",
+        "tb": f"logical/tb/tb_{TOP}/tb_{TOP}_{config}.v",
+        "vvp": f"logical/sim/{TOP}/{TOP}_{config}.vvp",
+        "log": f"logical/sim/{TOP}/{TOP}_{config}.log",
+        "txlog": f"logical/sim/{TOP}/{TOP}_{config}.txlog",
+    }
+
+
+def sources(config):
+    # the configuration's generated include file lists every module it needs,
+    # so configurations compile without sharing a file
+    return [paths(config)["include"], paths(config)["tb"]]
+
+
+def check(output):
+    # status, message and cycles of a finished simulation: it passes when the
+    # testbench reached its end without reporting an error
+    finish = re.search(r"\$finish called at (\d+)", output)
+    cycles = int(finish.group(1)) // CLK_PERIOD if finish else None
+    errors = [line.strip() for line in output.splitlines() if "[ERROR]" in line]
+    if errors:
+        return "fail", errors[0], cycles
+    if DONE not in output:
+        return "fail", "simulation ended before the testbench finished", cycles
+    return "pass", "", cycles
+
+
+def run(config, genflags=(), iverilog="iverilog", vvp="vvp", timeout=None, plusargs=()):
+    # generate, compile and simulate one configuration, every step in its own
+    # process, the output of all three goes to the configuration's log
+    files = paths(config)
+    result = {
+        "config": config,
+        "status": "pass",
+        "message": "",
+        "cycles": None,
+        "cached": False,
+        "generate_s": None,
+        "compile_s": None,
+        "sim_s": None,
+        "check_s": None,
+    }
+    log = []
+
+    # exit code and output of one step, a failure sets the result
+    def step(name, command, timeout=None):
+        log.append(f"$ {' '.join(command)}")
+        start = time.perf_counter()
+        # a session of its own, so a timeout also ends whatever it started
+        proc = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, start_new_session=True
+        )
+        try:
+            out, err = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.communicate()
+            raise
+        finally:
+            result[f"{name}_s"] = round(time.perf_counter() - start, 3)
+        log.append(out + err)
+        if proc.returncode:
+            lines = (out + err).strip().splitlines()
+            result["status"] = "fail" if name in ("sim", "check") else "error"
+            result["message"] = f"{name} failed: {lines[-1] if lines else f'exit {proc.returncode}'}"
+        return proc.returncode, out
+
+    try:
+        generator = [sys.executable, "-m", "logical.generator", config, "--targets", "rtl,tb,include"]
+        if step("generate", generator + list(genflags))[0]:
+            return result
+        os.makedirs(os.path.dirname(files["vvp"]), exist_ok=True)
+        # unchanged sources reuse the .vvp of an earlier run
+        compiler = [sys.executable, "-m", "logical.simulation.compile", "--iverilog", iverilog]
+        code, out = step("compile", compiler + ["-o", files["vvp"]] + sources(config))
+        if code:
+            return result
+        result["cached"] = out.startswith("Cached")
+        # vvp picks the dump format, a testbench dumping FST needs -fst
+        fst = "--dump-format=fst" in genflags or ("--dump-format", "fst") in zip(genflags, genflags[1:])
+        code, out = step("sim", [vvp, files["vvp"]] + (["-fst"] if fst else []) + list(plusargs), timeout)
+        status, message, result["cycles"] = check(out)
+        if not code:
+            result["status"], result["message"] = status, message
+        # a testbench generated with --txlog is checked against the golden
+        # memory model as well
+        if result["status"] == "pass" and "--txlog" in genflags:
+            step("check", [sys.executable, "-m", "logical.simulation.scoreboard", files["txlog"]])
+    except subprocess.TimeoutExpired:
+        result["status"] = "timeout"
+        result["message"] = f"simulation exceeded {timeout} s"
+    except OSError as e:
+        result["status"] = "error"
+        result["message"] = str(e)
+    finally:
+        with open(files["log"], "w") as f:
+            f.write("\n".join(log))
+    return result
+
+
+def junit(results, wall):
+    # one testcase per configuration, failures carry the message
+    suite = ElementTree.Element(
+        "testsuite",
+        name=TOP,
+        tests=str(len(results)),
+        failures=str(sum(result["status"] in ("fail", "timeout") for result in results)),
+        errors=str(sum(result["status"] == "error" for result in results)),
+        time=f"{wall:.3f}",
+    )
+    for result in results:
+        elapsed = sum(result[key] or 0 for key in ("generate_s", "compile_s", "sim_s", "check_s"))
+        case = ElementTree.SubElement(suite, "testcase", classname=TOP, name=result["config"], time=f"{elapsed:.3f}")
+        if result["status"] != "pass":
+            kind = "error" if result["status"] == "error" else "failure"
+            ElementTree.SubElement(case, kind, message=result["message"]).text = paths(result["config"])["log"]
+    suites = ElementTree.Element("testsuites")
+    suites.append(suite)
+    return ElementTree.tostring(suites, encoding="unicode")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.simulation.regress",
+        usage="%(prog)s mXsY [mXsY ...] [options] [generator options] [+plusargs]",
+        description="generate, compile and simulate many configurations in parallel, e.g. m1..8s1..16",
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="parallel configurations (default: cores)")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per simulation (default: 600)")
+    parser.add_argument("--report", default="logical/sim/regress.json", help="JSON report path")
+    parser.add_argument("--junit", help="also write a JUnit XML report")
+    parser.add_argument("--iverilog", default="iverilog")
+    parser.add_argument("--vvp", default="vvp")
+    args, rest = parser.parse_known_args(argv)
+
+    # sizes may sit anywhere between the generator options and the testbench
+    # plusargs (e.g. +SEED=3 with --plusargs), which are passed on
+    specs = [arg for arg in rest if CONFIG.fullmatch(arg)]
+    plusargs = [arg for arg in rest if arg.startswith("+")]
+    genflags = [arg for arg in rest if not CONFIG.fullmatch(arg) and not arg.startswith("+")]
+    try:
+        configs = expand(specs)
+        if not configs:
+            raise ValueError("No configuration given, e.g. m1..4s1..4")
+        if any(arg.startswith("+TXLOG=") for arg in plusargs):
+            raise ValueError("+TXLOG cannot be set for a regression, every configuration logs to its own file")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # the work happens in the generator, iverilog and vvp processes, the
+    # pool threads only start them and wait
+    start = time.perf_counter()
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = {
+            pool.submit(run, config, genflags, args.iverilog, args.vvp, args.timeout, plusargs): config for config in configs
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[result["config"]] = result
+            cycles = "" if result["cycles"] is None else f"{result['cycles']} cycles"
+            print(f"{result['status'].upper():<8}{result['config']:<12}{cycles:<16}{result['sim_s'] or 0:.1f} s  {result['message']}")
+            sys.stdout.flush()
+    wall = time.perf_counter() - start
+
+    ordered = [results[config] for config in configs]
+    summary = {status: sum(result["status"] == status for result in ordered) for status in ("pass", "fail", "timeout", "error")}
+    report = {"options": genflags, "plusargs": plusargs, "jobs": args.jobs, "wall_s": round(wall, 3), "summary": summary, "results": ordered}
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    if args.junit:
+        with open(args.junit, "w") as f:
+            f.write(junit(ordered, wall) + "\n")
+
+    print(
+        f"\n{summary['pass']}/{len(ordered)} passed, {summary['fail']} failed, {summary['timeout']} timed out, "
+        f"{summary['error']} errors in {wall:.1f} s, report: {args.report}"
+    )
+    sys.exit(0 if summary["pass"] == len(ordered) else 1)
+
+
+if __name__ == "__main__":
+    main()
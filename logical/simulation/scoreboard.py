@@ -0,0 +1,203 @@
+import os
+import sys
+import json
+import struct
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# the layout the testbench's --txlog loggers write, little endian words
+MAGIC = 0x4C545841  # "AXTL"
+VERSION = 1
+HEADER = struct.Struct("<4I")
+REGION = struct.Struct("<2I")
+RECORD = struct.Struct("<5I")
+
+READ = 0x80000000
+OKAY, DECERR = 0, 3
+
+
+def read_log(f, batch=1 << 16):
+    # masters, slaves, slave regions and an iterator over the records, read
+    # batch records at a time so a log of any length streams through
+    header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError("not a transaction log, the header is missing")
+    magic, version, m, s = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} transaction log")
+    regions = [REGION.unpack(f.read(REGION.size)) for _ in range(s)]
+
+    def records():
+        while True:
+            chunk = f.read(RECORD.size * batch)
+            whole = len(chunk) - len(chunk) % RECORD.size
+            yield from RECORD.iter_unpack(chunk[:whole])
+            if len(chunk) < RECORD.size * batch:
+                if whole != len(chunk):
+                    raise ValueError("the log ends part way through a record")
+                return
+
+    return m, s, regions, records()
+
+
+def merge(old, data, strb):
+    # the bytes of data selected by the write strobes over the old word
+    mask = sum(0xFF << (8 * byte) for byte in range(4) if strb >> byte & 1)
+    return (old & ~mask) | (data & mask)
+
+
+class Memory:
+    # the golden model: per slave, a dict of the words written so far, so it
+    # only grows with the addresses a run touches. Each word keeps the writes
+    # that may still overlap a read not checked yet, older ones are folded
+    # into the word's value
+
+    def __init__(self, regions, horizon):
+        self.regions = regions
+        self.horizon = horizon
+        self.words = [{} for _ in regions]
+
+    def decode(self, addr):
+        # the slave claiming an address and the word within its region
+        for slave, (low, high) in enumerate(self.regions):
+            if low <= addr <= high:
+                return slave, (addr - low) >> 2
+        return None, None
+
+    def history(self, slave, word, now):
+        # the word's folded value and its recent writes, (start, end, value)
+        # in the order they completed
+        entry = self.words[slave].setdefault(word, [0, deque()])
+        recent = entry[1]
+        while recent and recent[0][1] < now - self.horizon:
+            entry[0] = recent.popleft()[2]
+        return entry
+
+    def write(self, slave, word, start, end, data, strb):
+        entry = self.history(slave, word, end)
+        latest = entry[1][-1][2] if entry[1] else entry[0]
+        entry[1].append((start, end, merge(latest, data, strb)))
+
+    def expected(self, slave, word, start, end):
+        # every value the read may return: the word as it was when the read
+        # started and whatever a write overlapping the read left in it
+        value, recent = self.history(slave, word, end)
+        values = set()
+        for write_start, write_end, written in recent:
+            if write_end < start:
+                value = written
+            elif write_start <= end:
+                values.add(written)
+        values.add(value)
+        return values
+
+
+def check(path, slack=1024, limit=20):
+    # replay one log against the golden model. Records arrive in the order
+    # they completed, so a read is checked once the log is slack cycles past
+    # it and every write that overlapped it has been seen
+    result = {"log": path, "writes": 0, "reads": 0, "mismatches": 0, "errors": [], "message": ""}
+
+    def mismatch(kind, master, addr, start, end, got, expected):
+        result["mismatches"] += 1
+        if len(result["errors"]) < limit:
+            result["errors"].append(
+                {
+                    "kind": kind,
+                    "master": master,
+                    "addr": f"0x{addr:08x}",
+                    "cycles": [start, end],
+                    "got": got,
+                    "expected": expected,
+                }
+            )
+
+    def settle(pending, memory, now):
+        while pending and (now is None or pending[0][1] < now - slack):
+            start, end, master, addr, data, slave, word = pending.popleft()
+            values = memory.expected(slave, word, start, end)
+            if data not in values:
+                mismatch("read data", master, addr, start, end, f"0x{data:08x}", [f"0x{v:08x}" for v in sorted(values)])
+
+    try:
+        with open(path, "rb") as f:
+            _, _, regions, records = read_log(f)
+            memory = Memory(regions, 2 * slack)
+            pending = deque()
+            for start, end, info, addr, data in records:
+                settle(pending, memory, end)
+                master, resp, strb = info >> 16 & 0xFF, info >> 8 & 0x3, info & 0xF
+                read = bool(info & READ)
+                result["reads" if read else "writes"] += 1
+                slave, word = memory.decode(addr)
+                expect = OKAY if slave is not None else DECERR
+                if resp != expect:
+                    kind = "read resp" if read else "write resp"
+                    mismatch(kind, master, addr, start, end, resp, [expect])
+                if slave is None or resp != OKAY:
+                    continue
+                if read:
+                    pending.append((start, end, master, addr, data, slave, word))
+                else:
+                    memory.write(slave, word, start, end, data, strb)
+            settle(pending, memory, None)
+    except (OSError, ValueError) as e:
+        result["message"] = str(e)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.simulation.scoreboard",
+        usage="%(prog)s LOG [LOG ...] [options]",
+        description="check testbench transaction logs (--txlog) against a golden memory model",
+    )
+    parser.add_argument("logs", nargs="+", help="transaction logs written by the testbench")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="logs checked in parallel (default: cores)")
+    parser.add_argument("--slack", type=int, default=1024, help="cycles a write may overlap a read by (default: 1024)")
+    parser.add_argument("--limit", type=int, default=20, help="mismatches listed per log (default: 20)")
+    parser.add_argument("--report", help="also write every result as JSON")
+    args = parser.parse_args(argv)
+
+    # one process per log at a time, a single log is checked in this one
+    if len(args.logs) == 1 or args.jobs <= 1:
+        results = [check(path, args.slack, args.limit) for path in args.logs]
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(check, args.logs, [args.slack] * len(args.logs), [args.limit] * len(args.logs)))
+
+    failed = 0
+    for result in results:
+        if result["message"]:
+            status = "ERROR"
+        elif result["mismatches"]:
+            status = "FAIL"
+        else:
+            status = "PASS"
+        failed += status != "PASS"
+        print(
+            f"{status:<8}{result['log']}  {result['writes']} writes, {result['reads']} reads, "
+            f"{result['mismatches']} mismatches  {result['message']}"
+        )
+        for error in result["errors"]:
+            print(
+                f"        {error['kind']:<12}m{error['master']} {error['addr']} cycles {error['cycles'][0]}-{error['cycles'][1]}: "
+                f"got {error['got']}, expected {' or '.join(str(value) for value in error['expected'])}"
+            )
+        if result["mismatches"] > len(result["errors"]):
+            print(f"        ... {result['mismatches'] - len(result['errors'])} more")
+
+    if args.report:
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    if len(results) > 1:
+        print(f"\n{len(results) - failed}/{len(results)} logs passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
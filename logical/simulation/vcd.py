@@ -0,0 +1,444 @@
+import os
+import re
+import sys
+import csv
+import json
+import argparse
+import contextlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# the testbench names its port signals after the interconnect's, m0_AWVALID,
+# s1_RDATA, ...
+SIGNAL = re.compile(r"([ms])(\d+)_(AW|W|B|AR|R)(VALID|READY|ADDR|DATA|STRB|RESP)")
+CHANNELS = ("AW", "W", "B", "AR", "R")
+PAYLOAD = {"AW": ("ADDR",), "W": ("DATA", "STRB"), "B": ("RESP",), "AR": ("ADDR",), "R": ("DATA", "RESP")}
+CLOCK = "iCLK"
+
+# latencies are counted in one cycle bins, longer ones share the last bin
+BINS = 4096
+
+COLUMNS = [
+    "port",
+    "kind",
+    "addr",
+    "data",
+    "strb",
+    "resp",
+    "start",
+    "request",
+    "write",
+    "end",
+    "latency",
+    "request_stall",
+    "write_stall",
+    "response_stall",
+]
+
+
+def tokens(f, chunk=1 << 20):
+    # the whitespace separated tokens of a binary stream, read chunk bytes at
+    # a time, so a dump of any size streams through
+    rest = b""
+    while True:
+        data = f.read(chunk)
+        if not data:
+            break
+        data = rest + data
+        parts = data.split()
+        # a token at the end of the chunk may go on in the next one
+        rest = b"" if data[-1:].isspace() or not parts else parts.pop()
+        yield from parts
+    if rest:
+        yield rest
+
+
+def skip(stream):
+    # to the $end closing a section
+    for token in stream:
+        if token == b"$end":
+            return
+
+
+def header(stream):
+    # the timescale and every variable declared, (scope, name, width, code)
+    # with the scope a tuple of module instance names
+    timescale, variables, scope = "", [], []
+    for token in stream:
+        if token == b"$scope":
+            _, name, _ = next(stream), next(stream), next(stream)
+            scope.append(name.decode())
+        elif token == b"$upscope":
+            scope.pop()
+            skip(stream)
+        elif token == b"$var":
+            _, width, code, name = next(stream), next(stream), next(stream), next(stream)
+            variables.append((tuple(scope), name.decode(), int(width), code))
+            skip(stream)
+        elif token == b"$timescale":
+            words = []
+            for word in stream:
+                if word == b"$end":
+                    break
+                words.append(word.decode())
+            timescale = "".join(words)
+        elif token == b"$enddefinitions":
+            skip(stream)
+            return timescale, variables
+        elif token.startswith(b"$"):
+            skip(stream)
+    raise ValueError("not a VCD file, $enddefinitions is missing")
+
+
+def steps(stream, wanted):
+    # (time, changes) for every time step, changes maps the code of each
+    # wanted variable that changed to its value: b"0", b"1", b"x", b"z" or the
+    # bits of a vector
+    time, changes = 0, {}
+    for token in stream:
+        first = token[:1]
+        if first == b"#":
+            if changes:
+                yield time, changes
+                changes = {}
+            time = int(token[1:])
+        elif first in b"01xXzZ":
+            if token[1:] in wanted:
+                changes[token[1:]] = first.lower()
+        elif first in b"bB":
+            code = next(stream, b"")
+            if code in wanted:
+                changes[code] = token[1:].lower()
+        elif first in b"rR":
+            next(stream, b"")
+        elif token == b"$comment":
+            skip(stream)
+        # $dumpvars, $dumpon, $dumpoff, $dumpall and their $end only group
+        # value changes
+    if changes:
+        yield time, changes
+
+
+def number(value):
+    # a dumped value as an integer, None while any bit is x or z
+    if value is None:
+        return None
+    try:
+        return int(value, 2)
+    except ValueError:
+        return None
+
+
+class Histogram:
+    # latencies in cycles, count, sum and worst kept exactly
+
+    def __init__(self, bins=BINS):
+        self.counts = [0] * bins
+        self.n = self.total = self.worst = 0
+
+    def add(self, value):
+        self.counts[min(value, len(self.counts) - 1)] += 1
+        self.n += 1
+        self.total += value
+        self.worst = max(self.worst, value)
+
+    def percentile(self, p):
+        # the smallest latency at or above p percent of the samples
+        rank = max(1, -(-self.n * p // 100))
+        seen = 0
+        for value, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(value, self.worst)
+        return self.worst
+
+    def summary(self):
+        if not self.n:
+            return {"count": 0, "mean": None, "p50": None, "p99": None, "max": None}
+        return {
+            "count": self.n,
+            "mean": round(self.total / self.n, 3),
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.worst,
+        }
+
+
+class Channel:
+    # one VALID/READY channel of a port, sampled on every rising clock edge
+
+    def __init__(self, port, name, valid, ready, payload):
+        self.port = port
+        self.name = name
+        self.valid = valid
+        self.ready = ready
+        self.payload = payload
+        self.handshakes = self.stalls = self.busy = 0
+        # the cycle VALID rose for the transfer not yet taken
+        self.since = None
+
+
+class Port:
+    # the channels of one master or slave port and the transfers waiting for
+    # their response. AXI4-Lite answers in order, so each queue only holds
+    # what is outstanding
+
+    def __init__(self, name):
+        self.name = name
+        self.channels = {}
+        self.pending = {"AW": deque(), "W": deque(), "AR": deque()}
+        self.latency = {"write": Histogram(), "read": Histogram()}
+        self.writes = self.reads = self.unmatched = 0
+
+    def handshake(self, channel, cycle, state):
+        # a transfer taken on this cycle: address and write data wait for
+        # their response, a response completes the oldest transaction
+        values = {field: number(state.get(code)) for field, code in channel.payload.items()}
+        transfer = (channel.since, cycle, values)
+        if channel.name in self.pending:
+            self.pending[channel.name].append(transfer)
+            return None
+        if channel.name == "B":
+            if not self.pending["AW"] or not self.pending["W"]:
+                self.unmatched += 1
+                return None
+            request, write = self.pending["AW"].popleft(), self.pending["W"].popleft()
+            kind, start = "write", min(request[0], write[0])
+            self.writes += 1
+        else:
+            if not self.pending["AR"]:
+                self.unmatched += 1
+                return None
+            request, write = self.pending["AR"].popleft(), None
+            kind, start = "read", request[0]
+            self.reads += 1
+        self.latency[kind].add(cycle - start)
+        data = write[2].get("DATA") if write else values.get("DATA")
+        return {
+            "port": self.name,
+            "kind": kind,
+            "addr": request[2].get("ADDR"),
+            "data": data,
+            "strb": write[2].get("STRB") if write else None,
+            "resp": values.get("RESP"),
+            "start": start,
+            "request": request[1],
+            "write": write[1] if write else None,
+            "end": cycle,
+            "latency": cycle - start,
+            "request_stall": request[1] - request[0],
+            "write_stall": write[1] - write[0] if write else None,
+            "response_stall": cycle - channel.since,
+        }
+
+    def summary(self, cycles):
+        done = self.writes + self.reads
+        return {
+            "writes": self.writes,
+            "reads": self.reads,
+            "per_cycle": round(done / cycles, 4) if cycles else None,
+            "write_latency": self.latency["write"].summary(),
+            "read_latency": self.latency["read"].summary(),
+            "unmatched": self.unmatched,
+            "outstanding": {name: len(queue) for name, queue in self.pending.items()},
+            "channels": {
+                name: {"handshakes": channel.handshakes, "stalls": channel.stalls, "busy": channel.busy}
+                for name, channel in self.channels.items()
+            },
+        }
+
+
+def ports(variables, scope=None, clock=CLOCK):
+    # the scope holding the port signals, the code of its clock and its ports
+    # in order, masters first. Without a scope the shallowest one naming port
+    # signals is taken, the testbench top rather than the interconnect inside
+    found = {}
+    for where, name, _, code in variables:
+        match = SIGNAL.fullmatch(name)
+        if match:
+            found.setdefault(where, {})[match.groups()] = code
+    if scope is not None:
+        chosen = tuple(scope.split("."))
+        if chosen not in found:
+            raise ValueError(f"scope '{scope}' has no port signals")
+    elif found:
+        chosen = min(found, key=lambda where: (len(where), where))
+    else:
+        raise ValueError("no port signals (m0_AWVALID, s0_RDATA, ...) in the dump")
+
+    clocks = [code for where, name, _, code in variables if where == chosen and name == clock]
+    if not clocks:
+        raise ValueError(f"no clock '{clock}' in scope {'.'.join(chosen)}")
+
+    signals = found[chosen]
+    result = []
+    for role in "ms":
+        indices = sorted({int(index) for kind, index, _, _ in signals if kind == role})
+        for index in indices:
+            port = Port(f"{role}{index}")
+            for name in CHANNELS:
+                key = (role, str(index), name)
+                valid, ready = signals.get(key + ("VALID",)), signals.get(key + ("READY",))
+                if valid is None or ready is None:
+                    continue
+                payload = {field: signals[key + (field,)] for field in PAYLOAD[name] if key + (field,) in signals}
+                port.channels[name] = Channel(port, name, valid, ready, payload)
+            if port.channels:
+                result.append(port)
+    return ".".join(chosen), clocks[0], result
+
+
+def source(path, stack):
+    # the timescale, variables and a steps function of a VCD dump, or of a
+    # store logical.simulation.wavestore converted one to, which reads only
+    # the columns of the wanted variables instead of the whole dump
+    if os.path.isdir(path):
+        from .wavestore import Store
+
+        store = Store(path)
+        return store.timescale, store.variables(), store.steps
+    stream = tokens(stack.enter_context(open(path, "rb")))
+    timescale, variables = header(stream)
+    return timescale, variables, lambda wanted: steps(stream, wanted)
+
+
+def transactions(path, scope=None, clock=CLOCK, summary=None):
+    # every completed transaction of a dump, in the order they completed.
+    # Signals are sampled as they were just before each rising clock edge,
+    # the values the design saw, whatever the edge then changed. summary, a
+    # dict, is filled in as the dump is read
+    summary = {} if summary is None else summary
+    with contextlib.ExitStack() as stack:
+        timescale, variables, changed = source(path, stack)
+        summary["timescale"] = timescale
+        summary["scope"], clk, found = ports(variables, scope, clock)
+        summary["ports"] = found
+
+        # the channels of each VALID code and those with VALID high
+        valids = {}
+        for port in found:
+            for channel in port.channels.values():
+                valids.setdefault(channel.valid, []).append(channel)
+        wanted = {clk} | set(valids)
+        wanted |= {channel.ready for port in found for channel in port.channels.values()}
+        wanted |= {code for port in found for channel in port.channels.values() for code in channel.payload.values()}
+
+        state, high, cycle = {}, {}, 0
+        summary["first"] = summary["last"] = None
+        for time, changes in changed(wanted):
+            if changes.get(clk) == b"1" and state.get(clk, b"1") != b"1":
+                cycle += 1
+                for channel in list(high):
+                    channel.busy += 1
+                    if channel.since is None:
+                        channel.since = cycle
+                    if state.get(channel.ready) != b"1":
+                        channel.stalls += 1
+                        continue
+                    channel.handshakes += 1
+                    row = channel.port.handshake(channel, cycle, state)
+                    channel.since = None
+                    if row is not None:
+                        yield row
+                if summary["first"] is None:
+                    summary["first"] = time
+                summary["last"] = time
+                summary["cycles"] = cycle
+            state.update(changes)
+            for code, value in changes.items():
+                for channel in valids.get(code, ()):
+                    if value == b"1":
+                        high[channel] = True
+                    elif high.pop(channel, None):
+                        # VALID dropped without a handshake
+                        channel.since = None
+        summary["cycles"] = cycle
+
+
+def analyze(path, scope=None, clock=CLOCK, table=None):
+    # the summary of one dump, its transaction table written as CSV to table
+    result = {"vcd": path, "scope": None, "timescale": "", "cycles": 0, "ports": {}, "message": ""}
+    try:
+        summary = {}
+        with open(table, "w", newline="") if table else contextlib.nullcontext() as out:
+            writer = csv.DictWriter(out, COLUMNS) if out else None
+            if writer:
+                writer.writeheader()
+            for row in transactions(path, scope, clock, summary):
+                if writer:
+                    for field in ("addr", "data"):
+                        if row[field] is not None:
+                            row[field] = f"0x{row[field]:08x}"
+                    writer.writerow(row)
+        cycles = summary["cycles"]
+        result["scope"], result["timescale"], result["cycles"] = summary["scope"], summary["timescale"], cycles
+        result["time"] = [summary["first"], summary["last"]]
+        result["ports"] = {port.name: port.summary(cycles) for port in summary["ports"]}
+        masters = [port for port in summary["ports"] if port.name.startswith("m")]
+        done = sum(port.writes + port.reads for port in masters)
+        result["per_cycle"] = round(done / cycles, 4) if cycles else None
+    except (OSError, ValueError, StopIteration) as e:
+        result["message"] = str(e) or "the dump ends part way through a declaration"
+    return result
+
+
+def latency(summary):
+    if not summary["count"]:
+        return "-"
+    return f"mean {summary['mean']:.1f} p50 {summary['p50']} p99 {summary['p99']} max {summary['max']}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.simulation.vcd",
+        usage="%(prog)s DUMP [DUMP ...] [options]",
+        description="rebuild the AXI transactions of testbench VCD dumps: stalls, throughput and latency per port",
+    )
+    parser.add_argument(
+        "dumps", nargs="+", help="VCD files written by the testbenches, or .waves stores converted from them"
+    )
+    parser.add_argument("--scope", help="dotted scope of the port signals (default: the shallowest naming them)")
+    parser.add_argument("--clock", default=CLOCK, help=f"clock in that scope (default: {CLOCK})")
+    parser.add_argument("--table", action="store_true", help="also write each dump's transactions next to it as .csv")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="dumps read in parallel (default: cores)")
+    parser.add_argument("--report", help="also write every summary as JSON")
+    args = parser.parse_args(argv)
+
+    tables = [f"{os.path.splitext(os.path.normpath(path))[0]}.csv" if args.table else None for path in args.dumps]
+    count = len(args.dumps)
+    if count == 1 or args.jobs <= 1:
+        results = [analyze(path, args.scope, args.clock, table) for path, table in zip(args.dumps, tables)]
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(analyze, args.dumps, [args.scope] * count, [args.clock] * count, tables))
+
+    failed = 0
+    for result in results:
+        if result["message"]:
+            failed += 1
+            print(f"ERROR   {result['vcd']}  {result['message']}")
+            continue
+        per_cycle = "-" if result["per_cycle"] is None else f"{result['per_cycle']:.4f}"
+        print(f"{result['vcd']}  {result['scope']}, {result['cycles']} cycles, {per_cycle} transactions per cycle")
+        for name, port in result["ports"].items():
+            rate = "-" if port["per_cycle"] is None else f"{port['per_cycle']:.4f}"
+            print(
+                f"  {name:<5}{port['writes']:>8} writes{port['reads']:>8} reads  {rate} per cycle  "
+                f"write latency {latency(port['write_latency'])}  read latency {latency(port['read_latency'])}"
+            )
+            stalls = "  ".join(f"{channel} {stats['stalls']}/{stats['busy']}" for channel, stats in port["channels"].items())
+            print(f"       stalled/valid cycles  {stalls}")
+            if port["unmatched"]:
+                print(f"       {port['unmatched']} responses without a request")
+
+    if args.report:
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
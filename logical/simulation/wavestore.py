@@ -0,0 +1,334 @@
+import os
+import sys
+import json
+import heapq
+import mmap
+import array
+import bisect
+import argparse
+
+from .vcd import tokens, header, steps, number
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# a store is a directory: index.json and, per dumped variable, its change
+# times, values and x/z flags as flat native arrays, read memory mapped. A
+# one bit variable also keeps the times it rose and fell, so edges are found
+# and counted by binary search too
+VERSION = 2
+INDEX = "index.json"
+KINDS = ("t", "v", "x", "r", "f")
+TYPECODES = {"t": "Q", "v": "Q", "x": "B", "r": "Q", "f": "Q"}
+# changes buffered before they are appended to the column files
+BUFFER = 1 << 20
+# values searched at a time for a change of a vector to a given value
+CHUNK = 1 << 16
+
+
+def column_file(path, column, kind):
+    return os.path.join(path, f"{column}.{kind}")
+
+
+def convert(source, path):
+    # one pass over the dump, each variable's changes appended to its own
+    # columns, so memory stays bounded by BUFFER whatever the dump's length.
+    # Variables wider than 64 bits are left out
+    os.makedirs(path, exist_ok=True)
+    with open(source, "rb") as f:
+        stream = tokens(f)
+        timescale, variables = header(stream)
+
+        # variables sharing a code, the same net seen from several scopes,
+        # share a column
+        columns, widths, signals, skipped = {}, [], [], []
+        for scope, name, width, code in variables:
+            full = ".".join(scope + (name,))
+            if width > 64:
+                skipped.append(full)
+                continue
+            if code not in columns:
+                columns[code] = len(columns)
+                widths.append(width)
+            signals.append({"name": full, "width": width, "column": columns[code]})
+
+        # per column and kind, edges only for one bit columns
+        kinds = [KINDS if width == 1 else KINDS[:3] for width in widths]
+        buffers = [{kind: array.array(TYPECODES[kind]) for kind in column_kinds} for column_kinds in kinds]
+        counts = [{kind: 0 for kind in column_kinds} for column_kinds in kinds]
+        for column, column_kinds in enumerate(kinds):
+            for kind in column_kinds:
+                open(column_file(path, column, kind), "wb").close()
+
+        def flush():
+            for column, buffer in enumerate(buffers):
+                for kind, values in buffer.items():
+                    if not values:
+                        continue
+                    with open(column_file(path, column, kind), "ab") as out:
+                        values.tofile(out)
+                    counts[column][kind] += len(values)
+                    del values[:]
+
+        buffered, end = 0, 0
+        for time, changes in steps(stream, columns):
+            end = time
+            for code, value in changes.items():
+                column = columns[code]
+                known = number(value)
+                buffer = buffers[column]
+                buffer["t"].append(time)
+                buffer["v"].append(known or 0)
+                buffer["x"].append(known is None)
+                if "r" in buffer and known is not None:
+                    buffer["r" if known else "f"].append(time)
+            buffered += len(changes)
+            if buffered >= BUFFER:
+                flush()
+                buffered = 0
+        flush()
+
+    index = {
+        "version": VERSION,
+        "source": source,
+        "timescale": timescale,
+        "end": end,
+        "signals": signals,
+        "counts": counts,
+        "skipped": skipped,
+    }
+    with open(os.path.join(path, INDEX), "w") as f:
+        json.dump(index, f, indent=2)
+        f.write("\n")
+    return index
+
+
+def mapped(filename, typecode, count):
+    # a column memory mapped, as a NumPy array when NumPy is installed and
+    # otherwise as a memoryview, which bisect searches just the same
+    if count == 0:
+        return numpy.zeros(0, dtype=typecode) if numpy is not None else memoryview(array.array(typecode))
+    if numpy is not None:
+        return numpy.memmap(filename, dtype=numpy.dtype(typecode), mode="r", shape=(count,))
+    with open(filename, "rb") as f:
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast(typecode)
+
+
+def search(times, time, right=True):
+    # how many of the ascending times are at or before time, or before it
+    # when not right
+    if numpy is not None:
+        return int(numpy.searchsorted(times, time, side="right" if right else "left"))
+    return (bisect.bisect_right if right else bisect.bisect_left)(times, time)
+
+
+class Signal:
+    # the changes of one variable: times ascending, the value from each on and
+    # whether that value had x or z bits. A one bit signal also has the times
+    # it changed to 1 and to 0 in edges
+
+    def __init__(self, name, width, times, values, unknown, edges=None):
+        self.name = name
+        self.width = width
+        self.times = times
+        self.values = values
+        self.unknown = unknown
+        self.edges = edges
+
+    def __len__(self):
+        return len(self.times)
+
+    def index(self, time):
+        # the last change at or before time, -1 before the first
+        return search(self.times, time) - 1
+
+    def value(self, i):
+        return None if self.unknown[i] else int(self.values[i])
+
+    def at(self, time):
+        # the value at time, None before the first change or while x or z
+        i = self.index(time)
+        return None if i < 0 else self.value(i)
+
+    def next(self, time, value=None):
+        # the time of the first change after time, to value when given, None
+        # when there is none. Edges are searched, a vector is scanned from
+        # time for its value
+        if value is None:
+            i = self.index(time) + 1
+            return int(self.times[i]) if i < len(self) else None
+        if self.edges is not None:
+            edges = self.edges.get(value)
+            if edges is None:
+                return None
+            i = search(edges, time)
+            return int(edges[i]) if i < len(edges) else None
+        i = self.index(time) + 1
+        while i < len(self):
+            if numpy is not None:
+                hits = numpy.flatnonzero((self.values[i : i + CHUNK] == value) & (self.unknown[i : i + CHUNK] == 0))
+                if len(hits):
+                    return int(self.times[i + hits[0]])
+                i += CHUNK
+            else:
+                if self.values[i] == value and not self.unknown[i]:
+                    return int(self.times[i])
+                i += 1
+        return None
+
+    def changes(self, start, end):
+        # (time, value) of every change from start to end, inclusive
+        first, last = search(self.times, start, right=False), search(self.times, end)
+        return [(int(self.times[i]), self.value(i)) for i in range(first, last)]
+
+    def count(self, value, start=0, end=None):
+        # how many times the signal changed to value from start to end,
+        # inclusive. Edges are counted by two searches, a vector is scanned
+        if self.edges is not None:
+            edges = self.edges.get(value)
+            if edges is None:
+                return 0
+            last = len(edges) if end is None else search(edges, end)
+            return max(0, last - search(edges, start, right=False))
+        first = search(self.times, start, right=False)
+        last = len(self) if end is None else search(self.times, end)
+        if numpy is not None:
+            return int(numpy.count_nonzero((self.values[first:last] == value) & (self.unknown[first:last] == 0)))
+        return sum(1 for i in range(first, last) if self.values[i] == value and not self.unknown[i])
+
+
+class Store:
+    # a converted dump: its signals by dotted name, a bare name such as
+    # s1_BVALID finds the shallowest variable of that name
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, INDEX)) as f:
+            self.index = json.load(f)
+        if self.index.get("version") != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} wave store, convert the dump again")
+        self.timescale = self.index["timescale"]
+        self.end = self.index["end"]
+        self.names = {entry["name"]: entry for entry in self.index["signals"]}
+        self.widths = {entry["column"]: entry["width"] for entry in self.index["signals"]}
+
+    def find(self, name):
+        if name in self.names:
+            return self.names[name]
+        matches = [full for full in self.names if full.rsplit(".", 1)[-1] == name]
+        if not matches:
+            raise ValueError(f"no signal '{name}' in {self.path}")
+        return self.names[min(matches, key=lambda full: (full.count("."), full))]
+
+    def column(self, column, kind):
+        count = self.index["counts"][column][kind]
+        return mapped(column_file(self.path, column, kind), TYPECODES[kind], count)
+
+    def signal(self, name):
+        entry = self.find(name)
+        column = entry["column"]
+        edges = None
+        if "r" in self.index["counts"][column]:
+            edges = {1: self.column(column, "r"), 0: self.column(column, "f")}
+        return Signal(
+            entry["name"],
+            entry["width"],
+            self.column(column, "t"),
+            self.column(column, "v"),
+            self.column(column, "x"),
+            edges,
+        )
+
+    def cycle(self, time, clock="iCLK"):
+        # rising clock edges up to and including time
+        return self.signal(clock).count(1, 0, time)
+
+    def time(self, cycle, clock="iCLK"):
+        # the time of a rising clock edge, the first is cycle 1
+        rises = self.signal(clock).edges[1]
+        return int(rises[cycle - 1]) if 0 < cycle <= len(rises) else None
+
+    def variables(self):
+        # (scope, name, width, column) of every signal, as
+        # logical.simulation.vcd.header lists the variables of a dump
+        result = []
+        for entry in self.index["signals"]:
+            *scope, name = entry["name"].split(".")
+            result.append((tuple(scope), name, entry["width"], entry["column"]))
+        return result
+
+    def steps(self, wanted):
+        # (time, changes) over the wanted columns in time order, changes in
+        # the form logical.simulation.vcd.steps reads them from a dump
+
+        def changes(column):
+            times, values, unknown = (self.column(column, kind) for kind in KINDS[:3])
+            width = self.widths[column]
+            for start in range(0, len(times), CHUNK):
+                chunk = slice(start, start + CHUNK)
+                for time, value, x in zip(times[chunk].tolist(), values[chunk].tolist(), unknown[chunk].tolist()):
+                    yield time, column, b"x" if x else format(value, "b").zfill(width).encode()
+
+        time, batch = None, {}
+        for when, column, value in heapq.merge(*(changes(column) for column in sorted(wanted))):
+            if when != time and batch:
+                yield time, batch
+                batch = {}
+            time = when
+            batch[column] = value
+        if batch:
+            yield time, batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m logical.simulation.wavestore",
+        usage="%(prog)s DUMP.vcd [-o STORE] | STORE --signal NAME [--at T | --next T [--value V] | --changes T T | --cycle T]",
+        description="convert a VCD dump to memory mapped per-signal columns and query them by binary search, "
+        "one bit signals by their edges (a vector's --value is scanned for)",
+    )
+    parser.add_argument("source", help="a VCD dump to convert or a store to query")
+    parser.add_argument("-o", dest="output", help="store directory (default: the dump's name with .waves)")
+    parser.add_argument("--signal", help="dotted or bare signal name, e.g. s1_BVALID")
+    parser.add_argument("--at", type=int, metavar="T", help="the value at time T")
+    parser.add_argument("--next", type=int, metavar="T", help="the first change after time T")
+    parser.add_argument("--value", type=lambda text: int(text, 0), help="with --next, the first change to this value")
+    parser.add_argument("--changes", type=int, nargs=2, metavar="T", help="every change between two times")
+    parser.add_argument("--cycle", type=int, metavar="T", help="rising edges of --signal (default: iCLK) up to time T")
+    args = parser.parse_args(argv)
+
+    try:
+        if not os.path.isdir(args.source):
+            output = args.output or f"{os.path.splitext(args.source)[0]}.waves"
+            index = convert(args.source, output)
+            changes = sum(count["t"] for count in index["counts"])
+            print(f"Converted: {output}, {len(index['signals'])} signals, {changes} changes to time {index['end']}")
+            return
+        store = Store(args.source)
+        if args.cycle is not None:
+            print(store.cycle(args.cycle, args.signal or "iCLK"))
+            return
+        if args.signal is None:
+            for name, entry in store.names.items():
+                print(f"{name}  [{entry['width']}]  {store.index['counts'][entry['column']]['t']} changes")
+            return
+        signal = store.signal(args.signal)
+        if args.at is not None:
+            print(signal.at(args.at))
+        elif args.next is not None:
+            print(signal.next(args.next, args.value))
+        elif args.changes is not None:
+            for time, value in signal.changes(*args.changes):
+                print(f"{time} {value}")
+        else:
+            print(f"{signal.name}  [{signal.width}]  {len(signal)} changes")
+    except (OSError, ValueError, StopIteration) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()